@@ -1,283 +1,268 @@
-import uuid
-import random
+import os
 import tkinter as tk
 from tkinter import messagebox, Toplevel, Label, Button, Entry, Listbox, StringVar, OptionMenu, Frame
+import tkinter.filedialog as filedialog
 import tkinter.simpledialog as simpledialog
-from cassandra.cluster import Cluster
+
+import leaderboard
+import services
+from catalog import TournamentCatalog
+from database import Database
+from metrics import Metrics, PeriodicDump
+from names import NameGenerator
+from ratings import DEFAULT_RATING
+from tasks import TaskRunner
 
 # ----------------------------------------------------------------
-# Conexão com o Cassandra (local)
+# Métricas (metrics.py): latência por consulta, por chamada ao repositório e por fase da simulação
 # ----------------------------------------------------------------
-cluster = Cluster(['127.0.0.1'])
-session = cluster.connect()
+METRICS_FILE = os.environ.get("GAME_MANAGER_METRICS_FILE")  # JSON gravado periodicamente, se definido
+METRICS_DUMP_INTERVAL = 30  # segundos entre gravações do JSON
+METRICS_REFRESH_MS = 1000  # atualização da janela de métricas
+TRACE_SAMPLE_RATE = float(os.environ.get("GAME_MANAGER_TRACE_RATE", "0"))  # fração das consultas com tracing
+
+metrics = Metrics(trace_rate=TRACE_SAMPLE_RATE)
 
 # ----------------------------------------------------------------
-# Criação do keyspace e tabelas, se não existirem
+# Conexão com o Cassandra, aberta só no primeiro acesso a db.repo (database.py): nós, perfis
+# de execução e compressão vêm de game_manager.ini / GAME_MANAGER_* (config.py, padrão: local);
+# aplica as migrações de schema pendentes (migrations.py) e monta o repositório medido
 # ----------------------------------------------------------------
-session.execute("""
-    CREATE KEYSPACE IF NOT EXISTS game_manager 
-    WITH replication = {'class': 'SimpleStrategy', 'replication_factor': '1'}
-""")
-session.set_keyspace('game_manager')
-
-session.execute("""
-    CREATE TABLE IF NOT EXISTS tournaments (
-        id text PRIMARY KEY,
-        name text,
-        simulated boolean
-    )
-""")
-
-session.execute("""
-    CREATE TABLE IF NOT EXISTS teams (
-        id text PRIMARY KEY,
-        name text,
-        in_match boolean,
-        tournament_id text
-    )
-""")
-
-session.execute("""
-    CREATE TABLE IF NOT EXISTS game_matches (
-        id text PRIMARY KEY,
-        title text,
-        description text,
-        status text,
-        teams list<text>
-    )
-""")
+db = Database(metrics=metrics)
 
 # ----------------------------------------------------------------
 # FUNÇÕES PARA TORNEIOS
 # ----------------------------------------------------------------
 def create_tournament(tournament_name):
     """Cria um torneio com simulated = False."""
-    try:
-        t_id = str(uuid.uuid4())
-        query = "INSERT INTO tournaments (id, name, simulated) VALUES (%s, %s, %s)"
-        session.execute(query, (t_id, tournament_name, False))
-        return t_id
-    except Exception as e:
-        messagebox.showerror("Erro", f"Erro ao criar torneio: {e}")
-        return None
+    t_id = db.repo.create_tournament(tournament_name)
+    tournament_catalog.add(t_id, tournament_name)
+    return t_id
 
 def read_tournaments():
     """Retorna uma lista de torneios cadastrados."""
-    rows = session.execute("SELECT id, name FROM tournaments")
-    return [(row.id, row.name) for row in rows]
+    return db.repo.list_tournaments()
 
 def read_tournament(t_id):
     """Retorna os detalhes de um torneio."""
-    query = "SELECT id, name, simulated FROM tournaments WHERE id = %s"
-    return session.execute(query, (t_id,)).one()
+    return db.repo.get_tournament(t_id)
+
+# Catálogo em memória: fonte única do menu e da resolução nome -> id
+tournament_catalog = TournamentCatalog(read_tournaments)
+
+def resolve_tournament_id(tournament_name):
+    """Retorna o id do torneio com o nome informado (ValueError se não existir)."""
+    t_id = tournament_catalog.id_for(tournament_name)
+    if not t_id:
+        raise ValueError("Torneio inválido!")
+    return t_id
 
 # ----------------------------------------------------------------
 # FUNÇÕES PARA TIMES
 # ----------------------------------------------------------------
 def create_team(team_name, tournament_id):
     """Cria um time vinculado a um torneio."""
-    try:
-        team_id = str(uuid.uuid4())
-        query = """
-            INSERT INTO teams (id, name, in_match, tournament_id)
-            VALUES (%s, %s, %s, %s)
-        """
-        session.execute(query, (team_id, team_name, False, tournament_id))
-        return team_id
-    except Exception as e:
-        messagebox.showerror("Erro", f"Erro ao criar time: {e}")
-        return None
+    return db.repo.create_team(team_name, tournament_id)
+
+def create_teams(team_names, tournament_id):
+    """
+    Cria vários times de uma vez (inserções concorrentes).
+    Retorna (criados, falhas) como em bulk.create_teams_bulk.
+    """
+    return db.repo.create_teams(team_names, tournament_id)
 
 def read_teams():
     """Retorna todos os times cadastrados."""
-    rows = session.execute("SELECT id, name FROM teams")
-    return [(row.id, row.name) for row in rows]
+    return db.repo.list_teams()
 
 def read_teams_by_tournament(tournament_id):
     """Retorna os times pertencentes a um torneio específico."""
-    query = "SELECT id, name FROM teams WHERE tournament_id = %s ALLOW FILTERING"
-    rows = session.execute(query, (tournament_id,))
-    return [(row.id, row.name) for row in rows]
+    return db.repo.list_teams_by_tournament(tournament_id)
+
+def read_ratings(tournament_id):
+    """Retorna {team_id: rating} dos times do torneio (times sem rating ficam de fora)."""
+    return db.repo.get_ratings(tournament_id)
+
+def write_ratings(tournament_id, ratings):
+    """Grava pares (team_id, rating) do torneio."""
+    db.repo.save_ratings(tournament_id, ratings)
+
+def record_match_result(tournament_id, winner_id, loser_id):
+    """Registra o resultado de um jogo avulso e atualiza os ratings dos dois times."""
+    return services.record_match_result(db.repo, tournament_id, winner_id, loser_id)
+
+# Gerador de nomes: espaço combinatório sorteado por índice (names.py)
+team_name_generator = NameGenerator()
 
 def generate_ai_team_names(num_names, tournament_id):
     """
-    Gera nomes para times utilizando uma combinação mais extensa de adjetivos e substantivos,
-    criando variações que ajudam a evitar repetições e nomes genéricos.
+    Gera nomes para times combinando adjetivos, substantivos e padrões (e numeração,
+    se preciso), sem repetir nomes já usados no torneio.
     """
-    adjectives = ["Cyber", "Quantum", "Digital", "Neo", "Synth", "Virtual", "AI", "Alpha", "Nova", "Cosmic", "Galactic", "Pixel", "Binary", "Electro", "Fusion", "Radical", "Mystic", "Vortex", "Epic", "Prime", "Legendary", "Infinite"]
-    nouns = ["Knights", "Titans", "Gladiators", "Rangers", "Warriors", "Dynamos", "Phantoms", "Legends", "Storm", "Dragons", "Vikings", "Pirates", "Samurais", "Renegades", "Nomads", "Outlaws", "Saviors", "Defenders", "Champions", "Conquerors", "Invincibles"]
-    possible_names = set()
-    for adj in adjectives:
-        for noun in nouns:
-            possible_names.add(f"{adj} {noun}")
-            possible_names.add(f"{adj} {noun} FC")
-            possible_names.add(f"{noun} of {adj}")
-    # Remover os nomes já existentes no torneio
-    existing = set([name for _, name in read_teams_by_tournament(tournament_id)])
-    valid_names = list(possible_names - existing)
-    if len(valid_names) < num_names:
-        messagebox.showwarning("Aviso", "Poucas opções disponíveis para nomes únicos. Considere resetar os times.")
-        return []
-    return random.sample(valid_names, num_names)
-
-def generate_random_teams(tournament_id):
+    return services.generate_team_names(db.repo, team_name_generator, num_names, tournament_id)
+
+def generate_random_teams(num_teams, tournament_id):
     """
-    Gera uma quantidade definida de times aleatórios com nomes gerados "inteligentemente".
-    Pergunta ao usuário quantos times deseja criar.
+    Gera `num_teams` times aleatórios com nomes gerados "inteligentemente".
+    Retorna (criados, falhas) como em create_teams.
     """
-    num_teams_to_generate = simpledialog.askinteger("Gerar Times", "Quantos times deseja gerar?", minvalue=2)
-    if not num_teams_to_generate:
-        return
-    names = generate_ai_team_names(num_teams_to_generate, tournament_id)
-    if not names:
-        return
-    for name in names:
-        create_team(name, tournament_id)
-    messagebox.showinfo("Sucesso", f"{num_teams_to_generate} times aleatórios foram adicionados ao torneio!")
+    return services.generate_random_teams(db.repo, team_name_generator, num_teams, tournament_id)
 
 # ----------------------------------------------------------------
 # FUNÇÕES PARA PARTIDAS (game_matches)
 # ----------------------------------------------------------------
-def create_match(title, description):
-    """Cria um registro de partida."""
-    try:
-        match_id = str(uuid.uuid4())
-        query = """
-            INSERT INTO game_matches (id, title, description, status, teams)
-            VALUES (%s, %s, %s, %s, %s)
-        """
-        session.execute(query, (match_id, title, description, "Aguardando", []))
-        return match_id
-    except Exception as e:
-        messagebox.showerror("Erro", f"Erro ao criar partida: {e}")
-        return None
+MATCH_PAGE_SIZE = 50
+MATCH_STATUSES = ["Todos", "Aguardando", "Terminado"]
+
+def create_match(title, description, tournament_id=None):
+    """Cria um registro de partida (vinculado ao torneio, se informado)."""
+    return db.repo.create_match(title, description, tournament_id)
 
 def read_matches():
     """Retorna todos os registros de partidas."""
-    rows = session.execute("SELECT id, title, description, status, teams FROM game_matches")
-    return [(row.id, row.title, row.description, row.status, row.teams) for row in rows]
-
-def add_team_to_match(match_id, team_id):
-    """Adiciona um time a uma partida (se estiver 'Aguardando')."""
-    match_query = "SELECT status, teams FROM game_matches WHERE id = %s"
-    team_query = "SELECT name, in_match FROM teams WHERE id = %s"
-    match_row = session.execute(match_query, (match_id,)).one()
-    team_row = session.execute(team_query, (team_id,)).one()
-    
-    if match_row and team_row and match_row.status == "Aguardando" and not team_row.in_match:
-        update_match = "UPDATE game_matches SET teams = teams + [%s] WHERE id = %s"
-        session.execute(update_match, (team_row.name, match_id))
-        update_team = "UPDATE teams SET in_match = %s WHERE id = %s"
-        session.execute(update_team, (True, team_id))
-        return True
-    return False
+    return db.repo.list_matches()
+
+def read_matches_page(status=None, paging_state=None, page_size=MATCH_PAGE_SIZE):
+    """
+    Retorna uma página de partidas (opcionalmente filtradas por status) e o
+    paging_state da próxima página (None quando não há mais páginas).
+    """
+    return db.repo.list_matches_page(status, paging_state, page_size)
+
+def read_match(match_id):
+    """Retorna os detalhes de uma partida."""
+    return db.repo.get_match(match_id)
+
+def read_round_games(simulation_id, round_number, paging_state=None, page_size=MATCH_PAGE_SIZE):
+    """
+    Retorna uma página de jogos de uma rodada da simulação e o paging_state da próxima
+    página (None quando a rodada acabou).
+    """
+    return db.repo.list_round_games(simulation_id, round_number, paging_state, page_size)
+
+def delete_match(match_id):
+    """Remove o registro de uma partida."""
+    db.repo.delete_match(match_id)
+
+def add_team_to_match(match_id, team_id, team_name):
+    """
+    Adiciona um time a uma partida (se estiver 'Aguardando' e o time estiver livre).
+    Usa escritas condicionais (assignment.py); `team_name` é o nome já exibido na
+    lista de times, gravado sem uma leitura extra do time.
+    """
+    return db.repo.assign_team(match_id, team_id, team_name)
+
+def add_teams_to_match(match_id, teams):
+    """Adiciona vários times (pares (team_id, nome)) a uma partida; retorna os ids inscritos."""
+    return db.repo.assign_teams(match_id, teams)
 
 # ----------------------------------------------------------------
 # FUNÇÃO DE SIMULAÇÃO DE TORNEIO (SIMULAÇÃO DINÂMICA)
 # ----------------------------------------------------------------
-def simulate_tournament_dynamic(tournament_id):
+MONTE_CARLO_REPLICATES = 10000
+MONTE_CARLO_POSITIONS = 3  # colocações exibidas na janela de probabilidades
+RANKING_PREVIEW = 10  # colocações exibidas acima do log na janela de simulação
+
+def simulate_tournament_dynamic(tournament_id, simulation_id=None, on_log=None):
+    """Simula um torneio knockout decidido por ratings Elo (services.simulate_tournament)."""
+    return services.simulate_tournament(db.repo, tournament_id, simulation_id, on_log, metrics)
+
+def estimate_tournament_odds(tournament_id, replicates, positions=MONTE_CARLO_POSITIONS):
+    """
+    Executa `replicates` simulações do torneio em memória (modo Monte Carlo) sem gravar nada.
+    Retorna (nomes, resultado) — resultado é um montecarlo.MonteCarloResult indexado como `nomes`.
+    """
+    return services.estimate_tournament_odds(db.repo, tournament_id, replicates, positions)
+
+def run_tournament_simulation(t_id, tournament_name, on_log=None, tournament_format=services.KNOCKOUT):
     """
-    Simula um torneio knockout para qualquer quantidade de times (mínimo 2) e gera um ranking final.
-    Em cada rodada, se houver número ímpar, um time recebe bye.
-    Cada partida é simulada aleatoriamente e é registrado em qual rodada o time foi eliminado.
-    O ranking final é determinado com base na rodada alcançada (quanto mais avançado, melhor a posição).
+    Simula o torneio no formato escolhido (mata-mata, pontos corridos ou suíço) e grava o
+    resultado (partida, jogos por rodada e flag simulated).
+    Retorna (linhas do ranking, log). Executada fora do thread da interface.
     """
-    teams_list = read_teams_by_tournament(tournament_id)
-    num_teams = len(teams_list)
-    if num_teams < 2:
-        return None, "O torneio deve ter pelo menos 2 times para simulação."
-    
-    teams = [name for _, name in teams_list]
-    random.shuffle(teams)
-    round_logs = []
-    elimination_round = {}  # Guarda a rodada em que cada time foi eliminado
-    current_round = 1
-    current_competitors = teams.copy()
-    
-    while len(current_competitors) > 1:
-        round_logs.append(f"Rodada {current_round}: {current_competitors}")
-        next_round_competitors = []
-        
-        # Se número ímpar, escolhe um time para bye
-        if len(current_competitors) % 2 == 1:
-            bye_team = random.choice(current_competitors)
-            next_round_competitors.append(bye_team)
-            current_competitors.remove(bye_team)
-            round_logs.append(f"Equipe com bye: {bye_team}")
-        
-        # Simula partidas em duplas
-        for i in range(0, len(current_competitors), 2):
-            team1 = current_competitors[i]
-            team2 = current_competitors[i+1]
-            winner = random.choice([team1, team2])
-            loser = team2 if winner == team1 else team1
-            next_round_competitors.append(winner)
-            elimination_round[loser] = current_round
-            round_logs.append(f"Jogo: {team1} vs {team2} -> Vencedor: {winner}")
-        
-        current_competitors = next_round_competitors
-        current_round += 1
-    
-    champion = current_competitors[0]
-    elimination_round[champion] = current_round
-    # Ordena os times: quem sobreviveu mais rodadas fica melhor posicionado
-    ranking_order = sorted(elimination_round.items(), key=lambda x: (-x[1], random.random()))
-    ranking = [(f"{i+1}º Lugar", team) for i, (team, rnd) in enumerate(ranking_order)]
-    round_logs.append("Ranking Final:")
-    for pos, team in ranking:
-        round_logs.append(f"{pos}: {team}")
-    
-    return ranking, "\n".join(round_logs)
+    return services.run_tournament_simulation(db.repo, t_id, tournament_name, on_log, metrics, tournament_format)
+
+LEADERBOARD_TOP = 20  # posições exibidas na janela do ranking geral
+
+def read_leaderboard(limit=LEADERBOARD_TOP):
+    """Ranking geral entre torneios (leaderboard.py): (Standing, compacted_at), sem varrer os totais."""
+    return leaderboard.top_teams(db.repo, limit)
 
 # ----------------------------------------------------------------
 # FUNÇÕES DE MANUTENÇÃO DO BANCO
 # ----------------------------------------------------------------
-def clear_database():
-    """Apaga todos os dados (zera o banco)."""
-    try:
-        session.execute("TRUNCATE tournaments")
-        session.execute("TRUNCATE teams")
-        session.execute("TRUNCATE game_matches")
-        messagebox.showinfo("Sucesso", "Banco de dados resetado com sucesso!")
-    except Exception as e:
-        messagebox.showerror("Erro", f"Erro ao resetar banco de dados: {e}")
-
-def delete_tournament_by_id(tournament_id):
-    """Deleta um torneio e todos os times vinculados a ele."""
-    try:
-        session.execute("DELETE FROM tournaments WHERE id = %s", (tournament_id,))
-        teams = read_teams_by_tournament(tournament_id)
-        for team in teams:
-            session.execute("DELETE FROM teams WHERE id = %s", (team[0],))
-        messagebox.showinfo("Sucesso", "Torneio deletado com sucesso!")
-    except Exception as e:
-        messagebox.showerror("Erro", f"Erro ao deletar torneio: {e}")
+def clear_database(on_progress=None):
+    """Apaga todos os dados (zera o banco), partição a partição (cascade.py)."""
+    db.repo.clear(on_progress=on_progress)
+    tournament_catalog.clear()
 
-def on_delete_tournament():
-    """Deleta o torneio selecionado (e seus times)."""
-    selected_tournament_name = tournament_var.get()
-    if selected_tournament_name == "Nenhum torneio cadastrado":
-        messagebox.showerror("Erro", "Selecione um torneio para deletar!")
-        return
-    t_id = next((tid for tid, name in read_tournaments() if name == selected_tournament_name), None)
-    if not t_id:
-        messagebox.showerror("Erro", "Torneio inválido!")
-        return
-    if messagebox.askyesno("Confirmar", f"Tem certeza que deseja deletar o torneio '{selected_tournament_name}'?"):
-        delete_tournament_by_id(t_id)
-        update_tournament_menu()
+def delete_tournament_by_id(tournament_id, on_progress=None):
+    """Deleta um torneio e tudo vinculado a ele: times, ratings, partidas e jogos (cascade.py)."""
+    db.repo.delete_tournament(tournament_id, on_progress=on_progress)
+    tournament_catalog.remove(tournament_id)
 
 # ----------------------------------------------------------------
 # FUNÇÕES DE INTERFACE (GUI)
 # ----------------------------------------------------------------
+# Todo acesso ao banco passa pelo TaskRunner (tasks.py): a consulta roda em uma
+# thread de trabalho e o callback atualiza a interface no thread do Tk.
+def error_handler(prefix):
+    """Cria um callback que exibe o erro de uma tarefa com o prefixo informado."""
+    def handler(error):
+        if isinstance(error, ValueError):
+            messagebox.showerror("Erro", str(error))
+        else:
+            messagebox.showerror("Erro", f"{prefix}: {error}")
+    return handler
+
+def selected_tournament(error_message):
+    """Retorna o nome do torneio selecionado ou None (exibindo `error_message`)."""
+    selected_tournament_name = tournament_var.get()
+    if selected_tournament_name == "Nenhum torneio cadastrado":
+        messagebox.showerror("Erro", error_message)
+        return None
+    return selected_tournament_name
+
+# Estado da lista paginada: só as páginas já exibidas ficam em memória
+match_browser = {"generation": 0, "paging_state": None, "has_more": False, "loaded": 0}
+
 def update_match_list():
+    """Recarrega a lista de partidas a partir da primeira página (com o filtro atual)."""
+    match_browser["generation"] += 1
+    match_browser.update(paging_state=None, has_more=True, loaded=0)
     match_listbox.delete(0, tk.END)
-    try:
-        for m in read_matches():
+    match_count_var.set("Carregando...")
+    load_next_match_page()
+
+def load_next_match_page():
+    """Busca a próxima página de partidas e a acrescenta à lista."""
+    if not match_browser["has_more"]:
+        return
+    generation = match_browser["generation"]
+    status = match_status_var.get()
+    status = None if status == "Todos" else status
+
+    def fill(result):
+        if generation != match_browser["generation"]:
+            return  # página de uma listagem antiga (filtro mudou ou lista recarregada)
+        rows, paging_state = result
+        for m in rows:
             teams_str = ', '.join(m[4]) if m[4] else ""
             match_listbox.insert(tk.END, f"ID: {m[0]} - {m[1]} - {m[2]} - {m[3]} - Ranking: {teams_str}")
-    except Exception as e:
-        messagebox.showerror("Erro", f"Erro ao atualizar partidas: {e}")
+        match_browser.update(paging_state=paging_state, has_more=paging_state is not None,
+                             loaded=match_browser["loaded"] + len(rows))
+        more = " (role para carregar mais)" if match_browser["has_more"] else ""
+        match_count_var.set(f"{match_browser['loaded']} partidas exibidas{more}")
+
+    runner.submit(("matches", generation), read_matches_page, status, match_browser["paging_state"],
+                  on_success=fill, on_error=error_handler("Erro ao atualizar partidas"),
+                  busy_text="Carregando partidas...")
+
+def on_match_list_scroll(first, last):
+    """Atualiza a barra de rolagem e carrega a próxima página ao chegar perto do fim."""
+    match_scrollbar.set(first, last)
+    if float(last) >= 0.95:
+        load_next_match_page()
 
 def open_match_view():
     selected_match = match_listbox.get(tk.ACTIVE)
@@ -285,227 +270,455 @@ def open_match_view():
         messagebox.showerror("Erro", "Selecione uma partida!")
         return
     match_id = selected_match.split(" - ")[0].replace("ID: ", "").strip()
-    try:
-        query = "SELECT title, description, status, teams FROM game_matches WHERE id = %s"
-        row = session.execute(query, (match_id,)).one()
+
+    def show(row):
         if not row:
             messagebox.showerror("Erro", "Partida não encontrada!")
             return
-    except Exception as e:
-        messagebox.showerror("Erro", f"Erro ao recuperar partida: {e}")
-        return
-    
-    match_window = Toplevel(root)
-    match_window.title(f"Detalhes da Partida: {row.title}")
-    match_window.geometry("400x300")
-    
-    Label(match_window, text=f"Título: {row.title}", font=("Arial", 14, "bold")).pack(pady=5)
-    Label(match_window, text=f"Descrição: {row.description}", font=("Arial", 12)).pack(pady=5)
-    Label(match_window, text=f"Status: {row.status}", font=("Arial", 12)).pack(pady=5)
-    if row.status == "Terminado" and row.teams:
-        Label(match_window, text="Ranking Final:", font=("Arial", 12, "bold")).pack(pady=5)
-        for ranking_line in row.teams:
-            Label(match_window, text=ranking_line, bg="lightblue", width=30, height=2).pack(pady=2)
-    else:
-        Label(match_window, text="Partida em andamento...", font=("Arial", 12, "italic")).pack(pady=5)
+        match_window = Toplevel(root)
+        match_window.title(f"Detalhes da Partida: {row.title}")
+        match_window.geometry("500x550")
+
+        Label(match_window, text=f"Título: {row.title}", font=("Arial", 14, "bold")).pack(pady=5)
+        Label(match_window, text=f"Descrição: {row.description}", font=("Arial", 12)).pack(pady=5)
+        Label(match_window, text=f"Status: {row.status}", font=("Arial", 12)).pack(pady=5)
+        if row.status == "Terminado" and row.teams:
+            Label(match_window, text="Ranking Final:", font=("Arial", 12, "bold")).pack(pady=5)
+            ranking_box = Listbox(match_window, width=40, height=6, bg="lightblue")
+            ranking_box.pack(pady=2)
+            for ranking_line in row.teams:
+                ranking_box.insert(tk.END, ranking_line)
+            open_games_panel(match_window, match_id)
+        else:
+            Label(match_window, text="Partida em andamento...", font=("Arial", 12, "italic")).pack(pady=5)
+
+    runner.submit(("match", match_id), read_match, match_id, on_success=show,
+                  on_error=error_handler("Erro ao recuperar partida"), busy_text="Carregando partida...")
+
+def open_games_panel(parent, simulation_id):
+    """Lista os jogos da simulação (match_games), carregados página a página, rodada por rodada."""
+    Label(parent, text="Jogos:", font=("Arial", 12, "bold")).pack(pady=5)
+    games_box = Listbox(parent, width=60, height=10, font=("Courier", 10))
+    games_box.pack(padx=10, pady=2, fill="both", expand=True)
+    state = {"round": 1, "paging_state": None, "done": False}
+
+    def load_more():
+        if state["done"]:
+            return
+        round_number = state["round"]
+
+        def fill(result):
+            rows, paging_state = result
+            if not games_box.winfo_exists():
+                return
+            if not rows and state["paging_state"] is None:
+                state["done"] = True  # rodada sem jogos: a simulação acabou
+                more_button.config(state=tk.DISABLED, text="Todos os jogos carregados")
+                return
+            if state["paging_state"] is None:
+                games_box.insert(tk.END, f"Rodada {round_number}:")
+            for game, team1, team2, winner in rows:
+                if team2 is None:
+                    games_box.insert(tk.END, f"  Equipe com bye: {team1}")
+                else:
+                    games_box.insert(tk.END, f"  Jogo: {team1} vs {team2} -> Vencedor: {winner}")
+            if paging_state is None:
+                state.update(round=round_number + 1, paging_state=None)
+            else:
+                state["paging_state"] = paging_state
+
+        runner.submit(("match_games", simulation_id), read_round_games, simulation_id, round_number,
+                      state["paging_state"], on_success=fill,
+                      on_error=error_handler("Erro ao carregar jogos"), busy_text="Carregando jogos...")
+
+    more_button = Button(parent, text="Carregar mais jogos", font=("Arial", 11), command=load_more)
+    more_button.pack(pady=5)
+    load_more()
 
 def open_tournament_view():
     """Exibe os detalhes do torneio selecionado e seus times."""
-    selected_tournament_name = tournament_var.get()
-    if selected_tournament_name == "Nenhum torneio cadastrado":
-        messagebox.showerror("Erro", "Selecione um torneio!")
-        return
-    t_id = next((tid for tid, name in read_tournaments() if name == selected_tournament_name), None)
-    if not t_id:
-        messagebox.showerror("Erro", "Torneio inválido!")
+    selected_tournament_name = selected_tournament("Selecione um torneio!")
+    if not selected_tournament_name:
         return
 
-    teams_in_tournament = read_teams_by_tournament(t_id)
-    tw = Toplevel(root)
-    tw.title(f"Detalhes do Torneio: {selected_tournament_name}")
-    tw.geometry("400x300")
-    
-    Label(tw, text=f"Torneio: {selected_tournament_name}", font=("Arial", 14, "bold")).pack(pady=5)
-    Label(tw, text=f"ID: {t_id}", font=("Arial", 10, "italic")).pack(pady=5)
-    if not teams_in_tournament:
-        Label(tw, text="Nenhum time neste torneio.", fg="red").pack(pady=5)
-    else:
-        for tid, tname in teams_in_tournament:
-            Label(tw, text=tname, bg="lightblue", width=20, height=2).pack(pady=2)
+    def load():
+        t_id = resolve_tournament_id(selected_tournament_name)
+        return t_id, read_teams_by_tournament(t_id), read_ratings(t_id)
+
+    def show(result):
+        t_id, teams_in_tournament, team_ratings = result
+        tw = Toplevel(root)
+        tw.title(f"Detalhes do Torneio: {selected_tournament_name}")
+        tw.geometry("400x300")
+
+        Label(tw, text=f"Torneio: {selected_tournament_name}", font=("Arial", 14, "bold")).pack(pady=5)
+        Label(tw, text=f"ID: {t_id}", font=("Arial", 10, "italic")).pack(pady=5)
+        if not teams_in_tournament:
+            Label(tw, text="Nenhum time neste torneio.", fg="red").pack(pady=5)
+        else:
+            for tid, tname in teams_in_tournament:
+                rating = team_ratings.get(tid, DEFAULT_RATING)
+                Label(tw, text=f"{tname} ({rating:.0f})", bg="lightblue", width=30, height=2).pack(pady=2)
+
+    runner.submit(("tournament_view", selected_tournament_name), load, on_success=show,
+                  on_error=error_handler("Erro ao carregar torneio"), busy_text="Carregando torneio...")
 
 def on_create_tournament():
     name = tournament_entry.get()
     if not name:
         messagebox.showerror("Erro", "Digite um nome para o torneio!")
         return
-    t_id = create_tournament(name)
-    if t_id:
+
+    def done(t_id):
         messagebox.showinfo("Sucesso", f"Torneio '{name}' criado (ID: {t_id})!")
         update_tournament_menu()
 
+    runner.submit("create_tournament", create_tournament, name, on_success=done,
+                  on_error=error_handler("Erro ao criar torneio"), busy_text="Criando torneio...")
+
 def on_create_team():
     team_name = team_entry.get()
     if not team_name:
         messagebox.showerror("Erro", "Digite um nome para o time!")
         return
-    selected_tournament_name = tournament_var.get()
-    if selected_tournament_name == "Nenhum torneio cadastrado":
-        messagebox.showerror("Erro", "Crie ou selecione um torneio antes de criar um time!")
-        return
-    t_id = next((tid for tid, name in read_tournaments() if name == selected_tournament_name), None)
-    if not t_id:
-        messagebox.showerror("Erro", "Torneio inválido!")
+    selected_tournament_name = selected_tournament("Crie ou selecione um torneio antes de criar um time!")
+    if not selected_tournament_name:
         return
-    create_team(team_name, t_id)
-    messagebox.showinfo("Sucesso", f"Time '{team_name}' criado no torneio '{selected_tournament_name}'!")
 
-def on_simulate_tournament():
-    selected_tournament_name = tournament_var.get()
-    if selected_tournament_name == "Nenhum torneio cadastrado":
-        messagebox.showerror("Erro", "Selecione um torneio para simular!")
-        return
-    t_id = next((tid for tid, name in read_tournaments() if name == selected_tournament_name), None)
-    if not t_id:
-        messagebox.showerror("Erro", "Torneio inválido!")
-        return
+    def work():
+        return create_team(team_name, resolve_tournament_id(selected_tournament_name))
 
-    tournament_details = read_tournament(t_id)
-    if tournament_details and tournament_details.simulated:
-        messagebox.showerror("Erro", "Este torneio já foi simulado e não pode ser simulado novamente.")
-        return
+    def done(team_id):
+        messagebox.showinfo("Sucesso", f"Time '{team_name}' criado no torneio '{selected_tournament_name}'!")
 
-    sim_match_id = create_match("Simulação do Torneio " + selected_tournament_name, "Simulação realizada")
-    if not sim_match_id:
-        return
+    runner.submit("create_team", work, on_success=done,
+                  on_error=error_handler("Erro ao criar time"), busy_text="Criando time...")
 
-    ranking, log_text = simulate_tournament_dynamic(t_id)
-    if ranking is None:
-        messagebox.showerror("Erro", log_text)
+def on_simulate_tournament():
+    selected_tournament_name = selected_tournament("Selecione um torneio para simular!")
+    if not selected_tournament_name:
+        return
+    if runner.is_running(("simulate", selected_tournament_name)):
         return
-    
-    ranking_lines = [f"{pos}: {team}" for pos, team in ranking]
-    update_query = "UPDATE game_matches SET status = %s, teams = %s WHERE id = %s"
-    session.execute(update_query, ("Terminado", ranking_lines, sim_match_id))
-    
-    session.execute("UPDATE tournaments SET simulated = %s WHERE id = %s", (True, t_id))
-    
+    # Nome exibido no menu -> formato (services.TOURNAMENT_FORMATS)
+    tournament_format = {label: key for key, (label, _) in services.TOURNAMENT_FORMATS.items()}[format_var.get()]
+
     sim_window = Toplevel(root)
     sim_window.title("Simulação do Torneio")
     sim_window.geometry("600x450")
     sim_window.configure(bg="#f0f8ff")
-    
+
     title_label = Label(sim_window, text="Resultados da Simulação", font=("Helvetica", 16, "bold"), fg="#003366", bg="#f0f8ff")
     title_label.pack(pady=10)
-    
-    ranking_str = "\n".join(ranking_lines)
-    result_label = Label(sim_window, text=f"Ranking Final:\n{ranking_str}", font=("Helvetica", 14), fg="green", bg="#f0f8ff")
+
+    result_label = Label(sim_window, text="Simulando...", font=("Helvetica", 14), fg="green", bg="#f0f8ff")
     result_label.pack(pady=5)
-    
-    text_box = tk.Text(sim_window, width=70, height=18, font=("Courier", 10), bg="#e6f2ff")
+
+    text_box = tk.Text(sim_window, width=70, height=18, font=("Courier", 10), bg="#e6f2ff", state=tk.DISABLED)
     text_box.pack(pady=10)
-    text_box.insert(tk.END, log_text)
-    text_box.config(state=tk.DISABLED)
-    
-    update_match_list()
+
+    def append_lines(lines):
+        """Acrescenta as linhas de uma rodada ao log (chamada no thread do Tk)."""
+        if not text_box.winfo_exists():
+            return
+        text_box.config(state=tk.NORMAL)
+        text_box.insert(tk.END, "\n".join(lines) + "\n")
+        text_box.config(state=tk.DISABLED)
+        text_box.see(tk.END)
+
+    def work():
+        t_id = resolve_tournament_id(selected_tournament_name)
+        return run_tournament_simulation(t_id, selected_tournament_name,
+                                         on_log=lambda lines: runner.post(append_lines, lines),
+                                         tournament_format=tournament_format)
+
+    def show(result):
+        ranking_lines, _ = result
+        if result_label.winfo_exists():
+            ranking_str = "\n".join(ranking_lines[:RANKING_PREVIEW])
+            if len(ranking_lines) > RANKING_PREVIEW:
+                ranking_str += f"\n... (+{len(ranking_lines) - RANKING_PREVIEW} no log)"
+            result_label.config(text=f"Ranking Final:\n{ranking_str}")
+        update_match_list()
+
+    def failed(error):
+        sim_window.destroy()
+        error_handler("Erro ao simular torneio")(error)
+
+    runner.submit(("simulate", selected_tournament_name), work, on_success=show,
+                  on_error=failed, busy_text="Simulando torneio...")
+
+def on_monte_carlo():
+    """Estima as probabilidades de colocação do torneio selecionado (não altera o banco)."""
+    selected_tournament_name = selected_tournament("Selecione um torneio para estimar probabilidades!")
+    if not selected_tournament_name:
+        return
+    replicates = simpledialog.askinteger("Monte Carlo", "Quantas simulações deseja executar?",
+                                         initialvalue=MONTE_CARLO_REPLICATES, minvalue=1)
+    if not replicates:
+        return
+
+    def work():
+        return estimate_tournament_odds(resolve_tournament_id(selected_tournament_name), replicates)
+
+    def show(result):
+        names, odds = result
+        probabilities = odds.probabilities
+        mc_window = Toplevel(root)
+        mc_window.title(f"Probabilidades: {selected_tournament_name}")
+        mc_window.geometry("700x450")
+        Label(mc_window, text=f"{replicates} simulações de {selected_tournament_name}", font=("Helvetica", 14, "bold")).pack(pady=10)
+        listbox = Listbox(mc_window, width=90, font=("Courier", 10))
+        listbox.pack(padx=10, pady=5, fill="both", expand=True)
+        header = "  ".join(f"{p + 1}º Lugar" for p in range(probabilities.shape[1]))
+        listbox.insert(tk.END, f"{'Time':<30} {header}")
+        for team in sorted(range(len(names)), key=lambda t: -probabilities[t, 0]):
+            cols = "  ".join(f"{probabilities[team, p]:8.2%}" for p in range(probabilities.shape[1]))
+            listbox.insert(tk.END, f"{names[team]:<30} {cols}")
+
+    runner.submit(("monte_carlo", selected_tournament_name), work, on_success=show,
+                  on_error=error_handler("Erro ao estimar probabilidades"), busy_text="Executando Monte Carlo...")
 
 def on_generate_random_teams():
-    selected_tournament_name = tournament_var.get()
-    if selected_tournament_name == "Nenhum torneio cadastrado":
-        messagebox.showerror("Erro", "Selecione um torneio para gerar times!")
+    selected_tournament_name = selected_tournament("Selecione um torneio para gerar times!")
+    if not selected_tournament_name:
         return
-    t_id = next((tid for tid, name in read_tournaments() if name == selected_tournament_name), None)
-    if not t_id:
-        messagebox.showerror("Erro", "Torneio inválido!")
+    num_teams_to_generate = simpledialog.askinteger("Gerar Times", "Quantos times deseja gerar?", minvalue=2)
+    if not num_teams_to_generate:
         return
-    generate_random_teams(t_id)
+
+    def work():
+        return generate_random_teams(num_teams_to_generate, resolve_tournament_id(selected_tournament_name))
+
+    def done(result):
+        created, failures = result
+        if failures:
+            messagebox.showwarning("Aviso", f"{len(created)} times criados, {len(failures)} falharam (ex.: {failures[0][1]}).")
+            return
+        messagebox.showinfo("Sucesso", f"{len(created)} times aleatórios foram adicionados ao torneio!")
+
+    runner.submit(("generate_teams", selected_tournament_name), work, on_success=done,
+                  on_error=error_handler("Erro ao gerar times"), busy_text="Gerando times...")
 
 def on_reset_database():
     if messagebox.askyesno("Confirmar", "Tem certeza que deseja resetar o banco (apagar TODOS os dados)?"):
-        clear_database()
-        update_tournament_menu()
+        def done(_):
+            messagebox.showinfo("Sucesso", "Banco de dados resetado com sucesso!")
+            update_tournament_menu()
+            update_match_list()
+
+        def progress(done_count, total):
+            runner.progress(f"Resetando banco... {done_count} partições removidas")
+
+        runner.submit("reset", clear_database, progress, on_success=done,
+                      on_error=error_handler("Erro ao resetar banco de dados"), busy_text="Resetando banco...")
 
 def on_delete_tournament():
-    selected_tournament_name = tournament_var.get()
-    if selected_tournament_name == "Nenhum torneio cadastrado":
-        messagebox.showerror("Erro", "Selecione um torneio para deletar!")
-        return
-    t_id = next((tid for tid, name in read_tournaments() if name == selected_tournament_name), None)
-    if not t_id:
-        messagebox.showerror("Erro", "Torneio inválido!")
+    """Deleta o torneio selecionado (e seus times)."""
+    selected_tournament_name = selected_tournament("Selecione um torneio para deletar!")
+    if not selected_tournament_name:
         return
     if messagebox.askyesno("Confirmar", f"Tem certeza que deseja deletar o torneio '{selected_tournament_name}'?"):
-        delete_tournament_by_id(t_id)
-        update_tournament_menu()
-
-def update_tournament_menu():
-    all_tournaments = [name for _, name in read_tournaments()]
-    if all_tournaments:
-        tournament_var.set(all_tournaments[0])
-    else:
-        tournament_var.set("Nenhum torneio cadastrado")
-    tournament_menu['menu'].delete(0, 'end')
-    for t in all_tournaments:
-        tournament_menu['menu'].add_command(label=t, command=lambda val=t: tournament_var.set(val))
+        def progress(done_count, total):
+            runner.progress(f"Deletando torneio... {done_count}/{total}")
+
+        def work():
+            delete_tournament_by_id(resolve_tournament_id(selected_tournament_name), on_progress=progress)
+
+        def done(_):
+            messagebox.showinfo("Sucesso", "Torneio deletado com sucesso!")
+            update_tournament_menu()
+
+        runner.submit(("delete", selected_tournament_name), work, on_success=done,
+                      on_error=error_handler("Erro ao deletar torneio"), busy_text="Deletando torneio...")
+
+def open_leaderboard_view():
+    """Janela com o ranking geral entre torneios (lido da partição compactada)."""
+    def show(result):
+        standings, compacted_at = result
+        lw = Toplevel(root)
+        lw.title("Ranking Geral")
+        lw.geometry("800x450")
+        Label(lw, text="Ranking Geral (todos os torneios)", font=("Arial", 14, "bold")).pack(pady=5)
+        if compacted_at is None:
+            Label(lw, text="Ranking ainda não compactado (agende cli.py leaderboard --compact).",
+                  fg="red").pack(pady=5)
+            return
+        if not standings:
+            Label(lw, text="Nenhuma simulação registrada.", fg="red").pack(pady=5)
+            return
+        listbox = Listbox(lw, width=100, font=("Courier", 10))
+        listbox.pack(padx=10, pady=5, fill="both", expand=True)
+        for line in leaderboard.format_standings(standings):
+            listbox.insert(tk.END, line)
+        updated = f"Atualizado em {compacted_at:%d/%m/%Y %H:%M:%S} UTC"
+        if leaderboard.is_stale(compacted_at):
+            updated += " (desatualizado)"
+        Label(lw, text=updated, font=("Arial", 10, "italic")).pack(pady=5)
+
+    runner.submit("leaderboard", read_leaderboard, on_success=show,
+                  on_error=error_handler("Erro ao carregar o ranking geral"), busy_text="Carregando ranking geral...")
+
+def open_metrics_view():
+    """Janela com as métricas de latência (atualizada a cada METRICS_REFRESH_MS)."""
+    mw = Toplevel(root)
+    mw.title("Métricas")
+    mw.geometry("900x450")
+    summary_var = StringVar(mw)
+    Label(mw, textvariable=summary_var, font=("Arial", 11, "italic")).pack(pady=5)
+    listbox = Listbox(mw, width=120, font=("Courier", 10))
+    listbox.pack(padx=10, pady=5, fill="both", expand=True)
+
+    def refresh():
+        if not listbox.winfo_exists():
+            return
+        snapshot = metrics.snapshot()
+        listbox.delete(0, tk.END)
+        listbox.insert(tk.END, f"{'Medição':<48} {'chamadas':>8} {'erros':>6} {'timeouts':>8} {'linhas':>9} "
+                               f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'máx ms':>8}")
+        for name, stats in snapshot["stats"].items():
+            listbox.insert(tk.END, f"{name[:48]:<48} {stats['count']:>8} {stats['errors']:>6} {stats['timeouts']:>8} "
+                                   f"{stats['rows']:>9} {stats['p50'] * 1e3:>8.1f} {stats['p95'] * 1e3:>8.1f} "
+                                   f"{stats['p99'] * 1e3:>8.1f} {stats['max'] * 1e3:>8.1f}")
+        for trace in snapshot["traces"][-5:]:
+            listbox.insert(tk.END, f"trace {trace['trace_id']} ({trace['name']})")
+        summary_var.set(f"{len(snapshot['stats'])} medições em {snapshot['uptime']:.0f} s"
+                        f" - tracing em {TRACE_SAMPLE_RATE:.1%} das consultas")
+        mw.after(METRICS_REFRESH_MS, refresh)
+
+    def save():
+        path = filedialog.asksaveasfilename(parent=mw, defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if path:
+            metrics.dump(path)
+
+    buttons = Frame(mw)
+    buttons.pack(pady=5)
+    Button(buttons, text="Salvar JSON", font=("Arial", 11), command=save).pack(side="left", padx=5)
+    Button(buttons, text="Zerar", font=("Arial", 11), command=metrics.reset).pack(side="left", padx=5)
+    refresh()
+
+def update_tournament_menu(force_refresh=False):
+    """Atualiza o menu a partir do catálogo (recarrega do banco se expirado ou se `force_refresh`)."""
+    def load():
+        if force_refresh:
+            tournament_catalog.refresh()
+        return tournament_catalog.names()
+
+    def fill(all_tournaments):
+        current = tournament_var.get()
+        if current in all_tournaments:
+            tournament_var.set(current)
+        elif all_tournaments:
+            tournament_var.set(all_tournaments[0])
+        else:
+            tournament_var.set("Nenhum torneio cadastrado")
+        tournament_menu['menu'].delete(0, 'end')
+        for t in all_tournaments:
+            tournament_menu['menu'].add_command(label=t, command=lambda val=t: tournament_var.set(val))
+
+    runner.submit("tournament_menu", load, on_success=fill,
+                  on_error=error_handler("Erro ao carregar torneios"), busy_text="Carregando torneios...")
 
 # ----------------------------------------------------------------
 # INTERFACE PRINCIPAL (GUI)
 # ----------------------------------------------------------------
-root = tk.Tk()
-root.title("Gerenciador de Jogos - Column Family (Cassandra)")
-root.geometry("900x650")
-root.configure(bg="#e6e6fa")
-
-main_frame = Frame(root, bg="#e6e6fa", padx=20, pady=20)
-main_frame.pack(expand=True, fill="both")
-
-# Seção de Torneios
-t_frame = Frame(main_frame, bg="#e6e6fa", pady=10)
-t_frame.pack(fill="x")
-Label(t_frame, text="Nome do Torneio:", font=("Arial", 12, "bold"), bg="#e6e6fa").grid(row=0, column=0, sticky="w")
-tournament_entry = Entry(t_frame, width=30, font=("Arial", 12))
-tournament_entry.grid(row=0, column=1, padx=10)
-Button(t_frame, text="Criar Torneio", font=("Arial", 12), command=on_create_tournament).grid(row=0, column=2, padx=10)
-Label(t_frame, text="Selecione um Torneio:", font=("Arial", 12, "bold"), bg="#e6e6fa").grid(row=1, column=0, sticky="w", pady=5)
-tournament_var = StringVar(t_frame)
-all_tournaments = [name for _, name in read_tournaments()]
-tournament_var.set(all_tournaments[0] if all_tournaments else "Nenhum torneio cadastrado")
-tournament_menu = OptionMenu(t_frame, tournament_var, *(all_tournaments if all_tournaments else ["Nenhum torneio cadastrado"]))
-tournament_menu.config(font=("Arial", 12))
-tournament_menu.grid(row=1, column=1, padx=10)
-Button(t_frame, text="Ver Detalhes do Torneio", font=("Arial", 12), command=open_tournament_view).grid(row=1, column=2, padx=10)
-Button(t_frame, text="Gerar Times Aleatórios", font=("Arial", 12), command=on_generate_random_teams).grid(row=1, column=3, padx=10)
-Button(t_frame, text="Deletar Torneio", font=("Arial", 12), command=on_delete_tournament).grid(row=1, column=4, padx=10)
-Button(t_frame, text="Resetar Banco", font=("Arial", 12), command=on_reset_database).grid(row=0, column=4, padx=10)
-
-# Seção de Times
-team_frame = Frame(main_frame, bg="#e6e6fa", pady=10)
-team_frame.pack(fill="x")
-Label(team_frame, text="Nome do Time:", font=("Arial", 12, "bold"), bg="#e6e6fa").grid(row=0, column=0, sticky="w")
-team_entry = Entry(team_frame, width=30, font=("Arial", 12))
-team_entry.grid(row=0, column=1, padx=10)
-Button(team_frame, text="Criar Time no Torneio", font=("Arial", 12), command=on_create_team).grid(row=0, column=2, padx=10)
-
-# Seção para Simulação de Torneio
-sim_frame = Frame(main_frame, bg="#e6e6fa", pady=10)
-sim_frame.pack(fill="x")
-Button(sim_frame, text="Simular Torneio", font=("Arial", 12, "bold"), bg="orange", command=on_simulate_tournament).pack(pady=5)
-
-# Seção de Partidas
-part_frame = Frame(main_frame, bg="#e6e6fa", pady=10)
-part_frame.pack(fill="both", expand=True)
-Label(part_frame, text="Partidas:", font=("Arial", 12, "bold"), bg="#e6e6fa").pack(anchor="w")
-match_listbox = Listbox(part_frame, width=100, height=6, font=("Arial", 12))
-match_listbox.pack(padx=10, pady=10, fill="both", expand=True)
-Button(part_frame, text="Ver Detalhes da Partida", font=("Arial", 12), command=open_match_view).pack(pady=5)
-Button(part_frame, text="Atualizar Partidas", font=("Arial", 12), command=update_match_list).pack(pady=5)
-
-update_tournament_menu()
-update_match_list()
-
-root.mainloop()
+def build_gui():
+    """Monta a janela principal (os widgets ficam em variáveis globais usadas pelos handlers)."""
+    global root, status_var, runner, tournament_entry, tournament_var, tournament_menu, team_entry
+    global match_status_var, match_count_var, match_scrollbar, match_listbox, format_var
+
+    root = tk.Tk()
+    root.title("Gerenciador de Jogos - Column Family (Cassandra)")
+    root.geometry("900x650")
+    root.configure(bg="#e6e6fa")
+
+    status_var = StringVar(root, value="Pronto")
+    runner = TaskRunner(root, status_var)
+
+    main_frame = Frame(root, bg="#e6e6fa", padx=20, pady=20)
+    main_frame.pack(expand=True, fill="both")
+
+    # Seção de Torneios
+    t_frame = Frame(main_frame, bg="#e6e6fa", pady=10)
+    t_frame.pack(fill="x")
+    Label(t_frame, text="Nome do Torneio:", font=("Arial", 12, "bold"), bg="#e6e6fa").grid(row=0, column=0, sticky="w")
+    tournament_entry = Entry(t_frame, width=30, font=("Arial", 12))
+    tournament_entry.grid(row=0, column=1, padx=10)
+    Button(t_frame, text="Criar Torneio", font=("Arial", 12), command=on_create_tournament).grid(row=0, column=2, padx=10)
+    Label(t_frame, text="Selecione um Torneio:", font=("Arial", 12, "bold"), bg="#e6e6fa").grid(row=1, column=0, sticky="w", pady=5)
+    tournament_var = StringVar(t_frame)
+    tournament_var.set("Nenhum torneio cadastrado")
+    tournament_menu = OptionMenu(t_frame, tournament_var, "Nenhum torneio cadastrado")
+    tournament_menu.config(font=("Arial", 12))
+    tournament_menu.grid(row=1, column=1, padx=10)
+    Button(t_frame, text="Ver Detalhes do Torneio", font=("Arial", 12), command=open_tournament_view).grid(row=1, column=2, padx=10)
+    Button(t_frame, text="Gerar Times Aleatórios", font=("Arial", 12), command=on_generate_random_teams).grid(row=1, column=3, padx=10)
+    Button(t_frame, text="Deletar Torneio", font=("Arial", 12), command=on_delete_tournament).grid(row=1, column=4, padx=10)
+    Button(t_frame, text="Atualizar Torneios", font=("Arial", 12), command=lambda: update_tournament_menu(force_refresh=True)).grid(row=0, column=3, padx=10)
+    Button(t_frame, text="Resetar Banco", font=("Arial", 12), command=on_reset_database).grid(row=0, column=4, padx=10)
+
+    # Seção de Times
+    team_frame = Frame(main_frame, bg="#e6e6fa", pady=10)
+    team_frame.pack(fill="x")
+    Label(team_frame, text="Nome do Time:", font=("Arial", 12, "bold"), bg="#e6e6fa").grid(row=0, column=0, sticky="w")
+    team_entry = Entry(team_frame, width=30, font=("Arial", 12))
+    team_entry.grid(row=0, column=1, padx=10)
+    Button(team_frame, text="Criar Time no Torneio", font=("Arial", 12), command=on_create_team).grid(row=0, column=2, padx=10)
+
+    # Seção para Simulação de Torneio
+    sim_frame = Frame(main_frame, bg="#e6e6fa", pady=10)
+    sim_frame.pack(fill="x")
+    Button(sim_frame, text="Simular Torneio", font=("Arial", 12, "bold"), bg="orange", command=on_simulate_tournament).pack(side="left", padx=10, pady=5)
+    format_labels = [label for label, _ in services.TOURNAMENT_FORMATS.values()]
+    format_var = StringVar(root, value=format_labels[0])
+    OptionMenu(sim_frame, format_var, *format_labels).pack(side="left", padx=5, pady=5)
+    Button(sim_frame, text="Probabilidades (Monte Carlo)", font=("Arial", 12), command=on_monte_carlo).pack(side="left", padx=10, pady=5)
+    Button(sim_frame, text="Métricas", font=("Arial", 12), command=open_metrics_view).pack(side="right", padx=10, pady=5)
+    Button(sim_frame, text="Ranking Geral", font=("Arial", 12), command=open_leaderboard_view).pack(side="right", padx=10, pady=5)
+
+    # Seção de Partidas
+    part_frame = Frame(main_frame, bg="#e6e6fa", pady=10)
+    part_frame.pack(fill="both", expand=True)
+    filter_frame = Frame(part_frame, bg="#e6e6fa")
+    filter_frame.pack(fill="x")
+    Label(filter_frame, text="Partidas:", font=("Arial", 12, "bold"), bg="#e6e6fa").pack(side="left")
+    Label(filter_frame, text="Status:", font=("Arial", 12), bg="#e6e6fa").pack(side="left", padx=(20, 5))
+    match_status_var = StringVar(filter_frame, value=MATCH_STATUSES[0])
+    OptionMenu(filter_frame, match_status_var, *MATCH_STATUSES, command=lambda _: update_match_list()).pack(side="left")
+    match_count_var = StringVar(filter_frame, value="")
+    Label(filter_frame, textvariable=match_count_var, font=("Arial", 10, "italic"), bg="#e6e6fa").pack(side="left", padx=20)
+    list_frame = Frame(part_frame, bg="#e6e6fa")
+    list_frame.pack(padx=10, pady=10, fill="both", expand=True)
+    match_scrollbar = tk.Scrollbar(list_frame, orient="vertical")
+    match_scrollbar.pack(side="right", fill="y")
+    match_listbox = Listbox(list_frame, width=100, height=6, font=("Arial", 12), yscrollcommand=on_match_list_scroll)
+    match_listbox.pack(side="left", fill="both", expand=True)
+    match_scrollbar.config(command=match_listbox.yview)
+    Button(part_frame, text="Ver Detalhes da Partida", font=("Arial", 12), command=open_match_view).pack(pady=5)
+    Button(part_frame, text="Atualizar Partidas", font=("Arial", 12), command=update_match_list).pack(pady=5)
+
+    # Barra de status (tarefas em andamento)
+    Label(root, textvariable=status_var, anchor="w", font=("Arial", 10), bg="#d8d8f0").pack(side="bottom", fill="x")
+
+def main():
+    """Abre a interface; a conexão com o banco é feita pela primeira tarefa que precisar dela."""
+    build_gui()
+    update_tournament_menu()
+    update_match_list()
+    metrics_dump = PeriodicDump(metrics, METRICS_FILE, METRICS_DUMP_INTERVAL).start() if METRICS_FILE else None
+    try:
+        root.mainloop()
+    finally:
+        runner.shutdown()
+        if metrics_dump:
+            metrics_dump.stop()
+        db.shutdown()
+
+if __name__ == "__main__":
+    main()
 
 # Para visualizar todas as tabelas no cqlsh (Docker), execute:
-# docker pull cassandra casso seja necessario baixar a imagen 
+# docker pull cassandra casso seja necessario baixar a imagen
 # docker run --name cassandra-container -p 9042:9042 cassandra cria e ativa o container
 # docker start cassandra-container
 # docker exec -it cassandra-container bash entra no container cassandra
@@ -513,15 +726,5 @@ root.mainloop()
 # DESC TABLES;
 #
 #
-# Isso exibirá: tournaments, teams e game_matches.
-
-result = session.execute("""
-    SELECT table_name
-    FROM system_schema.tables
-    WHERE keyspace_name = 'game_manager'
-""")
-print("Tabelas no keyspace 'game_manager':")
-for row in result:
-    print(row.table_name)
-
-cluster.shutdown()
+# Isso exibirá: tournaments, teams, teams_by_tournament, matches_by_tournament, team_ratings,
+# game_matches, match_games, leaderboard_stats, leaderboard_ranking e schema_version.
@@ -0,0 +1,81 @@
+"""
+Inscrição de times em partidas com escritas condicionais (lightweight transactions).
+
+Em vez de ler a partida e o time antes de gravar, cada passo é um UPDATE ... IF:
+o time só é marcado se `in_match = false` e só entra na partida se ela ainda
+estiver 'Aguardando'. Dois clientes concorrentes nunca conseguem inscrever o
+mesmo time, e o caminho comum custa duas idas ao servidor.
+"""
+from cassandra.concurrent import execute_concurrent
+
+DEFAULT_CONCURRENCY = 32
+
+
+def assign_team(statements, match_id, team_id, team_name=None):
+    """
+    Inscreve um time em uma partida. Retorna True se a inscrição foi feita.
+
+    Se `team_name` não for informado, ele é lido antes (uma ida extra ao servidor).
+    """
+    if team_name is None:
+        row = statements.execute("select_team", (team_id,)).one()
+        if not row:
+            return False
+        team_name = row.name
+    if not statements.execute("claim_team", (team_id,)).was_applied:
+        return False
+    try:
+        applied = statements.execute("append_match_team_if_waiting", ([team_name], match_id)).was_applied
+    except Exception:
+        # Erro ao entrar na partida (ex.: timeout): devolve o time antes de propagar
+        statements.execute("release_team", (team_id,))
+        raise
+    if applied:
+        return True
+    # A partida não aceita mais times: devolve o time
+    statements.execute("release_team", (team_id,))
+    return False
+
+
+def assign_teams(session, statements, match_id, teams, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Inscreve vários times, dados como pares (team_id, nome), em uma partida.
+
+    Os times são reservados concorrentemente e os reservados entram na partida
+    em uma única escrita condicional. Retorna os ids dos times inscritos.
+    """
+    teams = list(teams)
+    claim = statements.get("claim_team")
+    results = execute_concurrent(
+        session,
+        ((claim, (team_id,)) for team_id, _ in teams),
+        concurrency=concurrency,
+        raise_on_first_error=False,
+        execution_profile=statements.profile("claim_team"),
+    )
+    claimed = [team for team, (success, result) in zip(teams, results) if success and result.was_applied]
+    if not claimed:
+        return []
+    names = [name for _, name in claimed]
+    try:
+        applied = statements.execute("append_match_team_if_waiting", (names, match_id)).was_applied
+    except Exception:
+        # Erro ao entrar na partida (ex.: timeout): devolve os times antes de propagar
+        _release_teams(session, statements, claimed, concurrency)
+        raise
+    if applied:
+        return [team_id for team_id, _ in claimed]
+    _release_teams(session, statements, claimed, concurrency)
+    return []
+
+
+def _release_teams(session, statements, teams, concurrency):
+    """Devolve (in_match = false) os times reservados, dados como pares (team_id, nome)."""
+    release = statements.get("release_team")
+    execute_concurrent(
+        session,
+        ((release, (team_id,)) for team_id, _ in teams),
+        concurrency=concurrency,
+        raise_on_first_error=False,
+        execution_profile=statements.profile("release_team"),
+    )
@@ -0,0 +1,128 @@
+"""
+Benchmark de inscrições de times em partidas (assignment.py) sob contenção.
+
+Várias threads tentam inscrever times sorteados de um mesmo conjunto em
+partidas sorteadas; cada time deve acabar em no máximo uma partida.
+Uso (na raiz do projeto, com o Cassandra rodando):
+    python -m benchmarks.bench_assign --teams 2000 --matches 50 --threads 8
+"""
+import argparse
+import random
+import threading
+import time
+import uuid
+
+from cassandra.cluster import Cluster
+
+from assignment import assign_team, assign_teams
+from statements import StatementRegistry
+
+KEYSPACE = "game_manager_bench"
+
+
+def setup(session):
+    session.execute(f"""
+        CREATE KEYSPACE IF NOT EXISTS {KEYSPACE}
+        WITH replication = {{'class': 'SimpleStrategy', 'replication_factor': '1'}}
+    """)
+    session.set_keyspace(KEYSPACE)
+    session.execute("""
+        CREATE TABLE IF NOT EXISTS teams (
+            id text PRIMARY KEY,
+            name text,
+            in_match boolean,
+            tournament_id text
+        )
+    """)
+    session.execute("""
+        CREATE TABLE IF NOT EXISTS game_matches (
+            id text PRIMARY KEY,
+            title text,
+            description text,
+            status text,
+            teams list<text>
+        )
+    """)
+    session.execute("TRUNCATE teams")
+    session.execute("TRUNCATE game_matches")
+
+
+def populate(statements, num_teams, num_matches):
+    teams = [(str(uuid.uuid4()), f"Time {i}") for i in range(num_teams)]
+    for team_id, name in teams:
+        statements.execute("insert_team", (team_id, name, False, "bench"))
+    matches = [str(uuid.uuid4()) for _ in range(num_matches)]
+    for i, match_id in enumerate(matches):
+        statements.execute("insert_match", (match_id, f"Partida {i}", "bench", "Aguardando", []))
+    return teams, matches
+
+
+def run_single(statements, teams, matches, threads, attempts):
+    """Cada thread faz `attempts` tentativas de inscrição individual."""
+    counts = [0] * threads
+
+    def worker(index):
+        rng = random.Random(index)
+        for _ in range(attempts):
+            team_id, name = rng.choice(teams)
+            if assign_team(statements, rng.choice(matches), team_id, name):
+                counts[index] += 1
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return sum(counts), threads * attempts, time.perf_counter() - start
+
+
+def run_bulk(session, statements, teams, matches, group):
+    """Preenche cada partida com um grupo de times (sobrepostos entre partidas)."""
+    assigned = 0
+    start = time.perf_counter()
+    for match_id in matches:
+        assigned += len(assign_teams(session, statements, match_id, random.sample(teams, group)))
+    return assigned, len(matches) * group, time.perf_counter() - start
+
+
+def check(session):
+    """Confere que nenhum time foi inscrito em duas partidas."""
+    names = [name for row in session.execute("SELECT teams FROM game_matches") for name in (row.teams or [])]
+    assert len(names) == len(set(names)), "time inscrito em mais de uma partida!"
+    return len(names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--teams", type=int, default=2000)
+    parser.add_argument("--matches", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=500, help="tentativas por thread")
+    parser.add_argument("--group", type=int, default=40, help="times por partida no modo em massa")
+    args = parser.parse_args()
+
+    cluster = Cluster([args.host])
+    session = cluster.connect()
+    setup(session)
+    statements = StatementRegistry(session)
+
+    teams, matches = populate(statements, args.teams, args.matches)
+    ok, tried, elapsed = run_single(statements, teams, matches, args.threads, args.attempts)
+    print(f"individual: {ok}/{tried} inscrições em {elapsed:.2f} s -> {tried / elapsed:,.0f} tentativas/s, "
+          f"{ok / elapsed:,.0f} inscrições/s")
+    print(f"  times inscritos (sem duplicatas): {check(session)}")
+
+    setup(session)
+    teams, matches = populate(statements, args.teams, args.matches)
+    ok, tried, elapsed = run_bulk(session, statements, teams, matches, args.group)
+    print(f"em massa:   {ok}/{tried} inscrições em {elapsed:.2f} s -> {ok / elapsed:,.0f} inscrições/s")
+    print(f"  times inscritos (sem duplicatas): {check(session)}")
+
+    session.execute(f"DROP KEYSPACE {KEYSPACE}")
+    cluster.shutdown()
+
+
+if __name__ == "__main__":
+    main()
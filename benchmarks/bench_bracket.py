@@ -0,0 +1,47 @@
+"""
+Benchmark do motor de chaveamento (bracket.py): tempo por tamanho de torneio.
+
+Não precisa do Cassandra. A coluna "com sorteio" inclui o sorteio inicial
+(bracket.draw_order): com NumPy ele custa pouco; sem NumPy (random.shuffle)
+a meta de 10^6 times só é atingida com shuffle=False ("sem sorteio").
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_bracket --max-exp 6
+"""
+import argparse
+import time
+from array import array
+
+import bracket
+from bracket import simulate_knockout
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-exp", type=int, default=6, help="maior tamanho = 10^max-exp times")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("sorteio:", "permutação NumPy" if bracket.np is not None else "random.shuffle (sem NumPy)")
+    print(f"{'times':>10} {'rodadas':>8} {'com sorteio':>14} {'sem sorteio':>14} {'ns/time':>10}")
+    for exp in range(2, args.max_exp + 1):
+        n = 10 ** exp
+        team_ids = array("l", range(n))
+        shuffled = best_of(lambda: simulate_knockout(team_ids, seed=args.seed), args.repeat)
+        plain = best_of(lambda: simulate_knockout(team_ids, seed=args.seed, shuffle=False), args.repeat)
+        rounds = simulate_knockout(team_ids, seed=args.seed, shuffle=False).num_rounds
+        print(f"{n:>10} {rounds:>8} {shuffled * 1e3:>11.1f} ms {plain * 1e3:>11.1f} ms {plain / n * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Benchmark do modo Monte Carlo (montecarlo.py): réplicas por segundo.
+
+Não precisa do Cassandra (requer NumPy). Uso (na raiz do projeto):
+    python -m benchmarks.bench_montecarlo --replicates 100000
+"""
+import argparse
+import time
+
+from montecarlo import simulate_knockout_replicates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--replicates", type=int, default=100_000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 64, 256, 1024])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'times':>8} {'réplicas':>10} {'tempo':>10} {'réplicas/s':>14}")
+    for size in args.sizes:
+        start = time.perf_counter()
+        simulate_knockout_replicates(size, args.replicates, seed=args.seed)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>8} {args.replicates:>10} {elapsed:>8.2f} s {args.replicates / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Micro-benchmark: latência por operação com consultas simples (%s) vs prepared statements.
+
+Uso (na raiz do projeto, com o Cassandra rodando):
+    python -m benchmarks.bench_prepared --ops 2000
+"""
+import argparse
+import statistics
+import time
+import uuid
+
+from cassandra.cluster import Cluster
+
+from statements import StatementRegistry
+
+KEYSPACE = "game_manager_bench"
+
+
+def setup(session):
+    session.execute(f"""
+        CREATE KEYSPACE IF NOT EXISTS {KEYSPACE}
+        WITH replication = {{'class': 'SimpleStrategy', 'replication_factor': '1'}}
+    """)
+    session.set_keyspace(KEYSPACE)
+    session.execute("""
+        CREATE TABLE IF NOT EXISTS tournaments (
+            id text PRIMARY KEY,
+            name text,
+            simulated boolean
+        )
+    """)
+    session.execute("TRUNCATE tournaments")
+
+
+def measure(fn, ops):
+    """Executa `fn(i)` `ops` vezes e retorna as latências em microssegundos."""
+    latencies = []
+    for i in range(ops):
+        start = time.perf_counter()
+        fn(i)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def report(label, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:<28} média {statistics.mean(latencies):8.1f} µs   "
+          f"mediana {statistics.median(latencies):8.1f} µs   p99 {p99:8.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--ops", type=int, default=2000)
+    args = parser.parse_args()
+
+    cluster = Cluster([args.host])
+    session = cluster.connect()
+    setup(session)
+    statements = StatementRegistry(session)
+    ids = [str(uuid.uuid4()) for _ in range(args.ops)]
+
+    raw_insert = "INSERT INTO tournaments (id, name, simulated) VALUES (%s, %s, %s)"
+    raw_select = "SELECT id, name, simulated FROM tournaments WHERE id = %s"
+
+    report("insert (simples)", measure(
+        lambda i: session.execute(raw_insert, (ids[i], f"Torneio {i}", False)), args.ops))
+    report("insert (prepared)", measure(
+        lambda i: statements.execute("insert_tournament", (ids[i], f"Torneio {i}", False)), args.ops))
+    report("select (simples)", measure(
+        lambda i: session.execute(raw_select, (ids[i],)).one(), args.ops))
+    report("select (prepared)", measure(
+        lambda i: statements.execute("select_tournament", (ids[i],)).one(), args.ops))
+
+    session.execute(f"DROP KEYSPACE {KEYSPACE}")
+    cluster.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Suíte de benchmarks do armazenamento: CRUD, geração de nomes, inserções em
+massa, inscrições, simulação e exclusão em cascata sobre um Repository.
+
+Roda sobre o backend em memória (sem cluster) ou sobre o Cassandra (em um
+keyspace próprio, apagado no fim) e grava os resultados em JSON para
+comparar execuções. Uso (na raiz do projeto):
+    python -m benchmarks.suite --backend memory --output results-memory.json
+    python -m benchmarks.suite --backend cassandra --output results-cassandra.json
+"""
+import argparse
+import json
+import platform
+import time
+from datetime import datetime, timezone
+
+import leaderboard
+import services
+from metrics import InstrumentedRepository, Metrics
+from names import NameGenerator
+from repository import InMemoryRepository
+
+KEYSPACE = "game_manager_bench"
+
+
+class Recorder:
+    """Acumula os resultados (operações, segundos) de cada caso."""
+
+    def __init__(self):
+        self.results = []
+
+    def measure(self, name, operations, fn, *args):
+        start = time.perf_counter()
+        value = fn(*args)
+        elapsed = time.perf_counter() - start
+        self.results.append({
+            "name": name,
+            "operations": operations,
+            "seconds": elapsed,
+            "ops_per_second": operations / elapsed if elapsed else None,
+        })
+        print(f"{name:<32} {operations:>9} ops {elapsed * 1e3:>10.1f} ms "
+              f"{operations / elapsed if elapsed else float('inf'):>12,.0f} ops/s")
+        return value
+
+
+def run_crud(repo, recorder, ops):
+    t_ids = recorder.measure("crud.create_tournament", ops,
+                             lambda: [repo.create_tournament(f"Torneio {i}") for i in range(ops)])
+    recorder.measure("crud.get_tournament", ops, lambda: [repo.get_tournament(t_id) for t_id in t_ids])
+    t_id = t_ids[0]
+    recorder.measure("crud.create_team", ops,
+                     lambda: [repo.create_team(f"Time {i}", t_id) for i in range(ops)])
+    recorder.measure("crud.list_teams_by_tournament", ops,
+                     lambda: [repo.list_teams_by_tournament(t_id) for _ in range(ops)])
+    match_ids = recorder.measure("crud.create_match", ops,
+                                 lambda: [repo.create_match(f"Partida {i}", "bench", t_id) for i in range(ops)])
+    recorder.measure("crud.get_match", ops, lambda: [repo.get_match(match_id) for match_id in match_ids])
+    recorder.measure("crud.list_matches_page", ops // 10 or 1, lambda: _walk_pages(repo))
+    return t_ids
+
+
+def _walk_pages(repo):
+    rows, paging_state = repo.list_matches_page()
+    while paging_state is not None:
+        rows, paging_state = repo.list_matches_page(paging_state=paging_state)
+
+
+def run_names(repo, recorder, count):
+    generator = NameGenerator()
+    t_id = repo.create_tournament("Nomes")
+    recorder.measure("names.sample", count, services.generate_team_names, repo, generator, count, t_id)
+
+
+def run_bulk(repo, recorder, count):
+    t_id = repo.create_tournament("Em massa")
+    created, failures = recorder.measure("bulk.generate_random_teams", count,
+                                         services.generate_random_teams, repo, NameGenerator(), count, t_id)
+    if failures:
+        print(f"  {len(failures)} falhas (ex.: {failures[0][1]})")
+    match_id = repo.create_match("Inscrições", "bench")
+    recorder.measure("bulk.assign_teams", len(created), repo.assign_teams, match_id, created)
+    return t_id
+
+
+def run_simulation(repo, recorder, num_teams, metrics=None):
+    t_id = repo.create_tournament("Simulação")
+    repo.create_teams([f"Time {i}" for i in range(num_teams)], t_id)
+    recorder.measure("simulation.run_tournament", num_teams, services.run_tournament_simulation,
+                     repo, t_id, "Simulação", lambda lines: None, metrics)
+    # Compactação: varre os totais do leaderboard (um por nome de time) e regrava o top N
+    recorder.measure("leaderboard.compact", num_teams, leaderboard.compact, repo)
+    return t_id
+
+
+def run_league(repo, recorder, num_teams, metrics=None):
+    """Pontos corridos: n·(n-1)/2 jogos gravados rodada a rodada."""
+    t_id = repo.create_tournament("Liga")
+    repo.create_teams([f"Time {i}" for i in range(num_teams)], t_id)
+    recorder.measure("simulation.round_robin", num_teams * (num_teams - 1) // 2, services.run_tournament_simulation,
+                     repo, t_id, "Liga", lambda lines: None, metrics, services.ROUND_ROBIN)
+    return t_id
+
+
+def run_cascade(repo, recorder, t_ids):
+    recorder.measure("cascade.delete_tournament", len(t_ids),
+                     lambda: [repo.delete_tournament(t_id) for t_id in t_ids])
+
+
+def connect(host, metrics=None):
+    # Import tardio: o backend em memória não precisa do driver
+    from cassandra.cluster import Cluster
+
+    from cassandra_repository import CassandraRepository
+    from config import load_config
+    from migrations import migrate
+    from statements import StatementRegistry
+
+    # Mesmos perfis de execução, compressão e concorrência da aplicação (config.py)
+    config = load_config(contact_points=host, keyspace=KEYSPACE)
+    cluster = Cluster(**config.cluster_options())
+    session = cluster.connect()
+    migrate(session, KEYSPACE)
+    statements = StatementRegistry(session, metrics=metrics, execution_profiles=True)
+    repo = CassandraRepository(session, statements, concurrency=config.concurrency)
+    repo.clear()
+    return cluster, session, repo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--backend", choices=["memory", "cassandra"], default="memory")
+    parser.add_argument("--host", help="contact points separados por vírgula (padrão: configuração)")
+    parser.add_argument("--ops", type=int, default=1000, help="operações por caso de CRUD")
+    parser.add_argument("--names", type=int, default=100000, help="nomes sorteados")
+    parser.add_argument("--bulk", type=int, default=10000, help="times criados em massa")
+    parser.add_argument("--sim-teams", type=int, default=10000, help="times na simulação")
+    parser.add_argument("--league-teams", type=int, default=500, help="times na simulação de pontos corridos")
+    parser.add_argument("--instrument", action="store_true",
+                        help="mede cada chamada (metrics.py) e inclui os histogramas no JSON")
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    args = parser.parse_args()
+
+    metrics = Metrics() if args.instrument else None
+    cluster = session = None
+    if args.backend == "cassandra":
+        cluster, session, repo = connect(args.host, metrics)
+    else:
+        repo = InMemoryRepository()
+    if metrics is not None:
+        repo = InstrumentedRepository(repo, metrics)
+
+    recorder = Recorder()
+    started = datetime.now(timezone.utc)
+    try:
+        t_ids = run_crud(repo, recorder, args.ops)
+        run_names(repo, recorder, args.names)
+        bulk_id = run_bulk(repo, recorder, args.bulk)
+        sim_id = run_simulation(repo, recorder, args.sim_teams, metrics)
+        league_id = run_league(repo, recorder, args.league_teams, metrics)
+        run_cascade(repo, recorder, [bulk_id, sim_id, league_id] + t_ids[:args.ops // 10])
+    finally:
+        if session is not None:
+            session.execute(f"DROP KEYSPACE {KEYSPACE}")
+            cluster.shutdown()
+
+    if args.output:
+        report = {
+            "backend": args.backend,
+            "started_at": started.isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "parameters": vars(args),
+            "results": recorder.results,
+        }
+        if metrics is not None:
+            report["metrics"] = metrics.snapshot()["stats"]
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Resultados gravados em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Inserção em massa de times.
+
+Os times são gravados concorrentemente com um limite de requisições em voo
+(execute_concurrent do driver). Na tabela teams cada time é uma partição
+diferente, então cada linha vai em sua própria requisição; em
+teams_by_tournament todas as linhas caem na mesma partição (tournament_id),
+então são agrupadas em batches UNLOGGED, que nesse caso são atômicos e
+baratos para o coordenador.
+"""
+import uuid
+
+from cassandra.concurrent import execute_concurrent
+from cassandra.query import BatchType
+
+DEFAULT_CONCURRENCY = 64
+DEFAULT_BATCH_SIZE = 50
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def write_concurrent(session, statements, name, params, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Executa o statement `name` uma vez para cada tupla de `params` (uma
+    partição por linha), com até `concurrency` requisições em voo.
+    Retorna uma lista de (parâmetros, exceção) das que falharam.
+    """
+    params = list(params)
+    statement = statements.get(name)
+    results = execute_concurrent(session, ((statement, row) for row in params), concurrency=concurrency,
+                                 raise_on_first_error=False, execution_profile=statements.profile(name))
+    return [(row, result) for row, (success, result) in zip(params, results) if not success]
+
+
+def write_partition_batches(session, statements, name, params, concurrency=DEFAULT_CONCURRENCY,
+                            batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Executa o statement `name` para cada tupla de `params` em batches UNLOGGED
+    de até `batch_size` linhas, com até `concurrency` batches em voo.
+
+    Só deve ser usado quando todas as linhas caem na mesma partição (é o que
+    torna o batch UNLOGGED correto). Retorna uma lista de (linhas, exceção)
+    dos batches que falharam.
+    """
+    chunks = list(_chunks(params, batch_size))
+    batches = (
+        (statements.batch([(name, row) for row in chunk], batch_type=BatchType.UNLOGGED), ())
+        for chunk in chunks
+    )
+    results = execute_concurrent(session, batches, concurrency=concurrency, raise_on_first_error=False,
+                                 execution_profile=statements.profile(name))
+    return [(chunk, result) for chunk, (success, result) in zip(chunks, results) if not success]
+
+
+def create_teams_bulk(session, statements, tournament_id, team_names,
+                      concurrency=DEFAULT_CONCURRENCY, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Cria todos os times de `team_names` no torneio `tournament_id`.
+
+    Retorna (criados, falhas): `criados` é uma lista de (team_id, nome) e
+    `falhas` uma lista de (nome, exceção). Uma falha isolada não interrompe
+    as demais linhas.
+    """
+    rows = [(str(uuid.uuid4()), name) for name in team_names]
+    failures = []
+
+    # 1) Linhas de teams: uma partição por time, executadas em paralelo
+    failed = write_concurrent(session, statements, "insert_team",
+                              [(team_id, name, False, tournament_id) for team_id, name in rows],
+                              concurrency=concurrency)
+    failed_ids = {params[0] for params, _ in failed}
+    failures.extend((params[1], error) for params, error in failed)
+    written = [row for row in rows if row[0] not in failed_ids]
+
+    # 2) Linhas de teams_by_tournament: mesma partição, batches UNLOGGED
+    failed = write_partition_batches(
+        session, statements, "insert_team_by_tournament",
+        [(tournament_id, team_id, name) for team_id, name in written],
+        concurrency=concurrency, batch_size=batch_size,
+    )
+    failed_ids = set()
+    for chunk, error in failed:
+        for _, team_id, name in chunk:
+            failed_ids.add(team_id)
+            failures.append((name, error))
+    created = [row for row in written if row[0] not in failed_ids]
+    orphans = [row for row in written if row[0] in failed_ids]
+
+    # Remove (melhor esforço) os times que ficaram fora do índice do torneio
+    if orphans:
+        write_concurrent(session, statements, "delete_team", [(team_id,) for team_id, _ in orphans],
+                         concurrency=concurrency)
+    return created, failures
@@ -0,0 +1,132 @@
+"""
+Exclusão em cascata por partição.
+
+Todas as exclusões são DELETEs de partição inteira (um tombstone por
+partição, em vez de um por linha), executadas concorrentemente. Os filhos de
+um torneio são encontrados pelas tabelas particionadas por torneio
+(teams_by_tournament e matches_by_tournament), sem varrer o cluster. As
+partições de índice e a linha do torneio só são removidas depois dos filhos,
+então uma exclusão interrompida pode ser repetida.
+
+clear_all usa o mesmo mecanismo em vez de TRUNCATE: varre as chaves de
+partição de cada tabela (SELECT DISTINCT, paginado) e remove partição a
+partição, sem exigir a coordenação de todo o cluster que o TRUNCATE exige.
+A exceção são os counters do leaderboard: um counter apagado com DELETE não
+volta a ser incrementado com segurança, então leaderboard_stats é truncada.
+"""
+from cassandra.concurrent import execute_concurrent
+
+from repository import FINISHED, WAITING
+from schema import status_bucket
+
+DEFAULT_CONCURRENCY = 64
+PROGRESS_EVERY = 500
+
+# (consulta que lista as chaves de partição, exclusão da partição), dos filhos para os pais
+SWEEPS = [
+    ("sweep_match_games", "delete_match_games_round"),
+    ("sweep_match_placements", "delete_match_placements"),
+    ("sweep_matches_by_status", "delete_matches_by_status"),
+    ("sweep_game_matches", "delete_match"),
+    ("sweep_teams", "delete_team"),
+    ("sweep_team_ratings", "delete_ratings_by_tournament"),
+    ("sweep_teams_by_tournament", "delete_teams_by_tournament"),
+    ("sweep_matches_by_tournament", "delete_matches_by_tournament"),
+    ("sweep_tournaments_by_name", "delete_tournaments_by_name"),
+    ("sweep_tournaments", "delete_tournament"),
+    ("sweep_leaderboard_ranking", "delete_leaderboard_ranking"),
+]
+
+
+class CascadeError(Exception):
+    """Algumas exclusões falharam; `errors` guarda as exceções recebidas."""
+
+    def __init__(self, errors):
+        super().__init__(f"{len(errors)} exclusões falharam (ex.: {errors[0]})")
+        self.errors = errors
+
+
+def _run_deletes(session, statements, deletes, concurrency, on_progress, done=0, total=None):
+    """
+    Executa a lista de pares (nome do statement, parâmetros) concorrentemente.
+    Retorna (quantidade executada, lista de exceções).
+    """
+    # Prepara tudo antes: o driver consome os statements nas threads de I/O, que não podem bloquear
+    prepared = {name: statements.get(name) for name in {name for name, _ in deletes}}
+    bound = ((prepared[name], params) for name, params in deletes)
+    errors = []
+    # Só exclusões: todas rodam no perfil de escrita
+    profile = statements.profile("delete_tournament")
+    for success, result in execute_concurrent(session, bound, concurrency=concurrency, raise_on_first_error=False,
+                                               results_generator=True, execution_profile=profile):
+        done += 1
+        if not success:
+            errors.append(result)
+        if on_progress is not None and done % PROGRESS_EVERY == 0:
+            on_progress(done, total)
+    return done, errors
+
+
+def delete_tournament(session, statements, tournament_id, on_progress=None, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Remove um torneio com seus times, ratings, partidas e jogos.
+    `on_progress(feitas, total)` é chamado periodicamente.
+    """
+    team_ids = [row.team_id for row in statements.execute("select_teams_by_tournament", (tournament_id,))]
+    matches = [(row.match_id, row.rounds or 0)
+               for row in statements.execute("select_matches_by_tournament", (tournament_id,))]
+
+    children = [("delete_team", (team_id,)) for team_id in team_ids]
+    for match_id, rounds in matches:
+        children.extend(("delete_match_games_round", (match_id, number)) for number in range(1, rounds + 1))
+        children.append(("delete_match_placements", (match_id,)))
+        children.append(("delete_match", (match_id,)))
+        # O status atual não é conhecido sem uma leitura: remove a entrada dos dois
+        children.extend(("delete_match_by_status", (status, status_bucket(match_id), match_id))
+                        for status in (WAITING, FINISHED))
+    parents = [
+        ("delete_teams_by_tournament", (tournament_id,)),
+        ("delete_ratings_by_tournament", (tournament_id,)),
+        ("delete_matches_by_tournament", (tournament_id,)),
+    ]
+    tournament = statements.execute("select_tournament", (tournament_id,)).one()
+    if tournament is not None:
+        parents.append(("delete_tournament_by_name", (tournament.name, tournament_id)))
+    total = len(children) + len(parents) + 1
+
+    done, errors = _run_deletes(session, statements, children, concurrency, on_progress, total=total)
+    if errors:
+        raise CascadeError(errors)
+    done, errors = _run_deletes(session, statements, parents, concurrency, on_progress, done, total)
+    if errors:
+        raise CascadeError(errors)
+    statements.execute("delete_tournament", (tournament_id,))
+    if on_progress is not None:
+        on_progress(total, total)
+    return total
+
+
+def clear_all(session, statements, on_progress=None, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Apaga todos os dados, partição a partição, varrendo as chaves de cada tabela.
+    `on_progress(feitas, None)` é chamado periodicamente (o total não é conhecido).
+    """
+    done = 0
+    errors = []
+    for scan, delete in SWEEPS:
+        keys = statements.execute(scan)
+        while True:
+            # Uma página de chaves por vez: memória constante, qualquer que seja o tamanho da tabela
+            page = [(delete, tuple(row)) for row in keys.current_rows]
+            done, failed = _run_deletes(session, statements, page, concurrency, on_progress, done)
+            errors.extend(failed)
+            if not keys.has_more_pages:
+                break
+            keys.fetch_next_page()
+    if errors:
+        raise CascadeError(errors)
+    statements.execute("truncate_leaderboard_stats")
+    done += 1
+    if on_progress is not None:
+        on_progress(done, done)
+    return done
@@ -0,0 +1,277 @@
+"""
+Repository sobre o Cassandra.
+
+Reúne as consultas que antes ficavam soltas no app.py: cada operação usa os
+prepared statements do StatementRegistry e, nos caminhos em massa, os módulos
+bulk (inserções concorrentes), assignment (escritas condicionais) e cascade
+(exclusões por partição).
+"""
+import uuid
+
+from assignment import assign_team, assign_teams
+from cassandra.concurrent import execute_concurrent
+from cassandra.query import BatchType
+
+from bulk import DEFAULT_CONCURRENCY, create_teams_bulk, write_concurrent, write_partition_batches
+from cascade import clear_all, delete_tournament
+from repository import DEFAULT_PAGE_SIZE, FINISHED, WAITING, Repository, Standing
+from schema import STATUS_BUCKETS, status_bucket
+from statements import StatementRegistry
+
+# Partição de leaderboard_ranking com o ranking geral
+LEADERBOARD_BOARD = "geral"
+
+
+class CassandraRepository(Repository):
+    """
+    Repository que grava em uma sessão do Cassandra já conectada ao keyspace.
+    `concurrency` limita as requisições em voo nas operações em massa.
+    """
+
+    def __init__(self, session, statements=None, concurrency=DEFAULT_CONCURRENCY):
+        self.session = session
+        self.statements = statements or StatementRegistry(session)
+        self.concurrency = concurrency
+
+    def _write_batches(self, name, params):
+        failed = write_partition_batches(self.session, self.statements, name, params, concurrency=self.concurrency)
+        if failed:
+            raise failed[0][1]
+
+    def _page(self, name, params, paging_state, page_size):
+        result = self.statements.execute_page(name, params, paging_state, page_size)
+        return result.current_rows, result.paging_state
+
+    # Torneios
+    def create_tournament(self, name):
+        t_id = str(uuid.uuid4())
+        self.statements.execute("insert_tournament", (t_id, name, False))
+        self.statements.execute("insert_tournament_by_name", (name, t_id))
+        return t_id
+
+    def list_tournaments(self):
+        rows = self.statements.execute("select_tournaments")
+        return [(row.id, row.name) for row in rows]
+
+    def get_tournament(self, tournament_id):
+        return self.statements.execute("select_tournament", (tournament_id,)).one()
+
+    def find_tournaments(self, name):
+        return [row.id for row in self.statements.execute("select_tournament_ids_by_name", (name,))]
+
+    def set_tournament_simulated(self, tournament_id, simulated=True):
+        self.statements.execute("update_tournament_simulated", (simulated, tournament_id))
+
+    def claim_tournament_simulation(self, tournament_id):
+        return self.statements.execute("claim_tournament_simulation", (tournament_id,)).was_applied
+
+    def list_tournaments_page(self, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        rows, paging_state = self._page("scan_tournaments", (), paging_state, page_size)
+        return [(row.id, row.name, row.simulated) for row in rows], paging_state
+
+    # Times
+    def create_team(self, name, tournament_id):
+        team_id = str(uuid.uuid4())
+        # Batch logged: as duas tabelas ficam consistentes mesmo em caso de falha
+        self.statements.execute_batch([
+            ("insert_team", (team_id, name, False, tournament_id)),
+            ("insert_team_by_tournament", (tournament_id, team_id, name)),
+        ])
+        return team_id
+
+    def create_teams(self, names, tournament_id):
+        return create_teams_bulk(self.session, self.statements, tournament_id, names, concurrency=self.concurrency)
+
+    def list_teams(self):
+        rows = self.statements.execute("select_teams")
+        return [(row.id, row.name) for row in rows]
+
+    def list_teams_by_tournament(self, tournament_id):
+        rows = self.statements.execute("select_teams_by_tournament", (tournament_id,))
+        return [(row.team_id, row.name) for row in rows]
+
+    def list_teams_page(self, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        rows, paging_state = self._page("select_teams_with_tournament", (), paging_state, page_size)
+        return [(row.id, row.name, row.tournament_id) for row in rows], paging_state
+
+    def _backfill(self, scan, insert, to_params, on_page):
+        """
+        Copia as linhas de `scan` para `insert`, uma página do driver por vez (memória
+        constante), chamando `on_page()` após cada página. `to_params(row)` devolve os
+        parâmetros do insert ou None para pular a linha. Retorna quantas linhas gravou.
+        """
+        result = self.statements.execute(scan)
+        count = 0
+        while True:
+            entries = [params for params in map(to_params, result.current_rows) if params is not None]
+            failed = write_concurrent(self.session, self.statements, insert, entries, concurrency=self.concurrency)
+            if failed:
+                raise failed[0][1]
+            count += len(entries)
+            if on_page is not None:
+                on_page()
+            if not result.has_more_pages:
+                return count
+            result.fetch_next_page()
+
+    def backfill_teams_by_tournament(self, on_page=None):
+        """
+        Preenche teams_by_tournament a partir da tabela teams (migração única);
+        retorna quantos times indexou. As escritas são upserts idempotentes, então
+        uma migração interrompida pode ser repetida do início.
+        """
+        return self._backfill("select_teams_with_tournament", "insert_team_by_tournament",
+                              lambda row: (row.tournament_id, row.id, row.name) if row.tournament_id else None,
+                              on_page)
+
+    def backfill_matches_by_status(self, on_page=None):
+        """Preenche matches_by_status a partir de game_matches (migração única); retorna quantas partidas indexou."""
+        return self._backfill("select_match_statuses", "insert_match_by_status",
+                              lambda row: (row.status, status_bucket(row.id), row.id) if row.status else None,
+                              on_page)
+
+    def backfill_tournaments_by_name(self, on_page=None):
+        """Preenche tournaments_by_name a partir de tournaments (migração única); retorna quantos torneios indexou."""
+        return self._backfill("scan_tournaments", "insert_tournament_by_name",
+                              lambda row: (row.name, row.id) if row.name is not None else None, on_page)
+
+    def get_ratings(self, tournament_id):
+        rows = self.statements.execute("select_ratings_by_tournament", (tournament_id,))
+        return {row.team_id: row.rating for row in rows}
+
+    def save_ratings(self, tournament_id, ratings):
+        # Todas as linhas na partição do torneio: batches UNLOGGED
+        self._write_batches("upsert_rating", [(tournament_id, team_id, rating) for team_id, rating in ratings])
+
+    # Partidas
+    def create_match(self, title, description, tournament_id=None):
+        match_id = str(uuid.uuid4())
+        self.statements.execute("insert_match", (match_id, title, description, WAITING, []))
+        self.statements.execute("insert_match_by_status", (WAITING, status_bucket(match_id), match_id))
+        if tournament_id:
+            self.statements.execute("insert_match_by_tournament", (tournament_id, match_id, 0))
+        return match_id
+
+    def list_matches(self):
+        rows = self.statements.execute("select_matches")
+        return [(row.id, row.title, row.description, row.status, row.teams) for row in rows]
+
+    def list_matches_page(self, status=None, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        if status:
+            return self._list_matches_by_status(status, paging_state, page_size)
+        rows, paging_state = self._page("select_matches", (), paging_state, page_size)
+        return [(row.id, row.title, row.description, row.status, row.teams) for row in rows], paging_state
+
+    def _list_matches_by_status(self, status, paging_state, page_size):
+        """
+        Percorre as partições (status, bucket) em ordem; o paging_state é (bucket, paging_state
+        do driver). As partidas da página são lidas por id, concorrentemente.
+        """
+        bucket, driver_state = paging_state or (0, None)
+        match_ids = []
+        while bucket < STATUS_BUCKETS and len(match_ids) < page_size:
+            result = self.statements.execute_page("select_match_ids_by_status", (status, bucket), driver_state,
+                                                  page_size - len(match_ids))
+            match_ids.extend(row.match_id for row in result.current_rows)
+            driver_state = result.paging_state
+            if driver_state is None:
+                bucket += 1
+        select_match = self.statements.get("select_match")
+        results = execute_concurrent(self.session, ((select_match, (match_id,)) for match_id in match_ids),
+                                     concurrency=self.concurrency,
+                                     execution_profile=self.statements.profile("select_match"))
+        rows = []
+        for match_id, (_, result) in zip(match_ids, results):
+            row = result.one()
+            # Entrada em transição (finish_match em andamento) ou partida já removida: ignorada
+            if row is not None and row.status == status:
+                rows.append((match_id, row.title, row.description, row.status, row.teams))
+        return rows, (bucket, driver_state) if bucket < STATUS_BUCKETS else None
+
+    def get_match(self, match_id):
+        return self.statements.execute("select_match", (match_id,)).one()
+
+    def finish_match(self, match_id, ranking_lines):
+        bucket = status_bucket(match_id)
+        self.statements.execute("update_match_result", (FINISHED, ranking_lines, match_id))
+        self.statements.execute("insert_match_by_status", (FINISHED, bucket, match_id))
+        self.statements.execute("delete_match_by_status", (WAITING, bucket, match_id))
+
+    def set_match_rounds(self, tournament_id, match_id, rounds):
+        self.statements.execute("insert_match_by_tournament", (tournament_id, match_id, rounds))
+
+    def list_tournament_matches(self, tournament_id):
+        rows = self.statements.execute("select_matches_by_tournament", (tournament_id,))
+        return [(row.match_id, row.rounds or 0) for row in rows]
+
+    def delete_match(self, match_id):
+        self.statements.execute("delete_match_placements", (match_id,))
+        self.statements.execute("delete_match", (match_id,))
+        for status in (WAITING, FINISHED):
+            self.statements.execute("delete_match_by_status", (status, status_bucket(match_id), match_id))
+
+    def save_round_games(self, simulation_id, round_number, games):
+        # Uma partição por rodada: batches UNLOGGED concorrentes
+        self._write_batches("insert_match_game", [(simulation_id, round_number) + tuple(game) for game in games])
+
+    def list_round_games(self, simulation_id, round_number, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        rows, paging_state = self._page("select_match_games", (simulation_id, round_number),
+                                        paging_state, page_size)
+        return [(row.game, row.team1, row.team2, row.winner) for row in rows], paging_state
+
+    def save_placements(self, simulation_id, teams):
+        # Uma partição por simulação: batches UNLOGGED concorrentes
+        self._write_batches("insert_match_placement",
+                            [(simulation_id, place, team) for place, team in enumerate(teams, start=1)])
+
+    def list_placements(self, simulation_id, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        rows, paging_state = self._page("select_match_placements", (simulation_id,), paging_state, page_size)
+        return [(row.place, row.team) for row in rows], paging_state
+
+    def assign_team(self, match_id, team_id, team_name=None):
+        return assign_team(self.statements, match_id, team_id, team_name)
+
+    def assign_teams(self, match_id, teams):
+        return assign_teams(self.session, self.statements, match_id, teams, concurrency=self.concurrency)
+
+    # Leaderboard
+    def update_leaderboard(self, increments):
+        # Um UPDATE de counter por time (partições distintas), concorrentes. Counters não são
+        # idempotentes: o driver não repete os que falham, e a primeira falha é propagada
+        failed = write_concurrent(self.session, self.statements, "update_leaderboard_stats",
+                                  [(titles, games, wins, placement, team)
+                                   for team, titles, games, wins, placement in increments],
+                                  concurrency=self.concurrency)
+        if failed:
+            raise failed[0][1]
+
+    def scan_leaderboard(self):
+        # Varredura paginada pelo driver: quem chama consome sem carregar a tabela inteira
+        return (Standing(row.team, row.tournaments or 0, row.titles or 0, row.games or 0, row.wins or 0,
+                         row.placements or 0)
+                for row in self.statements.execute("scan_leaderboard_stats"))
+
+    def save_leaderboard_ranking(self, standings, compacted_at):
+        # Uma partição só: o batch substitui o ranking inteiro de forma atômica e isolada
+        entries = [("upsert_leaderboard_compacted_at", (LEADERBOARD_BOARD, compacted_at))]
+        entries.extend(("upsert_leaderboard_position", (LEADERBOARD_BOARD, position) + tuple(standing))
+                       for position, standing in enumerate(standings, start=1))
+        entries.append(("delete_leaderboard_positions_after", (LEADERBOARD_BOARD, len(standings))))
+        self.statements.execute_batch(entries, batch_type=BatchType.UNLOGGED)
+
+    def get_leaderboard_ranking(self, limit):
+        rows = list(self.statements.execute("select_leaderboard_ranking", (LEADERBOARD_BOARD, limit)))
+        if not rows:
+            return [], None
+        # Sem posições, a partição devolve uma única linha só com a coluna estática
+        standings = [Standing(row.team, row.tournaments, row.titles, row.games, row.wins, row.placements)
+                     for row in rows if row.position is not None]
+        return standings, rows[0].compacted_at
+
+    # Manutenção
+    def delete_tournament(self, tournament_id, on_progress=None):
+        return delete_tournament(self.session, self.statements, tournament_id, on_progress=on_progress,
+                                 concurrency=self.concurrency)
+
+    def clear(self, on_progress=None):
+        return clear_all(self.session, self.statements, on_progress=on_progress, concurrency=self.concurrency)
@@ -0,0 +1,101 @@
+"""
+Catálogo de torneios em memória.
+
+Mantém o mapa nome -> id e a lista de nomes exibida no menu, evitando um
+`SELECT id, name FROM tournaments` a cada clique. O catálogo é atualizado
+incrementalmente pelas operações locais (criar/deletar) e recarregado por
+completo quando expira (TTL) ou quando refresh() é chamado, para enxergar
+mudanças feitas por outros clientes.
+"""
+import threading
+import time
+
+DEFAULT_TTL = 60.0
+
+
+class TournamentCatalog:
+    """Cache de (id, nome) dos torneios com recarga sob demanda."""
+
+    def __init__(self, loader, ttl=DEFAULT_TTL, clock=time.monotonic):
+        """
+        `loader` é uma função sem argumentos que retorna uma lista de (id, nome);
+        `ttl` é o tempo em segundos até a próxima recarga (None = nunca expira).
+        """
+        self._loader = loader
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._names = {}      # id -> nome, na ordem de inserção
+        self._ids = {}        # nome -> id (primeiro torneio com o nome)
+        self._loaded_at = None
+
+    def refresh(self):
+        """Recarrega o catálogo inteiro a partir do banco."""
+        tournaments = self._loader()
+        with self._lock:
+            self._names = {}
+            self._ids = {}
+            for t_id, name in tournaments:
+                self._insert(t_id, name)
+            self._loaded_at = self._clock()
+
+    def is_stale(self):
+        if self._loaded_at is None:
+            return True
+        return self.ttl is not None and self._clock() - self._loaded_at >= self.ttl
+
+    def ensure_fresh(self):
+        """Recarrega o catálogo se ainda não foi carregado ou se o TTL expirou."""
+        if self.is_stale():
+            self.refresh()
+
+    def names(self):
+        """Nomes dos torneios, na ordem em que foram carregados/criados."""
+        self.ensure_fresh()
+        with self._lock:
+            return list(self._names.values())
+
+    def items(self):
+        """Lista de (id, nome) dos torneios."""
+        self.ensure_fresh()
+        with self._lock:
+            return list(self._names.items())
+
+    def id_for(self, name):
+        """
+        Retorna o id do torneio com o nome informado, ou None.
+        Se o nome não estiver no cache, recarrega uma vez (pode ter sido criado por outro cliente).
+        """
+        self.ensure_fresh()
+        with self._lock:
+            t_id = self._ids.get(name)
+        if t_id is None:
+            self.refresh()
+            with self._lock:
+                t_id = self._ids.get(name)
+        return t_id
+
+    def add(self, t_id, name):
+        with self._lock:
+            self._insert(t_id, name)
+
+    def remove(self, t_id):
+        with self._lock:
+            name = self._names.pop(t_id, None)
+            if name is not None and self._ids.get(name) == t_id:
+                del self._ids[name]
+                # Outro torneio com o mesmo nome passa a responder por ele
+                for other_id, other_name in self._names.items():
+                    if other_name == name:
+                        self._ids[name] = other_id
+                        break
+
+    def clear(self):
+        with self._lock:
+            self._names = {}
+            self._ids = {}
+            self._loaded_at = self._clock()
+
+    def _insert(self, t_id, name):
+        self._names[t_id] = name
+        self._ids.setdefault(name, t_id)
@@ -0,0 +1,294 @@
+"""
+Linha de comando do Game Manager (sem interface gráfica).
+
+Só importa o driver e conecta quando o comando usa o banco, e não carrega o
+tkinter. Uso (na raiz do projeto):
+    python cli.py tournaments
+    python cli.py migrate
+    python cli.py create-tournament "Copa"
+    python cli.py generate-teams Copa 1000
+    python cli.py simulate Copa
+    python cli.py simulate Liga --format round-robin --quiet
+    python cli.py release-simulation Copa     (simulação interrompida: libera o torneio)
+    python cli.py export Copa --format csv --output copa.csv
+    python cli.py import times.csv            (retomável: repita o comando após uma falha)
+    python cli.py export-table teams --format jsonl --output teams.jsonl
+    python cli.py leaderboard --top 20
+    python cli.py leaderboard --compact     (ex.: agendado no cron)
+
+Torneios podem ser informados pelo nome ou pelo id. Códigos de saída: 1 para
+erros do comando, 2 para configuração inválida e 3 para falhas do banco
+(sem conexão, timeout ou migração).
+"""
+import argparse
+import csv
+import json
+import sys
+
+from config import load_config
+from database import Database
+
+
+def resolve_tournament(repo, reference):
+    """Retorna (id, nome) do torneio com esse id ou nome (ValueError se não existir ou for ambíguo)."""
+    tournament = repo.get_tournament(reference)
+    if tournament is not None:
+        return tournament.id, tournament.name
+    found = repo.find_tournaments(reference)
+    if not found:
+        raise ValueError(f"Torneio não encontrado: {reference}")
+    if len(found) > 1:
+        raise ValueError(f"Há {len(found)} torneios chamados '{reference}'; informe o id.")
+    return found[0], reference
+
+
+def cmd_tournaments(db, args):
+    for t_id, name in db.repo.list_tournaments():
+        print(f"{t_id}\t{name}")
+
+
+def cmd_migrate(db, args):
+    from migrations import current_version
+
+    session = db.session  # conecta e aplica as migrações pendentes (salvo com --no-schema)
+    print(f"versão do schema: {current_version(session, db.keyspace)}")
+    if db.applied_migrations:
+        print("migrações aplicadas agora: " + ", ".join(map(str, db.applied_migrations)))
+
+
+def cmd_create_tournament(db, args):
+    print(db.repo.create_tournament(args.name))
+
+
+def cmd_generate_teams(db, args):
+    import services
+    from names import NameGenerator
+
+    t_id, _ = resolve_tournament(db.repo, args.tournament)
+    created, failures = services.generate_random_teams(db.repo, NameGenerator(), args.count, t_id)
+    print(f"{len(created)} times criados")
+    if failures:
+        print(f"{len(failures)} falharam (ex.: {failures[0][1]})", file=sys.stderr)
+        return 1
+
+
+def cmd_simulate(db, args):
+    import services
+
+    t_id, name = resolve_tournament(db.repo, args.tournament)
+    on_log = (lambda lines: None) if args.quiet else (lambda lines: print("\n".join(lines), flush=True))
+    ranking_lines, _ = services.run_tournament_simulation(db.repo, t_id, name, on_log, db.metrics,
+                                                          args.format, args.rounds)
+    if args.quiet:
+        print("\n".join(ranking_lines[:args.top]))
+
+
+def cmd_release_simulation(db, args):
+    import services
+
+    t_id, _ = resolve_tournament(db.repo, args.tournament)
+    removed = services.release_simulation(db.repo, t_id)
+    print(f"torneio liberado para simulação ({removed} partidas interrompidas removidas)")
+
+
+def cmd_export(db, args):
+    from ratings import DEFAULT_RATING
+
+    t_id, name = resolve_tournament(db.repo, args.tournament)
+    ratings = db.repo.get_ratings(t_id)
+    teams = [(team_id, team_name, ratings.get(team_id, DEFAULT_RATING))
+             for team_id, team_name in db.repo.list_teams_by_tournament(t_id)]
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.format == "csv":
+            writer = csv.writer(out)
+            writer.writerow(["team_id", "name", "rating"])
+            writer.writerows(teams)
+        else:
+            tournament = db.repo.get_tournament(t_id)
+            json.dump({
+                "id": t_id,
+                "name": name,
+                "simulated": bool(tournament and tournament.simulated),
+                "teams": [{"id": team_id, "name": team_name, "rating": rating} for team_id, team_name, rating in teams],
+            }, out, ensure_ascii=False, indent=2)
+            out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def cmd_import(db, args):
+    import transfer
+
+    on_progress = None if args.quiet else (lambda count: print(f"{count} registros gravados", flush=True))
+    try:
+        result = transfer.import_file(db.repo, args.file, args.format, args.checkpoint, args.chunk_size,
+                                      on_progress, db.metrics)
+    except transfer.TransferError as exc:
+        print(f"Erro: {exc}; repita o comando para retomar do registro {exc.offset + 1}", file=sys.stderr)
+        return 1
+    except Exception as exc:
+        # Falhas do driver no meio de um bloco: o checkpoint também permite retomar
+        message = database_error_message(exc)
+        if message is None:
+            raise
+        state = transfer.load_checkpoint(args.checkpoint or f"{args.file}.checkpoint")
+        offset = state["offset"] if state else 0
+        print(f"{message}; repita o comando para retomar do registro {offset + 1}", file=sys.stderr)
+        return 3
+    print(f"{result.records} registros: {result.tournaments} torneios e {result.teams} times criados")
+
+
+def cmd_export_table(db, args):
+    import transfer
+
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        count = transfer.export_table(db.repo, args.table, out, args.format, args.page_size)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{count} linhas exportadas", file=sys.stderr)
+
+
+def cmd_leaderboard(db, args):
+    import leaderboard
+
+    if args.compact:
+        standings = leaderboard.compact(db.repo)[:args.top]
+        compacted_at = None
+    else:
+        standings, compacted_at = leaderboard.top_teams(db.repo, args.top)
+    print("\n".join(leaderboard.format_standings(standings)))
+    if args.compact:
+        return
+    if compacted_at is None:
+        print("(ranking ainda não compactado: rode leaderboard --compact)")
+    elif leaderboard.is_stale(compacted_at, args.max_age):
+        print(f"(compactado em {compacted_at:%Y-%m-%d %H:%M:%S} UTC; desatualizado: rode leaderboard --compact)")
+    else:
+        print(f"(compactado em {compacted_at:%Y-%m-%d %H:%M:%S} UTC)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--config", help="arquivo INI de configuração (veja config.py)")
+    parser.add_argument("--host", action="append", help="contact point (pode repetir; padrão: configuração)")
+    parser.add_argument("--keyspace", help="keyspace (padrão: configuração)")
+    parser.add_argument("--no-schema", action="store_true",
+                        help="não confere a versão do schema (o keyspace já está migrado)")
+    parser.add_argument("--metrics", metavar="ARQUIVO", help="grava as métricas da execução em JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("tournaments", help="lista os torneios").set_defaults(run=cmd_tournaments)
+    commands.add_parser("migrate", help="aplica as migrações pendentes e mostra a versão do schema") \
+        .set_defaults(run=cmd_migrate)
+
+    p = commands.add_parser("create-tournament", help="cria um torneio e imprime o id")
+    p.add_argument("name")
+    p.set_defaults(run=cmd_create_tournament)
+
+    p = commands.add_parser("generate-teams", help="cria times com nomes sorteados")
+    p.add_argument("tournament")
+    p.add_argument("count", type=int)
+    p.set_defaults(run=cmd_generate_teams)
+
+    p = commands.add_parser("simulate", help="simula o torneio e grava o resultado")
+    p.add_argument("tournament")
+    p.add_argument("--quiet", action="store_true", help="imprime só as primeiras colocações")
+    p.add_argument("--top", type=int, default=10, help="colocações impressas com --quiet")
+    p.add_argument("--format", choices=["knockout", "round-robin", "swiss"], default="knockout",
+                   help="mata-mata, pontos corridos ou suíço")
+    p.add_argument("--rounds", type=int, help="rodadas do suíço (padrão: log2 da quantidade de times)")
+    p.set_defaults(run=cmd_simulate)
+
+    p = commands.add_parser("release-simulation",
+                            help="libera um torneio cuja simulação foi interrompida (nenhuma pode estar em andamento)")
+    p.add_argument("tournament")
+    p.set_defaults(run=cmd_release_simulation)
+
+    p = commands.add_parser("export", help="exporta os times do torneio com os ratings")
+    p.add_argument("tournament")
+    p.add_argument("--format", choices=["json", "csv"], default="json")
+    p.add_argument("--output", help="arquivo de saída (padrão: saída padrão)")
+    p.set_defaults(run=cmd_export)
+
+    p = commands.add_parser("import", help="importa torneios e times de um CSV/JSONL (veja transfer.py)")
+    p.add_argument("file")
+    p.add_argument("--format", choices=["csv", "jsonl"], help="padrão: pela extensão do arquivo")
+    p.add_argument("--checkpoint", help="arquivo de checkpoint (padrão: <arquivo>.checkpoint)")
+    p.add_argument("--chunk-size", type=int, default=1000, help="registros gravados por bloco")
+    p.add_argument("--quiet", action="store_true", help="não mostra o progresso")
+    p.set_defaults(run=cmd_import)
+
+    p = commands.add_parser("export-table", help="exporta uma tabela inteira, página a página")
+    p.add_argument("table", choices=["tournaments", "teams", "matches"])
+    p.add_argument("--format", choices=["csv", "jsonl"], default="jsonl")
+    p.add_argument("--output", help="arquivo de saída (padrão: saída padrão)")
+    p.add_argument("--page-size", type=int, default=1000, help="linhas por requisição (fetch_size)")
+    p.set_defaults(run=cmd_export_table)
+
+    p = commands.add_parser("leaderboard", help="mostra o ranking geral entre torneios")
+    p.add_argument("--top", type=int, default=10, help="posições exibidas")
+    p.add_argument("--compact", action="store_true", help="refaz o ranking compactado a partir dos totais")
+    p.add_argument("--max-age", type=float, default=300,
+                   help="segundos até o ranking compactado ser exibido como desatualizado")
+    p.set_defaults(run=cmd_leaderboard)
+    return parser
+
+
+def database_error_message(exc):
+    """
+    Mensagem de uma linha para erros do driver e das migrações, ou None se `exc`
+    não for um deles. Os imports são tardios: só acontecem quando algo falha.
+    """
+    from cassandra import DriverException, OperationTimedOut
+    from cassandra.cluster import NoHostAvailable
+
+    from migrations import MigrationError
+
+    if isinstance(exc, NoHostAvailable):
+        return f"Erro de conexão: {exc.args[0] if exc.args else 'nenhum nó disponível'}"
+    if isinstance(exc, OperationTimedOut):
+        return "Erro: tempo esgotado aguardando o Cassandra."
+    if isinstance(exc, DriverException):
+        detail = str(exc).splitlines()[0] if str(exc) else type(exc).__name__
+        return f"Erro do Cassandra: {detail}"
+    if isinstance(exc, MigrationError):
+        return f"Erro na migração: {exc}"
+    return None
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    metrics = None
+    if args.metrics:
+        from metrics import Metrics
+        metrics = Metrics()
+    try:
+        config = load_config(args.config, contact_points=",".join(args.host) if args.host else None,
+                             keyspace=args.keyspace)
+    except (OSError, ValueError) as exc:
+        print(f"Erro na configuração: {exc}", file=sys.stderr)
+        return 2
+    db = Database(config, metrics=metrics, ensure_schema=not args.no_schema)
+    try:
+        return args.run(db, args) or 0
+    except ValueError as exc:
+        print(f"Erro: {exc}", file=sys.stderr)
+        return 1
+    except Exception as exc:
+        message = database_error_message(exc)
+        if message is None:
+            raise
+        print(message, file=sys.stderr)
+        return 3
+    finally:
+        db.shutdown()
+        if metrics is not None:
+            metrics.dump(args.metrics)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Configuração da conexão com o Cassandra: arquivo INI e variáveis de ambiente.
+
+Precedência: variáveis de ambiente > arquivo > padrões. O arquivo é o
+indicado em GAME_MANAGER_CONFIG ou, se existir, ./game_manager.ini:
+
+    [cassandra]
+    contact_points = 10.0.0.1, 10.0.0.2
+    local_dc = dc1
+    compression = lz4
+    protocol_version = 4
+
+    [profile.listing]
+    consistency = LOCAL_ONE
+    timeout = 5
+
+Cada chave de [cassandra] pode vir do ambiente como GAME_MANAGER_<CHAVE>
+(ex.: GAME_MANAGER_LOCAL_DC) e cada chave de perfil como
+GAME_MANAGER_PROFILE_<PERFIL>_<CHAVE> (ex.: GAME_MANAGER_PROFILE_WRITE_TIMEOUT).
+
+Perfis de execução (usados pelo StatementRegistry conforme a consulta):
+- default: leituras pontuais e leituras que alimentam gravações;
+- listing: listas e varreduras da interface, com consistência baixa e timeout curto;
+- write: todas as gravações (inclusive as das simulações e as em massa).
+Os três usam roteamento token-aware sobre DCAwareRoundRobinPolicy.
+"""
+import configparser
+import os
+
+DEFAULT_FILE = "game_manager.ini"
+ENV_PREFIX = "GAME_MANAGER_"
+
+DEFAULTS = {
+    "contact_points": "127.0.0.1",
+    "port": "9042",
+    "keyspace": "game_manager",
+    "local_dc": "",  # vazio: o DC do primeiro nó contatado
+    "remote_hosts_per_dc": "0",
+    "token_aware": "true",
+    "compression": "auto",  # auto, none, lz4 ou snappy
+    "protocol_version": "",  # vazio: negociado com o servidor
+    "connect_timeout": "5",
+    "executor_threads": "2",
+    "concurrency": "64",  # requisições em voo nas operações em massa
+}
+
+PROFILE_DEFAULTS = {
+    "default": {"consistency": "LOCAL_QUORUM", "serial_consistency": "", "timeout": "10"},
+    "listing": {"consistency": "LOCAL_ONE", "serial_consistency": "", "timeout": "5"},
+    "write": {"consistency": "LOCAL_QUORUM", "serial_consistency": "LOCAL_SERIAL", "timeout": "30"},
+}
+
+
+class Config:
+    """Valores já convertidos; cluster_options() monta os argumentos do Cluster."""
+
+    def __init__(self, values, profiles):
+        self.contact_points = [host.strip() for host in values["contact_points"].split(",") if host.strip()]
+        self.port = int(values["port"])
+        self.keyspace = values["keyspace"]
+        self.local_dc = values["local_dc"] or None
+        self.remote_hosts_per_dc = int(values["remote_hosts_per_dc"])
+        self.token_aware = values["token_aware"].lower() in ("1", "true", "yes", "on")
+        self.compression = values["compression"].lower()
+        self.protocol_version = int(values["protocol_version"]) if values["protocol_version"] else None
+        self.connect_timeout = float(values["connect_timeout"])
+        self.executor_threads = int(values["executor_threads"])
+        self.concurrency = int(values["concurrency"])
+        self.profiles = profiles
+        if self.compression not in ("auto", "none", "lz4", "snappy"):
+            raise ValueError(f"compression inválida: {self.compression} (use auto, none, lz4 ou snappy)")
+
+    def load_balancing_policy(self):
+        from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
+
+        policy = DCAwareRoundRobinPolicy(local_dc=self.local_dc, used_hosts_per_remote_dc=self.remote_hosts_per_dc)
+        return TokenAwarePolicy(policy) if self.token_aware else policy
+
+    def execution_profiles(self):
+        from cassandra import ConsistencyLevel
+        from cassandra.cluster import EXEC_PROFILE_DEFAULT, ExecutionProfile
+
+        profiles = {}
+        for name, values in self.profiles.items():
+            serial = values["serial_consistency"]
+            # Uma política por perfil: o driver inicializa cada uma com os nós do cluster
+            profiles[EXEC_PROFILE_DEFAULT if name == "default" else name] = ExecutionProfile(
+                load_balancing_policy=self.load_balancing_policy(),
+                consistency_level=ConsistencyLevel.name_to_value[values["consistency"].upper()],
+                serial_consistency_level=ConsistencyLevel.name_to_value[serial.upper()] if serial else None,
+                request_timeout=float(values["timeout"]),
+            )
+        return profiles
+
+    def cluster_options(self):
+        """Argumentos para cassandra.cluster.Cluster (perfis de execução, compressão, protocolo...)."""
+        options = {
+            "contact_points": self.contact_points,
+            "port": self.port,
+            "execution_profiles": self.execution_profiles(),
+            "compression": {"auto": True, "none": False}.get(self.compression, self.compression),
+            "connect_timeout": self.connect_timeout,
+            "executor_threads": self.executor_threads,
+        }
+        if self.protocol_version is not None:
+            options["protocol_version"] = self.protocol_version
+        return options
+
+
+def load_config(path=None, environ=None, **overrides):
+    """
+    Lê o arquivo (`path`, GAME_MANAGER_CONFIG ou ./game_manager.ini, se existir) e o ambiente.
+    `overrides` (ex.: contact_points="10.0.0.1") têm precedência sobre tudo; None é ignorado.
+    """
+    environ = os.environ if environ is None else environ
+    parser = configparser.ConfigParser()
+    path = path or environ.get(ENV_PREFIX + "CONFIG")
+    if path:
+        with open(path, encoding="utf-8") as f:
+            parser.read_file(f)
+    elif os.path.exists(DEFAULT_FILE):
+        parser.read(DEFAULT_FILE, encoding="utf-8")
+
+    def resolve(defaults, section, env_prefix):
+        values = dict(defaults)
+        if parser.has_section(section):
+            values.update((key, value) for key, value in parser.items(section) if key in defaults)
+        for key in defaults:
+            env_value = environ.get(env_prefix + key.upper())
+            if env_value is not None:
+                values[key] = env_value
+        return values
+
+    values = resolve(DEFAULTS, "cassandra", ENV_PREFIX)
+    values.update((key, str(value)) for key, value in overrides.items() if value is not None)
+    profiles = {name: resolve(defaults, f"profile.{name}", f"{ENV_PREFIX}PROFILE_{name.upper()}_")
+                for name, defaults in PROFILE_DEFAULTS.items()}
+    return Config(values, profiles)
@@ -0,0 +1,94 @@
+"""
+Conexão preguiçosa com o Cassandra.
+
+Criar um Database não faz nada: o driver só é importado, o Cluster só é
+conectado, o schema só é garantido e o repositório só é montado no primeiro
+acesso a `repo` (ou `session`), na thread que precisar dele. Assim a janela
+aparece antes da conexão e a CLI só conecta quando o comando usa o banco.
+O schema é conferido com uma leitura de versão (migrations.py), sem DDL
+quando já está em dia.
+"""
+import threading
+
+from config import load_config
+
+
+class Database:
+    """Cluster, sessão e repositório criados sob demanda (uma única vez, com lock)."""
+
+    def __init__(self, config=None, metrics=None, ensure_schema=True):
+        """
+        `config` (config.Config, padrão: load_config()) define nós, perfis de execução e
+        compressão; `metrics` (metrics.Metrics) instrumenta consultas e chamadas ao
+        repositório; com `ensure_schema=False` as migrações (migrations.py) não são
+        verificadas (o keyspace precisa existir).
+        """
+        self.config = config if config is not None else load_config()
+        self.keyspace = self.config.keyspace
+        self.metrics = metrics
+        self.ensure_schema = ensure_schema
+        self.applied_migrations = []
+        self.cluster = None
+        self._session = None
+        self._repo = None
+        self._lock = threading.Lock()
+
+    @property
+    def connected(self):
+        return self._repo is not None
+
+    @property
+    def session(self):
+        self._ensure_connected()
+        return self._session
+
+    @property
+    def repo(self):
+        self._ensure_connected()
+        return self._repo
+
+    def _ensure_connected(self):
+        if self._repo is None:
+            with self._lock:
+                if self._repo is None:
+                    self._connect()
+
+    def _connect(self):
+        # Imports tardios: o driver custa centenas de ms só para importar
+        from cassandra.cluster import Cluster
+
+        from cassandra_repository import CassandraRepository
+        from metrics import InstrumentedRepository, driver_metrics_available
+        from migrations import migrate
+        from statements import TIMEOUT_ERRORS, StatementRegistry
+
+        metrics = self.metrics
+        cluster = Cluster(metrics_enabled=metrics is not None and driver_metrics_available(),
+                          **self.config.cluster_options())
+        try:
+            session = cluster.connect()
+            if self.ensure_schema:
+                # Uma leitura de schema_version; DDL só se faltar alguma migração
+                self.applied_migrations = migrate(session, self.keyspace)
+            else:
+                session.set_keyspace(self.keyspace)
+        except Exception:
+            # Sem isso as threads de I/O e o pool do Cluster ficariam abertos a cada nova tentativa
+            cluster.shutdown()
+            raise
+
+        statements = StatementRegistry(session, metrics=metrics, execution_profiles=True)
+        repo = CassandraRepository(session, statements, concurrency=self.config.concurrency)
+        if metrics is not None:
+            # As exceções de timeout do driver só são conhecidas depois do import
+            metrics.timeout_errors = metrics.timeout_errors or TIMEOUT_ERRORS
+            metrics.attach_cluster(cluster)
+            repo = InstrumentedRepository(repo, metrics)
+        self.cluster, self._session, self._repo = cluster, session, repo
+
+    def shutdown(self):
+        """Fecha a conexão, se ela chegou a ser aberta."""
+        with self._lock:
+            if self.cluster is not None:
+                self.cluster.shutdown()
+            self.cluster = self._session = self._repo = None
@@ -0,0 +1,101 @@
+"""
+Leaderboard entre torneios: totais por time e ranking compactado.
+
+Ao fim de cada simulação gravada (services.run_tournament_simulation), cada
+time do torneio soma +1 torneio, o título (se venceu), jogos, vitórias e a
+colocação obtida. No Cassandra são counters em leaderboard_stats, uma
+partição por time: nenhuma leitura é necessária, só um UPDATE por time,
+executados concorrentemente.
+
+O top N não varre os totais: é lido de uma única partição
+(leaderboard_ranking) com as RANKING_SIZE primeiras posições já ordenadas.
+compact() refaz essa partição com uma varredura dos totais que mantém só um
+heap de N entradas (O(times · log N), memória O(N)). A varredura percorre a
+tabela inteira, então nunca roda na leitura: top_teams() devolve o ranking
+gravado como está, e a compactação é agendada com `cli.py leaderboard
+--compact`. Quem exibe o ranking usa is_stale() para avisar quando a última
+compactação tem mais de MAX_AGE segundos.
+
+Os times são identificados pelo nome (os ids são de cada torneio). Excluir
+um torneio não desconta seus resultados; zerar o banco apaga o leaderboard.
+"""
+import heapq
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+RANKING_SIZE = 100  # posições guardadas no ranking compactado
+MAX_AGE = 300  # segundos até o ranking compactado ser exibido como desatualizado
+DEFAULT_TOP = 10
+
+
+def utcnow():
+    """Hora atual em UTC sem fuso (o formato que o driver devolve para colunas timestamp)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def average_placement(standing):
+    return standing.placements / standing.tournaments if standing.tournaments else None
+
+
+def _order(standing):
+    # Mais títulos, mais vitórias, melhor colocação média; o nome desempata
+    return -standing.titles, -standing.wins, average_placement(standing) or 0, standing.team
+
+
+class Tally:
+    """Conta jogos e vitórias de cada posição rodada a rodada e monta os incrementos da simulação."""
+
+    def __init__(self):
+        self.games = Counter()
+        self.wins = Counter()
+        self._increments = []
+
+    def add_round(self, record):
+        """Soma os jogos de um bracket.RoundRecord (o bye não conta como jogo)."""
+        for a, b, winner in record.games():
+            self.games[a] += 1
+            self.games[b] += 1
+            self.wins[winner] += 1
+
+    def finish(self, ranking, names):
+        """Registra o ranking final (posições, da melhor para a pior) com os nomes de cada posição."""
+        self._increments = [(names[p], int(place == 1), self.games[p], self.wins[p], place)
+                            for place, p in enumerate(ranking, start=1)]
+
+    def increments(self):
+        """(time, títulos, jogos, vitórias, colocação) de cada time, para Repository.update_leaderboard."""
+        return self._increments
+
+
+def rank(standings, limit=RANKING_SIZE):
+    """As `limit` melhores Standing de um iterável, ordenadas, sem ordenar o iterável inteiro."""
+    return heapq.nsmallest(limit, standings, key=_order)
+
+
+def compact(repo, limit=RANKING_SIZE, now=None):
+    """Refaz o ranking compactado a partir dos totais; retorna as Standing gravadas."""
+    ranking = rank(repo.scan_leaderboard(), limit)
+    repo.save_leaderboard_ranking(ranking, now or utcnow())
+    return ranking
+
+
+def top_teams(repo, limit=DEFAULT_TOP):
+    """
+    Retorna (primeiras `limit` Standing, compacted_at), lidas do ranking compactado como
+    está; compacted_at é None se ele nunca foi compactado. `limit` acima de RANKING_SIZE
+    é limitado a RANKING_SIZE.
+    """
+    return repo.get_leaderboard_ranking(min(limit, RANKING_SIZE))
+
+
+def is_stale(compacted_at, max_age=MAX_AGE, now=None):
+    """True se o ranking nunca foi compactado ou a compactação tem mais de `max_age` segundos."""
+    return compacted_at is None or (now or utcnow()) - compacted_at > timedelta(seconds=max_age)
+
+
+def format_standings(standings):
+    """Linhas de texto de uma tabela de classificação (posição, time, totais e colocação média)."""
+    yield f"{'#':>4}  {'Time':<32} {'torneios':>8} {'títulos':>7} {'jogos':>7} {'vitórias':>8} {'col. média':>10}"
+    for position, standing in enumerate(standings, start=1):
+        yield (f"{position:>4}  {standing.team[:32]:<32} {standing.tournaments:>8} {standing.titles:>7} "
+               f"{standing.games:>7} {standing.wins:>8} {average_placement(standing) or 0:>10.2f}")
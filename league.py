@@ -0,0 +1,237 @@
+"""
+Motores de pontos corridos (round-robin) e sistema suíço, sem acesso ao banco.
+
+Seguem as convenções de bracket.py: times são posições 0..n-1, cada rodada é
+decidida de uma vez por `decide(left, right, rng)` (máscara de bytes, 1 =
+vence o time da esquerda) e entregue a `on_round` como um
+bracket.RoundRecord, então a mesma gravação por rodada, os mesmos ratings
+(ratings.py) e o mesmo leaderboard servem aos três formatos. Cada vitória
+vale 1 ponto; não há empates.
+
+Pontos corridos: cada time enfrenta todos os outros (n·(n-1)/2 jogos). As
+rodadas são geradas sob demanda pelo método do círculo (uma posição fixa e
+as demais girando), em O(n) por rodada: a tabela completa nunca fica em
+memória.
+
+Suíço: a cada rodada os times são ordenados por pontos (O(n log n)) e
+emparelhados com o vizinho mais próximo na classificação que ainda não
+enfrentaram (variante Monrad), o que mantém os pares dentro do mesmo grupo
+de pontos sempre que possível. Quando o fim da tabela fica sem par válido, o
+emparelhamento volta atrás e refaz os pares anteriores (busca em
+profundidade com limite de passos); revanches só acontecem se não houver
+alternativa dentro do limite. Com número ímpar, o pior colocado que ainda
+não folgou recebe o bye (vale 1 ponto). O desempate final é o Buchholz
+(soma dos pontos dos adversários).
+"""
+import math
+import random
+from itertools import compress
+
+from bracket import RoundRecord, coin_flip, draw_order
+
+
+class LeagueResult:
+    """Resultado de um formato por pontos: tudo indexado por posição em `team_ids`."""
+
+    __slots__ = ("team_ids", "points", "ranking", "num_rounds")
+
+    def __init__(self, team_ids, points, ranking, num_rounds):
+        self.team_ids = team_ids
+        self.points = points    # pontos de cada posição
+        self.ranking = ranking  # posições, da melhor para a pior
+        self.num_rounds = num_rounds
+
+    @property
+    def champion(self):
+        return self.ranking[0]
+
+    def ranked_ids(self):
+        """Ids dos times na ordem final de classificação."""
+        ids = self.team_ids
+        return [ids[p] for p in self.ranking]
+
+
+def circle_rounds(n):
+    """
+    Gera (bye, left, right) de cada rodada de um turno de pontos corridos entre
+    as posições 0..n-1 (n - 1 rodadas, ou n com n ímpar). Cada rodada é montada
+    só quando pedida, em O(n).
+    """
+    if n < 2:
+        raise ValueError("O torneio deve ter pelo menos 2 times para simulação.")
+    size = n + (n & 1)  # com n ímpar, a posição fantasma n indica o bye
+    ring = size - 1
+    half = size // 2
+    for number in range(ring):
+        # Assento 0 fixo; os demais giram uma casa por rodada
+        seats = [0]
+        seats += [1 + (k + number) % ring for k in range(ring)]
+        left = seats[:half]
+        right = seats[:half - 1:-1]
+        if number & 1:
+            # Alterna o lado do time fixo (mando) a cada rodada
+            left[0], right[0] = right[0], left[0]
+        bye = None
+        if size != n:
+            ghost = left.index(n) if n in left else right.index(n)
+            bye = right[ghost] if left[ghost] == n else left[ghost]
+            del left[ghost], right[ghost]
+        yield bye, left, right
+
+
+def _play(number, bye, left, right, points, decide, rng, on_round):
+    left_wins = decide(left, right, rng)
+    for position in compress(left, left_wins):
+        points[position] += 1
+    for position, won in zip(right, left_wins):
+        if not won:
+            points[position] += 1
+    if on_round is not None:
+        on_round(RoundRecord(number, None, bye, left, right, left_wins))
+    return left_wins
+
+
+def simulate_round_robin(team_ids, seed=None, rng=None, decide=coin_flip, on_round=None, legs=1, shuffle=True):
+    """
+    Simula pontos corridos com qualquer quantidade de times (mínimo 2), em
+    `legs` turnos (no returno os lados se invertem). O ranking é por pontos;
+    empates ficam na ordem do sorteio inicial da tabela.
+    `seed`, `rng`, `decide`, `on_round` e `shuffle` como em bracket.simulate_knockout.
+    """
+    n = len(team_ids)
+    if rng is None:
+        rng = random.Random(seed)
+    order = draw_order(n, rng) if shuffle else list(range(n))
+    points = [0] * n
+    number = 0
+    for leg in range(legs):
+        for bye, left, right in circle_rounds(n):
+            left = [order[seat] for seat in left]
+            right = [order[seat] for seat in right]
+            if leg & 1:
+                left, right = right, left
+            number += 1
+            _play(number, None if bye is None else order[bye], left, right, points, decide, rng, on_round)
+    ranking = sorted(order, key=lambda p: -points[p])
+    return LeagueResult(team_ids, points, ranking, number)
+
+
+def swiss_rounds(n):
+    """Quantidade padrão de rodadas do suíço: log2(n), arredondado para cima."""
+    return max(1, math.ceil(math.log2(n)))
+
+
+def _pair(order, opponents, max_steps=None):
+    """
+    Emparelha `order` (já classificado) de cima para baixo: o primeiro time sem par
+    enfrenta o próximo da lista que ele ainda não enfrentou. Se algum time fica sem
+    adversário possível, desfaz o último par e tenta o candidato seguinte
+    (backtracking). Como os conflitos costumam aparecer só no fim da tabela, o custo
+    fica perto de O(n); depois de `max_steps` passos (padrão: 64·n) desiste e usa
+    _pair_greedy, que aceita revanches.
+    """
+    size = len(order)
+    if max_steps is None:
+        max_steps = 64 * size + 1024
+    used = bytearray(size)
+    pairs = []  # (i, k): order[i] enfrenta order[k], com i < k
+    i = start = steps = 0
+    while True:
+        while i < size and used[i]:
+            i += 1
+        if i == size:
+            break
+        played = opponents[order[i]]
+        k = start if start > i else i + 1
+        while k < size and (used[k] or order[k] in played):
+            k += 1
+        steps += 1
+        if k < size:
+            used[i] = used[k] = 1
+            pairs.append((i, k))
+            start = 0
+            continue
+        if not pairs or steps > max_steps:
+            return _pair_greedy(order, opponents)
+        # Sem adversário para order[i]: refaz o último par com o candidato seguinte
+        i, k = pairs.pop()
+        used[i] = used[k] = 0
+        start = k + 1
+    return [order[i] for i, _ in pairs], [order[k] for _, k in pairs]
+
+
+def _pair_greedy(order, opponents):
+    """
+    Emparelhamento guloso, sem voltar atrás: cada time enfrenta o primeiro que está
+    esperando e que ele ainda não enfrentou. Os times que sobram na fila (todos já
+    se enfrentaram) jogam entre si: revanche.
+    """
+    left, right = [], []
+    waiting = []
+    for team in order:
+        played = opponents[team]
+        for i, candidate in enumerate(waiting):
+            if candidate not in played:
+                del waiting[i]
+                left.append(candidate)
+                right.append(team)
+                break
+        else:
+            waiting.append(team)
+    left += waiting[0::2]
+    right += waiting[1::2]
+    return left, right
+
+
+def simulate_swiss(team_ids, rounds=None, seed=None, rng=None, decide=coin_flip, on_round=None, shuffle=True):
+    """
+    Simula `rounds` rodadas do sistema suíço (padrão: swiss_rounds(n)) com
+    qualquer quantidade de times (mínimo 2). O ranking é por pontos e depois
+    por Buchholz; empates restantes ficam na ordem do sorteio inicial.
+    `seed`, `rng`, `decide`, `on_round` e `shuffle` como em bracket.simulate_knockout.
+    """
+    n = len(team_ids)
+    if n < 2:
+        raise ValueError("O torneio deve ter pelo menos 2 times para simulação.")
+    rounds = swiss_rounds(n) if rounds is None else rounds
+    if rounds < 1:
+        raise ValueError("O suíço precisa de pelo menos 1 rodada.")
+    if rng is None:
+        rng = random.Random(seed)
+    order = draw_order(n, rng) if shuffle else list(range(n))
+    seed_rank = [0] * n
+    for rank, position in enumerate(order):
+        seed_rank[position] = rank
+    points = [0] * n
+    opponents = [set() for _ in range(n)]
+    had_bye = bytearray(n)
+
+    for number in range(1, rounds + 1):
+        order.sort(key=lambda p: (-points[p], seed_rank[p]))
+        bye = None
+        if n & 1:
+            # O pior colocado que ainda não folgou (todos já folgaram: o último)
+            index = next((i for i in range(n - 1, -1, -1) if not had_bye[order[i]]), n - 1)
+            bye = order[index]
+            had_bye[bye] = 1
+            points[bye] += 1
+        left, right = _pair([p for p in order if p != bye], opponents)
+        for a, b in zip(left, right):
+            opponents[a].add(b)
+            opponents[b].add(a)
+        _play(number, bye, left, right, points, decide, rng, on_round)
+
+    buchholz = [sum(points[o] for o in opponents[p]) for p in range(n)]
+    ranking = sorted(range(n), key=lambda p: (-points[p], -buchholz[p], seed_rank[p]))
+    return LeagueResult(team_ids, points, ranking, rounds)
+
+
+def format_league_round(record, names, max_games=None):
+    """Linhas do log de uma rodada; com mais de `max_games` jogos, só o resumo."""
+    games = len(record.left)
+    yield f"Rodada {record.number}: {games} jogos"
+    if record.bye is not None:
+        yield f"Equipe com bye: {names[record.bye]}"
+    if max_games is None or games <= max_games:
+        for a, b, winner in record.games():
+            yield f"Jogo: {names[a]} vs {names[b]} -> Vencedor: {names[winner]}"
@@ -0,0 +1,248 @@
+"""
+Instrumentação: histogramas de latência, erros, timeouts e linhas retornadas.
+
+Cada medição tem um nome ("cql.select_match", "repo.create_teams",
+"simulation.round", ...) e cai em um histograma de buckets fixos (série
+1-2-5 de 10 µs a 50 s), então registrar custa O(log buckets) e a memória não
+cresce com a quantidade de chamadas. Os percentis são estimados pelo limite
+superior do bucket.
+
+Fontes das medições:
+- StatementRegistry (statements.py): cada consulta executada por nome, com
+  rastreamento (tracing) do Cassandra em uma fração sorteada das requisições;
+- InstrumentedRepository: cada chamada ao Repository, em qualquer backend;
+- phase(): trechos de código, como as fases da simulação (services.py).
+
+snapshot() devolve tudo como um dicionário pronto para JSON (inclusive as
+métricas do próprio driver, se `metrics_enabled` estiver ativo), e
+PeriodicDump grava esse JSON periodicamente.
+"""
+import bisect
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+
+BUCKETS = tuple(m * 10.0 ** e for e in range(-5, 2) for m in (1, 2, 5))  # 10 µs .. 50 s
+MAX_TRACES = 50
+
+
+class LatencyHistogram:
+    """Contagem de durações (em segundos) por bucket, com mínimo, máximo e soma."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # o último bucket é o de estouro
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q):
+        """Estimativa do percentil `q` (0..1): limite superior do bucket, limitado ao máximo."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return min(BUCKETS[index], self.max) if index < len(BUCKETS) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": {f"{bound:g}": count for bound, count in zip(BUCKETS + (float("inf"),), self.counts) if count},
+        }
+
+
+class _Stats:
+    __slots__ = ("latency", "errors", "timeouts", "rows")
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        self.timeouts = 0
+        self.rows = 0
+
+    def to_dict(self):
+        data = self.latency.to_dict()
+        data.update(errors=self.errors, timeouts=self.timeouts, rows=self.rows)
+        return data
+
+
+class Metrics:
+    """
+    Registro de medições, seguro para várias threads (inclusive as de I/O do driver).
+
+    `timeout_errors` são as exceções contadas como timeout (além de erro) e
+    `trace_rate` é a fração das consultas executadas com tracing.
+    """
+
+    def __init__(self, timeout_errors=(), trace_rate=0.0, rng=None):
+        self.timeout_errors = tuple(timeout_errors)
+        self.trace_rate = trace_rate
+        self.rng = rng or random.Random()
+        self.cluster = None
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self._traces = deque(maxlen=MAX_TRACES)
+            self._started = time.monotonic()
+
+    def attach_cluster(self, cluster):
+        """Inclui no snapshot as métricas do driver (se o Cluster foi criado com metrics_enabled)."""
+        self.cluster = cluster
+
+    def record(self, name, seconds, rows=None, error=None):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _Stats()
+            stats.latency.add(seconds)
+            if rows:
+                stats.rows += rows
+            if error is not None:
+                stats.errors += 1
+                if isinstance(error, self.timeout_errors):
+                    stats.timeouts += 1
+
+    @contextmanager
+    def timer(self, name):
+        """Mede o bloco `with`; uma exceção é registrada como erro e propagada."""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as exc:
+            self.record(name, time.perf_counter() - start, error=exc)
+            raise
+        self.record(name, time.perf_counter() - start)
+
+    def should_trace(self):
+        return self.trace_rate > 0 and self.rng.random() < self.trace_rate
+
+    def add_trace(self, name, trace_ids):
+        """Guarda os ids de trace (consultáveis em system_traces) das últimas consultas rastreadas."""
+        with self._lock:
+            for trace_id in trace_ids:
+                self._traces.append((name, str(trace_id)))
+
+    def snapshot(self):
+        with self._lock:
+            data = {
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "uptime": time.monotonic() - self._started,
+                "stats": {name: stats.to_dict() for name, stats in sorted(self._stats.items())},
+                "traces": [{"name": name, "trace_id": trace_id} for name, trace_id in self._traces],
+            }
+        driver = getattr(self.cluster, "metrics", None)
+        if driver is not None:
+            data["driver"] = driver.get_stats()
+        return data
+
+    def dump(self, path):
+        """Grava o snapshot em `path` (via arquivo temporário, para nunca deixar um JSON pela metade)."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2, default=str)
+        os.replace(tmp, path)
+
+
+def driver_metrics_available():
+    """True se o driver pode coletar métricas (Cluster(metrics_enabled=True) exige o pacote scales)."""
+    try:
+        import cassandra.metrics  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def phase(metrics, name):
+    """metrics.timer(name), ou um contexto vazio se `metrics` for None."""
+    return metrics.timer(name) if metrics is not None else nullcontext()
+
+
+def _row_count(result):
+    """Linhas retornadas por uma chamada ao Repository (listas, dicts e páginas (linhas, estado))."""
+    if isinstance(result, (list, dict)):
+        return len(result)
+    if isinstance(result, tuple) and result and isinstance(result[0], list):
+        return len(result[0])
+    return None
+
+
+class InstrumentedRepository:
+    """Envolve um Repository e mede cada chamada como "repo.<método>"."""
+
+    def __init__(self, repo, metrics):
+        self.repo = repo
+        self.metrics = metrics
+
+    def __getattr__(self, name):
+        attr = getattr(self.repo, name)
+        if not callable(attr) or name.startswith("_"):
+            return attr
+        label = f"repo.{name}"
+        metrics = self.metrics
+
+        def call(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = attr(*args, **kwargs)
+            except Exception as exc:
+                metrics.record(label, time.perf_counter() - start, error=exc)
+                raise
+            metrics.record(label, time.perf_counter() - start, rows=_row_count(result))
+            return result
+
+        return call
+
+
+class PeriodicDump:
+    """Grava metrics.dump(path) a cada `interval` segundos em uma thread daemon."""
+
+    def __init__(self, metrics, path, interval=30):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-dump", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.metrics.dump(self.path)
+            except OSError:
+                pass  # disco cheio ou caminho inválido: tenta de novo no próximo ciclo
+
+    def stop(self):
+        """Interrompe a thread e grava uma última vez."""
+        self._stop.set()
+        self._thread.join()
+        self.metrics.dump(self.path)
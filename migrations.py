@@ -0,0 +1,137 @@
+"""
+Aplicação das migrações de schema (schema.MIGRATIONS) com controle de versão.
+
+Na partida, uma única leitura da linha 'current' de schema_version diz qual
+migração foi a última aplicada. Se estiver em dia (o caso comum), nenhum DDL
+é executado. Caso contrário, o cliente pega um lock (INSERT ... IF NOT
+EXISTS com TTL, para um cliente que morreu não travar os outros), relê a
+versão e aplica só as migrações que faltam, gravando a versão após cada uma.
+Antes de cada passo o lock é renovado (UPDATE ... USING TTL ... IF owner), e
+as migrações de dados o renovam também a cada página copiada, de modo que o
+TTL só precisa cobrir um passo de DDL ou uma página; se ele expirou e outro
+cliente o pegou, a migração para com MigrationError em vez de correr junto.
+Clientes que encontram o lock ocupado esperam o dono terminar.
+
+Só a primeira execução em um cluster novo cria o keyspace e a própria
+tabela schema_version sem lock; as duas operações usam IF NOT EXISTS.
+"""
+import time
+import uuid
+
+from cassandra import ConsistencyLevel
+from cassandra.protocol import ConfigurationException, InvalidRequest
+from cassandra.query import SimpleStatement
+
+from schema import KEYSPACE, MIGRATIONS
+
+LOCK_TTL = 300  # segundos até um lock abandonado expirar (renovado a cada passo e página)
+LOCK_WAIT = 120  # segundos esperando o lock de outro cliente
+POLL_INTERVAL = 1.0
+
+CURRENT = "current"
+LOCK = "lock"
+
+
+class MigrationError(Exception):
+    """O schema não pôde ser atualizado (lock não obtido ou migração com erro)."""
+
+
+def _table(keyspace):
+    return f"{keyspace}.schema_version"
+
+
+def current_version(session, keyspace=KEYSPACE, consistency=ConsistencyLevel.LOCAL_ONE):
+    """Versão aplicada no keyspace: 0 se nunca migrado, None se o keyspace ou a tabela não existem."""
+    query = SimpleStatement(f"SELECT version FROM {_table(keyspace)} WHERE id = %s", consistency_level=consistency)
+    try:
+        row = session.execute(query, (CURRENT,)).one()
+    except (InvalidRequest, ConfigurationException):
+        return None
+    return row.version if row and row.version is not None else 0
+
+
+def _bootstrap(session, keyspace, replication_factor):
+    session.execute(f"""
+        CREATE KEYSPACE IF NOT EXISTS {keyspace}
+        WITH replication = {{'class': 'SimpleStrategy', 'replication_factor': '{replication_factor}'}}
+    """)
+    session.execute(f"""
+        CREATE TABLE IF NOT EXISTS {_table(keyspace)} (
+            id text PRIMARY KEY,
+            version int,
+            description text,
+            owner text,
+            applied_at timestamp
+        )
+    """)
+
+
+def _acquire_lock(session, keyspace, owner, target, lock_wait):
+    """Espera o lock; retorna False se outro cliente levou o schema à última versão enquanto isso."""
+    acquire = f"INSERT INTO {_table(keyspace)} (id, owner, applied_at) VALUES (%s, %s, toTimestamp(now())) " \
+              f"IF NOT EXISTS USING TTL {LOCK_TTL}"
+    deadline = time.monotonic() + lock_wait
+    while True:
+        if session.execute(acquire, (LOCK, owner)).was_applied:
+            return True
+        if current_version(session, keyspace, ConsistencyLevel.QUORUM) >= target:
+            return False
+        if time.monotonic() > deadline:
+            raise MigrationError(f"Lock de migração ocupado há mais de {lock_wait} s em {_table(keyspace)}")
+        time.sleep(POLL_INTERVAL)
+
+
+def _renew_lock(session, keyspace, owner):
+    """Estende o TTL do lock; MigrationError se ele expirou e não é mais deste cliente."""
+    renew = f"UPDATE {_table(keyspace)} USING TTL {LOCK_TTL} SET owner = %s, applied_at = toTimestamp(now()) " \
+            f"WHERE id = %s IF owner = %s"
+    if not session.execute(renew, (owner, LOCK, owner)).was_applied:
+        raise MigrationError(f"Lock de migração perdido em {_table(keyspace)} (expirou após {LOCK_TTL} s)")
+
+
+def migrate(session, keyspace=KEYSPACE, replication_factor=1, migrations=MIGRATIONS, lock_wait=LOCK_WAIT):
+    """
+    Leva o keyspace à última versão e o seleciona na sessão.
+    Retorna os números das migrações aplicadas por esta chamada (vazio no caso comum).
+    """
+    version = current_version(session, keyspace)
+    if version is None:
+        _bootstrap(session, keyspace, replication_factor)
+        version = 0
+    applied = []
+    target = migrations[-1].version
+    if version < target:
+        owner = str(uuid.uuid4())
+        if _acquire_lock(session, keyspace, owner, target, lock_wait):
+            try:
+                # Relê sob o lock: outro cliente pode ter migrado entre a primeira leitura e o lock
+                version = current_version(session, keyspace, ConsistencyLevel.QUORUM)
+                session.set_keyspace(keyspace)
+                for migration in migrations:
+                    if migration.version <= version:
+                        continue
+                    _apply(session, keyspace, migration, owner)
+                    applied.append(migration.version)
+            finally:
+                session.execute(f"DELETE FROM {_table(keyspace)} WHERE id = %s IF owner = %s", (LOCK, owner))
+    session.set_keyspace(keyspace)
+    return applied
+
+
+def _apply(session, keyspace, migration, owner):
+    def renew():
+        _renew_lock(session, keyspace, owner)
+
+    for step in migration.steps:
+        renew()
+        try:
+            if callable(step):
+                step(session, renew)
+            else:
+                session.execute(step)  # o driver espera o acordo de schema após cada DDL
+        except Exception as exc:
+            raise MigrationError(f"Migração {migration.version} ({migration.description}) falhou: {exc}") from exc
+    session.execute(
+        f"INSERT INTO {_table(keyspace)} (id, version, description, applied_at) VALUES (%s, %s, %s, toTimestamp(now()))",
+        (CURRENT, migration.version, migration.description),
+    )
@@ -0,0 +1,112 @@
+"""
+Modo Monte Carlo: muitas simulações knockout do mesmo torneio de uma vez.
+
+Segue o chaveamento de bracket.py (bye sorteado em rodadas ímpares, ranking
+pela rodada de eliminação), mas cada rodada é resolvida para todas as
+réplicas juntas com arrays NumPy de formato (réplicas, times). O desempate
+entre times eliminados na mesma rodada é diferente: bracket.py os ordena pela
+posição no chaveamento, e aqui o desempate é aleatório, para que nenhuma
+posição do sorteio leve vantagem nas frequências. Cada jogo é decidido pelos
+ratings Elo dos times (ratings.win_probability), fixos durante as réplicas.
+Nada é gravado no Cassandra: o resultado é uma matriz time x colocação com as
+frequências observadas.
+"""
+import numpy as np
+
+# Limite de elementos (réplicas x times) processados por bloco
+DEFAULT_CHUNK_ELEMENTS = 4_000_000
+
+
+class MonteCarloResult:
+    """Contagens de colocação por time: position_counts[time, colocação - 1]."""
+
+    def __init__(self, position_counts, replicates):
+        self.position_counts = position_counts
+        self.replicates = replicates
+
+    @property
+    def probabilities(self):
+        """Matriz time x colocação com a probabilidade de cada time terminar em cada posição."""
+        return self.position_counts / self.replicates
+
+    @property
+    def championship_odds(self):
+        """Probabilidade de cada time ser campeão."""
+        return self.position_counts[:, 0] / self.replicates
+
+    def expected_position(self):
+        """Colocação média de cada time (considerando só as colocações acompanhadas)."""
+        places = np.arange(1, self.position_counts.shape[1] + 1)
+        return (self.probabilities * places).sum(axis=1)
+
+
+def _simulate_chunk(ratings, replicates, rng):
+    """Simula `replicates` chaveamentos e retorna a ordem final (réplicas x times)."""
+    num_teams = len(ratings)
+    rows = np.arange(replicates)
+    current = rng.permuted(np.tile(np.arange(num_teams, dtype=np.int32), (replicates, 1)), axis=1)
+    elimination_round = np.zeros((replicates, num_teams), dtype=np.int16)
+    number = 1
+
+    while current.shape[1] > 1:
+        bye = None
+        if current.shape[1] & 1:
+            # Troca a coluna sorteada de cada réplica com a última e a remove
+            picked = rng.integers(0, current.shape[1], size=replicates)
+            bye = current[rows, picked]
+            current[rows, picked] = current[:, -1]
+            current = current[:, :-1]
+
+        left = current[:, 0::2]
+        right = current[:, 1::2]
+        # P(esquerda vence) = 1 / (1 + 10^((r_direita - r_esquerda) / 400)), jogo a jogo
+        left_wins = rng.random(left.shape) < 1.0 / (1.0 + 10.0 ** ((ratings[right] - ratings[left]) / 400.0))
+        winners = np.where(left_wins, left, right)
+        losers = np.where(left_wins, right, left)
+        elimination_round[rows[:, None], losers] = number
+
+        current = winners if bye is None else np.concatenate((bye[:, None], winners), axis=1)
+        number += 1
+
+    elimination_round[rows, current[:, 0]] = number
+    # Mais rodadas = melhor colocação; a parte fracionária desempata aleatoriamente
+    keys = elimination_round + rng.random(elimination_round.shape)
+    return np.argsort(-keys, axis=1)
+
+
+def simulate_knockout_replicates(num_teams, replicates, seed=None, positions=None,
+                                 chunk_elements=DEFAULT_CHUNK_ELEMENTS, ratings=None):
+    """
+    Executa `replicates` simulações knockout independentes de `num_teams` times.
+
+    `ratings` traz o rating Elo de cada posição (padrão: todos iguais, ou seja,
+    cada jogo é 50/50).
+
+    `positions` limita quantas colocações são acompanhadas (padrão: todas),
+    para que a matriz de contagens caiba em memória em torneios grandes.
+    Retorna um MonteCarloResult indexado pela posição do time (0..n-1).
+    """
+    if num_teams < 2:
+        raise ValueError("O torneio deve ter pelo menos 2 times para simulação.")
+    if replicates < 1:
+        raise ValueError("O número de simulações deve ser positivo.")
+    if ratings is None:
+        ratings = np.zeros(num_teams)
+    ratings = np.asarray(ratings, dtype=np.float64)
+    if len(ratings) != num_teams:
+        raise ValueError("É preciso um rating para cada time.")
+    positions = num_teams if positions is None else min(positions, num_teams)
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(num_teams * positions, dtype=np.int64)
+    chunk = max(1, chunk_elements // num_teams)
+
+    done = 0
+    while done < replicates:
+        size = min(chunk, replicates - done)
+        order = _simulate_chunk(ratings, size, rng)[:, :positions]
+        # order[r, p] = time na colocação p da réplica r -> índice linear time * positions + p
+        flat = order.astype(np.int64) * positions + np.arange(positions)
+        counts += np.bincount(flat.ravel(), minlength=num_teams * positions)
+        done += size
+
+    return MonteCarloResult(counts.reshape(num_teams, positions), replicates)
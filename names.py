@@ -0,0 +1,81 @@
+"""
+Gerador de nomes de times por sorteio de índices.
+
+O espaço de nomes é o produto adjetivo x substantivo x padrão x sufixo x
+número, mas nunca é materializado: cada nome corresponde a um índice inteiro
+(decomposto em base mista) e o gerador sorteia índices, descartando colisões
+com um conjunto de nomes já usados. Gerar k nomes custa O(k) em tempo e
+memória, independente do tamanho do espaço.
+
+Os índices sem número vêm primeiro; a numeração ("Cyber Knights 7") só entra
+quando a quantidade pedida não cabe folgada no espaço sem números.
+"""
+import random
+
+DEFAULT_ADJECTIVES = ["Cyber", "Quantum", "Digital", "Neo", "Synth", "Virtual", "AI", "Alpha", "Nova", "Cosmic", "Galactic", "Pixel", "Binary", "Electro", "Fusion", "Radical", "Mystic", "Vortex", "Epic", "Prime", "Legendary", "Infinite"]
+DEFAULT_NOUNS = ["Knights", "Titans", "Gladiators", "Rangers", "Warriors", "Dynamos", "Phantoms", "Legends", "Storm", "Dragons", "Vikings", "Pirates", "Samurais", "Renegades", "Nomads", "Outlaws", "Saviors", "Defenders", "Champions", "Conquerors", "Invincibles"]
+DEFAULT_PATTERNS = ["{adj} {noun}", "{adj} {noun} FC", "{noun} of {adj}"]
+DEFAULT_SUFFIXES = [""]
+DEFAULT_MAX_NUMBER = 9999
+
+
+class NameGenerator:
+    """Sorteia nomes únicos em um espaço combinatório sem materializá-lo."""
+
+    def __init__(self, adjectives=None, nouns=None, patterns=None, suffixes=None, max_number=DEFAULT_MAX_NUMBER):
+        self.adjectives = list(adjectives or DEFAULT_ADJECTIVES)
+        self.nouns = list(nouns or DEFAULT_NOUNS)
+        self.patterns = list(patterns or DEFAULT_PATTERNS)
+        self.suffixes = list(suffixes or DEFAULT_SUFFIXES)
+        self.max_number = max_number
+        # Tamanho de um "nível" de numeração (todas as combinações sem número)
+        self.base_size = len(self.adjectives) * len(self.nouns) * len(self.patterns) * len(self.suffixes)
+
+    def __len__(self):
+        return self.base_size * (self.max_number + 1)
+
+    def name_at(self, index):
+        """Nome correspondente ao índice (0 <= index < len(self))."""
+        number, index = divmod(index, self.base_size)
+        index, suffix = divmod(index, len(self.suffixes))
+        index, pattern = divmod(index, len(self.patterns))
+        adjective, noun = divmod(index, len(self.nouns))
+        name = self.patterns[pattern].format(adj=self.adjectives[adjective], noun=self.nouns[noun])
+        name += self.suffixes[suffix]
+        return f"{name} {number}" if number else name
+
+    def sample(self, count, existing=(), rng=None):
+        """
+        Retorna `count` nomes distintos que não estão em `existing` (um set, de preferência).
+        Levanta ValueError se o espaço não comportar tantos nomes novos.
+        """
+        rng = rng or random
+        existing = existing if isinstance(existing, (set, frozenset)) else set(existing)
+        if count > len(self) - len(existing):
+            raise ValueError("Poucas opções disponíveis para nomes únicos. Considere resetar os times.")
+
+        # Sorteia só entre os primeiros níveis, com folga de 2x para manter as colisões raras
+        needed = 2 * (count + len(existing))
+        limit = min(len(self), -(-needed // self.base_size) * self.base_size)
+        if 2 * (count + len(existing)) > limit:
+            # Espaço quase cheio: percorre uma permutação do intervalo em vez de sortear às cegas
+            candidates = (self.name_at(i) for i in rng.sample(range(limit), limit))
+            names = []
+            for name in candidates:
+                if name not in existing:
+                    names.append(name)
+                    if len(names) == count:
+                        break
+            return names
+
+        chosen = set()
+        names = []
+        while len(names) < count:
+            index = rng.randrange(limit)
+            if index in chosen:
+                continue
+            chosen.add(index)
+            name = self.name_at(index)
+            if name not in existing:
+                names.append(name)
+        return names
@@ -0,0 +1,130 @@
+"""
+Ratings Elo dos times.
+
+Cada time tem um rating (padrão 1500). A probabilidade de A vencer B é
+1 / (1 + 10^((rB - rA) / 400)) e, após cada jogo, o vencedor ganha
+K * (1 - P(vencedor)) pontos e o perdedor perde o mesmo valor.
+
+RatingTable guarda os ratings por posição (0..n-1, as mesmas posições usadas
+por bracket.py e league.py) e decide/atualiza uma rodada inteira de uma vez:
+com NumPy instalado as contas são vetorizadas; sem ele, caem para Python puro.
+"""
+import random
+
+from bracket import simulate_knockout
+from league import simulate_round_robin, simulate_swiss
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele as contas são feitas em Python puro
+    np = None
+
+DEFAULT_RATING = 1500.0
+K_FACTOR = 32.0
+
+
+def win_probability(rating_a, rating_b):
+    """Probabilidade de um time com `rating_a` vencer um com `rating_b`."""
+    return 1.0 / (1.0 + 10.0 ** ((rating_b - rating_a) / 400.0))
+
+
+def elo_update(winner_rating, loser_rating, k_factor=K_FACTOR):
+    """Retorna (novo rating do vencedor, novo rating do perdedor)."""
+    delta = k_factor * (1.0 - win_probability(winner_rating, loser_rating))
+    return winner_rating + delta, loser_rating - delta
+
+
+class RatingTable:
+    """Ratings indexados por posição, com decisão e atualização por rodada."""
+
+    def __init__(self, ratings, k_factor=K_FACTOR):
+        self.k_factor = k_factor
+        self.ratings = np.asarray(ratings, dtype=np.float64).copy() if np else [float(r) for r in ratings]
+
+    def __len__(self):
+        return len(self.ratings)
+
+    def __getitem__(self, position):
+        return float(self.ratings[position])
+
+    def win_probabilities(self, left, right):
+        """Probabilidade de cada time de `left` vencer o adversário correspondente em `right`."""
+        if np:
+            r = self.ratings
+            return 1.0 / (1.0 + 10.0 ** ((r[np.asarray(right)] - r[np.asarray(left)]) / 400.0))
+        r = self.ratings
+        return [win_probability(r[a], r[b]) for a, b in zip(left, right)]
+
+    def decide(self, left, right, rng):
+        """
+        Decide os jogos de uma rodada pelos ratings (compatível com o `decide` de bracket.py).
+        Retorna uma máscara de bytes: 1 = vence o time da esquerda.
+        """
+        probabilities = self.win_probabilities(left, right)
+        if np:
+            # Semente derivada do rng do chaveamento: a simulação continua reproduzível
+            draws = np.random.default_rng(rng.getrandbits(64)).random(len(probabilities))
+            return (draws < probabilities).astype(np.uint8).tobytes()
+        draw = rng.random
+        return bytes([draw() < p for p in probabilities])
+
+    def apply_round(self, left, right, left_wins):
+        """
+        Atualiza os ratings após uma rodada (cada time joga no máximo uma vez por rodada).
+        Retorna as posições cujos ratings mudaram.
+        """
+        if np:
+            left = np.asarray(left)
+            right = np.asarray(right)
+            won = np.frombuffer(bytes(left_wins), dtype=np.uint8).astype(bool)
+            winners = np.where(won, left, right)
+            losers = np.where(won, right, left)
+            r = self.ratings
+            delta = self.k_factor * (1.0 - 1.0 / (1.0 + 10.0 ** ((r[losers] - r[winners]) / 400.0)))
+            r[winners] += delta
+            r[losers] -= delta
+            return np.concatenate((winners, losers)).tolist()
+        r = self.ratings
+        changed = []
+        for a, b, won in zip(left, right, left_wins):
+            winner, loser = (a, b) if won else (b, a)
+            r[winner], r[loser] = elo_update(r[winner], r[loser], self.k_factor)
+            changed.append(winner)
+            changed.append(loser)
+        return changed
+
+
+def simulate_rated(engine, team_ids, ratings, on_round=None, seed=None, rng=None, **kwargs):
+    """
+    Simula um torneio com o motor `engine` (bracket.simulate_knockout,
+    league.simulate_round_robin ou league.simulate_swiss) em que cada jogo é
+    decidido pelos ratings e os ratings são atualizados ao fim de cada rodada.
+    `on_round(RoundRecord, posições_alteradas)` permite gravar os ratings novos
+    uma vez por rodada. Retorna (resultado do motor, RatingTable).
+    """
+    table = ratings if isinstance(ratings, RatingTable) else RatingTable(ratings)
+    if rng is None:
+        rng = random.Random(seed)
+
+    def after_round(record):
+        changed = table.apply_round(record.left, record.right, record.left_wins)
+        if on_round is not None:
+            on_round(record, changed)
+
+    result = engine(team_ids, rng=rng, decide=table.decide, on_round=after_round, **kwargs)
+    return result, table
+
+
+def simulate_rated_knockout(team_ids, ratings, on_round=None, seed=None, rng=None, **kwargs):
+    """Knockout decidido pelos ratings; retorna (bracket.KnockoutResult, RatingTable)."""
+    return simulate_rated(simulate_knockout, team_ids, ratings, on_round, seed, rng, **kwargs)
+
+
+def simulate_rated_round_robin(team_ids, ratings, on_round=None, seed=None, rng=None, **kwargs):
+    """Pontos corridos decididos pelos ratings; retorna (league.LeagueResult, RatingTable)."""
+    return simulate_rated(simulate_round_robin, team_ids, ratings, on_round, seed, rng, **kwargs)
+
+
+def simulate_rated_swiss(team_ids, ratings, on_round=None, seed=None, rng=None, **kwargs):
+    """Suíço decidido pelos ratings; retorna (league.LeagueResult, RatingTable)."""
+    return simulate_rated(simulate_swiss, team_ids, ratings, on_round, seed, rng, **kwargs)
@@ -0,0 +1,422 @@
+"""
+Interface de armazenamento do Game Manager e implementação em memória.
+
+Toda leitura e gravação de torneios, times, ratings e partidas passa por um
+Repository. CassandraRepository (cassandra_repository.py) é a implementação
+usada pelo aplicativo; InMemoryRepository guarda tudo em dicionários e serve
+para medir e exercitar a lógica (simulação, geração de nomes, inserções em
+massa) sem um cluster.
+
+Convenções comuns às implementações:
+- ids são strings (uuid4);
+- listagens paginadas retornam (linhas, paging_state), com paging_state None
+  na última página; o paging_state é opaco para quem chama;
+- linhas de partidas são (id, título, descrição, status, times) e jogos são
+  (jogo, time1, time2, vencedor), com time2 None para o bye (jogo 0); uma
+  partida simulada guarda só o topo do ranking em `times`, e o ranking
+  completo é lido por página em list_placements;
+- o leaderboard (leaderboard.py) identifica os times pelo nome e soma
+  incrementos (time, títulos, jogos, vitórias, colocação) por simulação.
+"""
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+DEFAULT_PAGE_SIZE = 50
+WAITING = "Aguardando"
+FINISHED = "Terminado"
+
+Tournament = namedtuple("Tournament", "id name simulated")
+Match = namedtuple("Match", "title description status teams")
+Standing = namedtuple("Standing", "team tournaments titles games wins placements")
+
+
+class Repository(ABC):
+    """Operações de armazenamento usadas pelo aplicativo (as subclasses implementam todas)."""
+
+    # Torneios
+    @abstractmethod
+    def create_tournament(self, name):
+        """Cria um torneio com simulated = False e retorna seu id."""
+
+    @abstractmethod
+    def list_tournaments(self):
+        """Retorna uma lista de (id, nome) dos torneios."""
+
+    @abstractmethod
+    def get_tournament(self, tournament_id):
+        """Retorna o torneio (atributos id, name, simulated) ou None."""
+
+    @abstractmethod
+    def find_tournaments(self, name):
+        """Retorna os ids dos torneios com esse nome (sem listar todos os torneios)."""
+
+    @abstractmethod
+    def set_tournament_simulated(self, tournament_id, simulated=True):
+        """Grava a flag simulated do torneio sem condição (usado para liberar uma simulação que falhou)."""
+
+    @abstractmethod
+    def claim_tournament_simulation(self, tournament_id):
+        """
+        Marca simulated = true só se ainda for false (escrita condicional). Retorna
+        True se esta chamada marcou: entre clientes concorrentes, só um recebe True.
+        """
+
+    @abstractmethod
+    def list_tournaments_page(self, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        """Uma página de (id, nome, simulated) de todos os torneios."""
+
+    # Times
+    @abstractmethod
+    def create_team(self, name, tournament_id):
+        """Cria um time vinculado a um torneio e retorna seu id."""
+
+    @abstractmethod
+    def create_teams(self, names, tournament_id):
+        """Cria vários times; retorna (criados [(id, nome)], falhas [(nome, exceção)])."""
+
+    @abstractmethod
+    def list_teams(self):
+        """Retorna (id, nome) de todos os times."""
+
+    @abstractmethod
+    def list_teams_by_tournament(self, tournament_id):
+        """Retorna (team_id, nome) dos times do torneio."""
+
+    @abstractmethod
+    def list_teams_page(self, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        """Uma página de (id, nome, tournament_id) de todos os times."""
+
+    def backfill_teams_by_tournament(self, on_page=None):
+        """
+        Migração de dados antigos para o índice por torneio; retorna quantos times migrou.
+        `on_page()` é chamado após cada página lida (ex.: para renovar o lock de migração).
+        """
+        return 0
+
+    @abstractmethod
+    def get_ratings(self, tournament_id):
+        """Retorna {team_id: rating} dos times do torneio que já têm rating."""
+
+    @abstractmethod
+    def save_ratings(self, tournament_id, ratings):
+        """Grava pares (team_id, rating) do torneio."""
+
+    # Partidas
+    @abstractmethod
+    def create_match(self, title, description, tournament_id=None):
+        """Cria uma partida 'Aguardando' (vinculada ao torneio, se informado) e retorna seu id."""
+
+    @abstractmethod
+    def list_matches(self):
+        """Retorna as linhas (id, título, descrição, status, times) de todas as partidas."""
+
+    @abstractmethod
+    def list_matches_page(self, status=None, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        """Uma página de linhas de partidas, só as com o `status` informado (se houver)."""
+
+    @abstractmethod
+    def get_match(self, match_id):
+        """Retorna a partida (atributos title, description, status, teams) ou None."""
+
+    @abstractmethod
+    def finish_match(self, match_id, ranking_lines):
+        """Marca a partida como 'Terminado' com o topo do ranking final (o completo fica em save_placements)."""
+
+    @abstractmethod
+    def set_match_rounds(self, tournament_id, match_id, rounds):
+        """Registra quantas rodadas de jogos a simulação `match_id` já gravou."""
+
+    @abstractmethod
+    def list_tournament_matches(self, tournament_id):
+        """Retorna (match_id, rodadas gravadas) das partidas vinculadas ao torneio."""
+
+    @abstractmethod
+    def delete_match(self, match_id):
+        """Remove a partida e suas colocações."""
+
+    @abstractmethod
+    def save_round_games(self, simulation_id, round_number, games):
+        """Grava os jogos (jogo, time1, time2, vencedor) de uma rodada da simulação."""
+
+    @abstractmethod
+    def list_round_games(self, simulation_id, round_number, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        """Uma página dos jogos (jogo, time1, time2, vencedor) de uma rodada, em ordem de jogo."""
+
+    @abstractmethod
+    def save_placements(self, simulation_id, teams):
+        """Grava o ranking completo da simulação: `teams` em ordem, da 1ª colocação em diante."""
+
+    @abstractmethod
+    def list_placements(self, simulation_id, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        """Uma página de (colocação, time) da simulação, em ordem de colocação."""
+
+    @abstractmethod
+    def assign_team(self, match_id, team_id, team_name=None):
+        """Inscreve um time livre em uma partida 'Aguardando'; retorna True se inscreveu."""
+
+    @abstractmethod
+    def assign_teams(self, match_id, teams):
+        """Inscreve vários times (pares (team_id, nome)); retorna os ids inscritos."""
+
+    # Leaderboard
+    @abstractmethod
+    def update_leaderboard(self, increments):
+        """Soma os incrementos (time, títulos, jogos, vitórias, colocação) de uma simulação, +1 torneio por time."""
+
+    @abstractmethod
+    def scan_leaderboard(self):
+        """Itera os totais (Standing) de todos os times, em qualquer ordem."""
+
+    @abstractmethod
+    def save_leaderboard_ranking(self, standings, compacted_at):
+        """Substitui o ranking compactado pelas `standings` já ordenadas."""
+
+    @abstractmethod
+    def get_leaderboard_ranking(self, limit):
+        """Retorna (primeiras `limit` Standing do ranking compactado, compacted_at ou None)."""
+
+    # Manutenção
+    @abstractmethod
+    def delete_tournament(self, tournament_id, on_progress=None):
+        """Remove o torneio com times, ratings, partidas e jogos (o leaderboard é mantido)."""
+
+    @abstractmethod
+    def clear(self, on_progress=None):
+        """Apaga todos os dados."""
+
+
+def _page(rows, paging_state, page_size):
+    """Fatia `rows` como uma página; o paging_state em memória é o deslocamento."""
+    start = paging_state or 0
+    end = start + page_size
+    return rows[start:end], end if end < len(rows) else None
+
+
+class InMemoryRepository(Repository):
+    """Repository em dicionários, protegido por um lock (acessado por várias threads)."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.clear()
+
+    # Torneios
+    def create_tournament(self, name):
+        t_id = str(uuid.uuid4())
+        with self._lock:
+            self._tournaments[t_id] = Tournament(t_id, name, False)
+        return t_id
+
+    def list_tournaments(self):
+        with self._lock:
+            return [(t.id, t.name) for t in self._tournaments.values()]
+
+    def get_tournament(self, tournament_id):
+        with self._lock:
+            return self._tournaments.get(tournament_id)
+
+    def find_tournaments(self, name):
+        with self._lock:
+            return [t.id for t in self._tournaments.values() if t.name == name]
+
+    def set_tournament_simulated(self, tournament_id, simulated=True):
+        with self._lock:
+            tournament = self._tournaments.get(tournament_id)
+            if tournament:
+                self._tournaments[tournament_id] = tournament._replace(simulated=simulated)
+
+    def claim_tournament_simulation(self, tournament_id):
+        with self._lock:
+            tournament = self._tournaments.get(tournament_id)
+            if tournament is None or tournament.simulated:
+                return False
+            self._tournaments[tournament_id] = tournament._replace(simulated=True)
+            return True
+
+    def list_tournaments_page(self, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        with self._lock:
+            rows = [tuple(t) for t in self._tournaments.values()]
+        return _page(rows, paging_state, page_size)
+
+    # Times
+    def create_team(self, name, tournament_id):
+        team_id = str(uuid.uuid4())
+        with self._lock:
+            self._teams[team_id] = [name, False, tournament_id]
+            self._teams_by_tournament.setdefault(tournament_id, {})[team_id] = name
+        return team_id
+
+    def create_teams(self, names, tournament_id):
+        created = [(str(uuid.uuid4()), name) for name in names]
+        with self._lock:
+            by_tournament = self._teams_by_tournament.setdefault(tournament_id, {})
+            for team_id, name in created:
+                self._teams[team_id] = [name, False, tournament_id]
+                by_tournament[team_id] = name
+        return created, []
+
+    def list_teams(self):
+        with self._lock:
+            return [(team_id, team[0]) for team_id, team in self._teams.items()]
+
+    def list_teams_by_tournament(self, tournament_id):
+        with self._lock:
+            return list(self._teams_by_tournament.get(tournament_id, {}).items())
+
+    def list_teams_page(self, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        with self._lock:
+            rows = [(team_id, name, tournament_id) for team_id, (name, _, tournament_id) in self._teams.items()]
+        return _page(rows, paging_state, page_size)
+
+    def get_ratings(self, tournament_id):
+        with self._lock:
+            return dict(self._ratings.get(tournament_id, {}))
+
+    def save_ratings(self, tournament_id, ratings):
+        with self._lock:
+            self._ratings.setdefault(tournament_id, {}).update(ratings)
+
+    # Partidas
+    def create_match(self, title, description, tournament_id=None):
+        match_id = str(uuid.uuid4())
+        with self._lock:
+            self._matches[match_id] = [title, description, WAITING, []]
+            if tournament_id:
+                self._matches_by_tournament.setdefault(tournament_id, {})[match_id] = 0
+        return match_id
+
+    def list_matches(self):
+        with self._lock:
+            return [(match_id, title, description, status, list(teams) or None)
+                    for match_id, (title, description, status, teams) in self._matches.items()]
+
+    def list_matches_page(self, status=None, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        rows = self.list_matches()
+        if status:
+            rows = [row for row in rows if row[3] == status]
+        return _page(rows, paging_state, page_size)
+
+    def get_match(self, match_id):
+        with self._lock:
+            match = self._matches.get(match_id)
+            if match is None:
+                return None
+            title, description, status, teams = match
+            return Match(title, description, status, list(teams) or None)
+
+    def finish_match(self, match_id, ranking_lines):
+        with self._lock:
+            match = self._matches.setdefault(match_id, [None, None, None, []])
+            match[2:] = [FINISHED, list(ranking_lines)]
+
+    def set_match_rounds(self, tournament_id, match_id, rounds):
+        with self._lock:
+            self._matches_by_tournament.setdefault(tournament_id, {})[match_id] = rounds
+
+    def list_tournament_matches(self, tournament_id):
+        with self._lock:
+            return list(self._matches_by_tournament.get(tournament_id, {}).items())
+
+    def delete_match(self, match_id):
+        with self._lock:
+            self._matches.pop(match_id, None)
+            self._placements.pop(match_id, None)
+
+    def save_round_games(self, simulation_id, round_number, games):
+        with self._lock:
+            stored = self._games.setdefault((simulation_id, round_number), {})
+            for game in games:
+                stored[game[0]] = tuple(game)
+
+    def list_round_games(self, simulation_id, round_number, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        with self._lock:
+            stored = self._games.get((simulation_id, round_number), {})
+            rows = [stored[game] for game in sorted(stored)]
+        return _page(rows, paging_state, page_size)
+
+    def save_placements(self, simulation_id, teams):
+        with self._lock:
+            self._placements[simulation_id] = list(teams)
+
+    def list_placements(self, simulation_id, paging_state=None, page_size=DEFAULT_PAGE_SIZE):
+        with self._lock:
+            rows = list(enumerate(self._placements.get(simulation_id, []), start=1))
+        return _page(rows, paging_state, page_size)
+
+    def assign_team(self, match_id, team_id, team_name=None):
+        with self._lock:
+            team = self._teams.get(team_id)
+            match = self._matches.get(match_id)
+            if team is None or team[1] or match is None or match[2] != WAITING:
+                return False
+            team[1] = True
+            match[3].append(team[0] if team_name is None else team_name)
+            return True
+
+    def assign_teams(self, match_id, teams):
+        with self._lock:
+            match = self._matches.get(match_id)
+            if match is None or match[2] != WAITING:
+                return []
+            claimed = [(team_id, name) for team_id, name in teams
+                       if team_id in self._teams and not self._teams[team_id][1]]
+            for team_id, name in claimed:
+                self._teams[team_id][1] = True
+                match[3].append(name)
+            return [team_id for team_id, _ in claimed]
+
+    # Leaderboard
+    def update_leaderboard(self, increments):
+        with self._lock:
+            for team, titles, games, wins, placement in increments:
+                totals = self._leaderboard.setdefault(team, [0, 0, 0, 0, 0])
+                for i, value in enumerate((1, titles, games, wins, placement)):
+                    totals[i] += value
+
+    def scan_leaderboard(self):
+        with self._lock:
+            return [Standing(team, *totals) for team, totals in self._leaderboard.items()]
+
+    def save_leaderboard_ranking(self, standings, compacted_at):
+        with self._lock:
+            self._leaderboard_ranking = (list(standings), compacted_at)
+
+    def get_leaderboard_ranking(self, limit):
+        with self._lock:
+            standings, compacted_at = self._leaderboard_ranking
+            return standings[:limit], compacted_at
+
+    # Manutenção
+    def delete_tournament(self, tournament_id, on_progress=None):
+        with self._lock:
+            team_ids = self._teams_by_tournament.pop(tournament_id, {})
+            matches = self._matches_by_tournament.pop(tournament_id, {})
+            for team_id in team_ids:
+                self._teams.pop(team_id, None)
+            for match_id, rounds in matches.items():
+                for number in range(1, rounds + 1):
+                    self._games.pop((match_id, number), None)
+                self._placements.pop(match_id, None)
+                self._matches.pop(match_id, None)
+            self._ratings.pop(tournament_id, None)
+            self._tournaments.pop(tournament_id, None)
+            total = len(team_ids) + sum(rounds for rounds in matches.values()) + 2 * len(matches) + 4
+        if on_progress is not None:
+            on_progress(total, total)
+        return total
+
+    def clear(self, on_progress=None):
+        with self._lock:
+            self._tournaments = {}
+            self._teams = {}  # id -> [nome, in_match, tournament_id]
+            self._teams_by_tournament = {}  # tournament_id -> {team_id: nome}
+            self._ratings = {}  # tournament_id -> {team_id: rating}
+            self._matches = {}  # id -> [título, descrição, status, times]
+            self._matches_by_tournament = {}  # tournament_id -> {match_id: rodadas}
+            self._games = {}  # (simulation_id, rodada) -> {jogo: (jogo, time1, time2, vencedor)}
+            self._placements = {}  # simulation_id -> nomes em ordem de colocação
+            self._leaderboard = {}  # nome -> [torneios, títulos, jogos, vitórias, soma das colocações]
+            self._leaderboard_ranking = ([], None)  # (Standing ordenadas, compacted_at)
+        if on_progress is not None:
+            on_progress(0, 0)
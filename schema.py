@@ -0,0 +1,186 @@
+"""
+Schema do Game Manager como uma lista de migrações numeradas.
+
+Cada Migration tem um número, uma descrição e passos: strings CQL (DDL) ou
+funções que recebem a sessão e `renew()` (migrações de dados), que devem
+chamar renew() a cada página processada para manter o lock de migração. Nunca altere uma migração
+já publicada: acrescente uma nova com o próximo número. migrations.py aplica
+só as que faltam, registrando a versão em schema_version.
+
+Todo DDL usa IF NOT EXISTS, então bancos criados antes do controle de versão
+(que ainda não têm schema_version) migram sem erro.
+"""
+import zlib
+from collections import namedtuple
+
+KEYSPACE = "game_manager"
+STATUS_BUCKETS = 16  # partições de matches_by_status por status
+
+Migration = namedtuple("Migration", "version description steps")
+
+
+def status_bucket(match_id):
+    """Partição (0..STATUS_BUCKETS-1) da partida em matches_by_status, estável entre clientes."""
+    return zlib.crc32(match_id.encode()) % STATUS_BUCKETS
+
+
+def _backfill_teams_by_tournament(session, renew):
+    """Preenche teams_by_tournament a partir da tabela teams (bancos anteriores à tabela)."""
+    from cassandra_repository import CassandraRepository
+
+    CassandraRepository(session).backfill_teams_by_tournament(on_page=renew)
+
+
+def _backfill_matches_by_status(session, renew):
+    """Preenche matches_by_status a partir de game_matches (bancos anteriores à tabela)."""
+    from cassandra_repository import CassandraRepository
+
+    CassandraRepository(session).backfill_matches_by_status(on_page=renew)
+
+
+def _backfill_tournaments_by_name(session, renew):
+    """Preenche tournaments_by_name a partir de tournaments (bancos anteriores à tabela)."""
+    from cassandra_repository import CassandraRepository
+
+    CassandraRepository(session).backfill_tournaments_by_name(on_page=renew)
+
+
+MIGRATIONS = [
+    Migration(1, "tabelas iniciais: torneios, times e partidas", [
+        """
+        CREATE TABLE IF NOT EXISTS tournaments (
+            id text PRIMARY KEY,
+            name text,
+            simulated boolean
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS teams (
+            id text PRIMARY KEY,
+            name text,
+            in_match boolean,
+            tournament_id text
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS game_matches (
+            id text PRIMARY KEY,
+            title text,
+            description text,
+            status text,
+            teams list<text>
+        )
+        """,
+    ]),
+    # Times particionados por torneio: leitura de um torneio = uma única partição
+    Migration(2, "times por torneio", [
+        """
+        CREATE TABLE IF NOT EXISTS teams_by_tournament (
+            tournament_id text,
+            team_id text,
+            name text,
+            PRIMARY KEY (tournament_id, team_id)
+        )
+        """,
+        _backfill_teams_by_tournament,
+    ]),
+    # Um registro por jogo de cada simulação; cada rodada é uma partição
+    Migration(3, "jogos das simulações", [
+        """
+        CREATE TABLE IF NOT EXISTS match_games (
+            simulation_id text,
+            round int,
+            game int,
+            team1 text,
+            team2 text,
+            winner text,
+            PRIMARY KEY ((simulation_id, round), game)
+        )
+        """,
+    ]),
+    Migration(4, "ratings Elo e partidas de cada torneio", [
+        # Ratings Elo dos times, particionados por torneio (uma gravação em batch por rodada)
+        """
+        CREATE TABLE IF NOT EXISTS team_ratings (
+            tournament_id text,
+            team_id text,
+            rating double,
+            PRIMARY KEY (tournament_id, team_id)
+        )
+        """,
+        # Partidas (simulações) de cada torneio, com a quantidade de rodadas em match_games
+        """
+        CREATE TABLE IF NOT EXISTS matches_by_tournament (
+            tournament_id text,
+            match_id text,
+            rounds int,
+            PRIMARY KEY (tournament_id, match_id)
+        )
+        """,
+    ]),
+    Migration(5, "leaderboard entre torneios", [
+        # Totais de cada time (pelo nome) somados ao fim de cada simulação; uma partição por time
+        """
+        CREATE TABLE IF NOT EXISTS leaderboard_stats (
+            team text PRIMARY KEY,
+            tournaments counter,
+            titles counter,
+            games counter,
+            wins counter,
+            placements counter
+        )
+        """,
+        # Top N já ordenado em uma única partição, refeito periodicamente a partir de leaderboard_stats
+        """
+        CREATE TABLE IF NOT EXISTS leaderboard_ranking (
+            board text,
+            position int,
+            team text,
+            tournaments bigint,
+            titles bigint,
+            games bigint,
+            wins bigint,
+            placements bigint,
+            compacted_at timestamp static,
+            PRIMARY KEY (board, position)
+        )
+        """,
+    ]),
+    # Filtro por status sem índice secundário (em uma coluna de baixa cardinalidade, ele consultaria
+    # todos os nós a cada página): aqui cada página lê partições (status, bucket)
+    Migration(6, "partidas por status", [
+        """
+        CREATE TABLE IF NOT EXISTS matches_by_status (
+            status text,
+            bucket int,
+            match_id text,
+            PRIMARY KEY ((status, bucket), match_id)
+        )
+        """,
+        _backfill_matches_by_status,
+    ]),
+    # Ranking completo de cada simulação, uma linha por colocação; game_matches guarda só o topo
+    Migration(7, "colocações das simulações", [
+        """
+        CREATE TABLE IF NOT EXISTS match_placements (
+            simulation_id text,
+            place int,
+            team text,
+            PRIMARY KEY (simulation_id, place)
+        )
+        """,
+    ]),
+    # Busca de torneio pelo nome (importação e CLI) sem listar todos os torneios
+    Migration(8, "torneios por nome", [
+        """
+        CREATE TABLE IF NOT EXISTS tournaments_by_name (
+            name text,
+            id text,
+            PRIMARY KEY (name, id)
+        )
+        """,
+        _backfill_tournaments_by_name,
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
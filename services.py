@@ -0,0 +1,216 @@
+"""
+Operações do Game Manager sobre um Repository: geração de times, ratings e
+simulação de torneios.
+
+Nada aqui conhece o Cassandra nem a interface; as mesmas funções rodam sobre
+CassandraRepository (aplicativo) e InMemoryRepository (benchmarks).
+"""
+from bracket import format_ranking, format_round
+from league import format_league_round
+from leaderboard import Tally
+from metrics import phase
+from ratings import (DEFAULT_RATING, RatingTable, elo_update, simulate_rated_knockout, simulate_rated_round_robin,
+                     simulate_rated_swiss)
+from repository import FINISHED
+
+DEFAULT_POSITIONS = 3
+MIN_TEAMS_MESSAGE = "O torneio deve ter pelo menos 2 times para simulação."
+
+KNOCKOUT = "knockout"
+ROUND_ROBIN = "round-robin"
+SWISS = "swiss"
+# Formato -> (nome exibido, motor com ratings)
+TOURNAMENT_FORMATS = {
+    KNOCKOUT: ("Mata-mata", simulate_rated_knockout),
+    ROUND_ROBIN: ("Pontos corridos", simulate_rated_round_robin),
+    SWISS: ("Suíço", simulate_rated_swiss),
+}
+SIMULATION_DESCRIPTION = "Simulação realizada"
+LOG_GAMES_PER_ROUND = 64  # rodadas maiores aparecem no log só como resumo
+MATCH_RANKING_TOP = 10  # colocações guardadas na própria partida; o ranking completo fica em save_placements
+
+
+def record_match_result(repo, tournament_id, winner_id, loser_id):
+    """Registra o resultado de um jogo avulso e atualiza os ratings dos dois times."""
+    current = repo.get_ratings(tournament_id)
+    winner_rating, loser_rating = elo_update(current.get(winner_id, DEFAULT_RATING),
+                                             current.get(loser_id, DEFAULT_RATING))
+    repo.save_ratings(tournament_id, [(winner_id, winner_rating), (loser_id, loser_rating)])
+    return winner_rating, loser_rating
+
+
+def generate_team_names(repo, generator, num_names, tournament_id):
+    """Sorteia `num_names` nomes do `generator` que ainda não são usados no torneio."""
+    existing = {name for _, name in repo.list_teams_by_tournament(tournament_id)}
+    return generator.sample(num_names, existing)
+
+
+def generate_random_teams(repo, generator, num_teams, tournament_id):
+    """Cria `num_teams` times com nomes sorteados; retorna (criados, falhas)."""
+    names = generate_team_names(repo, generator, num_teams, tournament_id)
+    return repo.create_teams(names, tournament_id)
+
+
+def round_games(record, names):
+    """Jogos (jogo, time1, time2, vencedor) de uma rodada; o bye, se houver, é o jogo 0."""
+    games = []
+    if record.bye is not None:
+        games.append((0, names[record.bye], None, names[record.bye]))
+    for game, (a, b, winner) in enumerate(record.games(), start=1):
+        games.append((game, names[a], names[b], names[winner]))
+    return games
+
+
+def simulate_tournament(repo, tournament_id, simulation_id=None, on_log=None, metrics=None, tally=None,
+                        tournament_format=KNOCKOUT, rounds=None):
+    """
+    Simula um torneio knockout para qualquer quantidade de times (mínimo 2) e gera um ranking final.
+    Em cada rodada, se houver número ímpar, um time recebe bye.
+    Cada partida é decidida pelos ratings Elo dos times e é registrado em qual rodada o time foi eliminado.
+    O ranking final é determinado com base na rodada alcançada (quanto mais avançado, melhor a posição).
+    O chaveamento em si é feito pelo motor em bracket.py; ao fim de cada rodada os ratings novos são
+    gravados e, se `simulation_id` for informado, os jogos da rodada também.
+    Se `on_log` for informado, as linhas do log são entregues a ele rodada a rodada e o log
+    retornado é None; caso contrário o log completo é retornado como texto.
+    Com `metrics`, as fases "simulation.load", "simulation.round" (gravação de cada
+    rodada) e "simulation.total" são medidas. Com `tally` (leaderboard.Tally), jogos,
+    vitórias e o ranking final são contados nele.
+
+    `tournament_format` ROUND_ROBIN ou SWISS usa os motores de league.py (ranking por
+    pontos; `rounds` é a quantidade de rodadas do suíço). Nesses formatos todos os times
+    jogam em toda rodada, então os ratings são gravados uma única vez, no fim, e os
+    jogos de cada rodada continuam gravados ao fim dela (batches concorrentes).
+    """
+    if tournament_format not in TOURNAMENT_FORMATS:
+        raise ValueError(f"Formato desconhecido: {tournament_format}")
+    engine = TOURNAMENT_FORMATS[tournament_format][1]
+    knockout = tournament_format == KNOCKOUT
+    with phase(metrics, "simulation.load"):
+        teams_list = repo.list_teams_by_tournament(tournament_id)
+        current = repo.get_ratings(tournament_id)
+    num_teams = len(teams_list)
+    if num_teams < 2:
+        return None, MIN_TEAMS_MESSAGE
+
+    team_ids = [tid for tid, _ in teams_list]
+    names = [name for _, name in teams_list]
+    table = RatingTable([current.get(tid, DEFAULT_RATING) for tid in team_ids])
+    log_lines = []
+    emit = on_log or log_lines.extend
+
+    def save_round(record, changed):
+        if tally is not None:
+            tally.add_round(record)
+        with phase(metrics, "simulation.round"):
+            if knockout:
+                repo.save_ratings(tournament_id, [(team_ids[p], table[p]) for p in changed])
+            if simulation_id:
+                repo.save_round_games(simulation_id, record.number, round_games(record, names))
+                # Quantidade de rodadas gravadas: usada pela exclusão em cascata
+                repo.set_match_rounds(tournament_id, simulation_id, record.number)
+        if knockout:
+            emit(list(format_round(record, names, LOG_GAMES_PER_ROUND)))
+        else:
+            emit(list(format_league_round(record, names, LOG_GAMES_PER_ROUND)))
+
+    options = {} if rounds is None or tournament_format != SWISS else {"rounds": rounds}
+    with phase(metrics, "simulation.total"):
+        result, _ = engine(range(num_teams), table, on_round=save_round, **options)
+        if not knockout:
+            repo.save_ratings(tournament_id, [(team_id, table[p]) for p, team_id in enumerate(team_ids)])
+    if tally is not None:
+        tally.finish(result.ranking, names)
+    ranking = [(f"{i+1}º Lugar", names[p]) for i, p in enumerate(result.ranking)]
+    emit(list(format_ranking(result.ranking, names)))
+    return ranking, None if on_log else "\n".join(log_lines)
+
+
+def estimate_tournament_odds(repo, tournament_id, replicates, positions=DEFAULT_POSITIONS):
+    """
+    Executa `replicates` simulações do torneio em memória (modo Monte Carlo) sem gravar nada.
+    Os jogos são decididos pelos ratings atuais dos times (padrão DEFAULT_RATING).
+    Retorna (nomes, resultado) — resultado é um montecarlo.MonteCarloResult indexado como `nomes`.
+    """
+    # Import tardio: NumPy só é necessário para este modo
+    from montecarlo import simulate_knockout_replicates
+
+    teams_list = repo.list_teams_by_tournament(tournament_id)
+    if len(teams_list) < 2:
+        raise ValueError(MIN_TEAMS_MESSAGE)
+    current = repo.get_ratings(tournament_id)
+    names = [name for _, name in teams_list]
+    ratings = [current.get(tid, DEFAULT_RATING) for tid, _ in teams_list]
+    return names, simulate_knockout_replicates(len(names), replicates, positions=positions, ratings=ratings)
+
+
+def run_tournament_simulation(repo, tournament_id, tournament_name, on_log=None, metrics=None,
+                              tournament_format=KNOCKOUT, rounds=None):
+    """
+    Simula o torneio no formato `tournament_format` (veja simulate_tournament) e grava o
+    resultado (partida com o topo do ranking, colocações, jogos por rodada, flag simulated
+    e os totais do leaderboard).
+    A flag é marcada antes da simulação com uma escrita condicional: entre clientes
+    concorrentes só um simula e soma o torneio ao leaderboard. Se a simulação falhar,
+    a flag volta a false; se o processo morrer no meio, ela fica true até
+    release_simulation (`cli.py release-simulation`). Retorna (linhas do ranking, log).
+    """
+    if tournament_format not in TOURNAMENT_FORMATS:
+        raise ValueError(f"Formato desconhecido: {tournament_format}")
+    if not repo.claim_tournament_simulation(tournament_id):
+        if repo.get_tournament(tournament_id) is None:
+            raise ValueError("Torneio não encontrado.")
+        raise ValueError("Este torneio já foi simulado e não pode ser simulado novamente.")
+
+    title = "Simulação do Torneio " + tournament_name
+    if tournament_format != KNOCKOUT:
+        title += f" ({TOURNAMENT_FORMATS[tournament_format][0]})"
+    try:
+        sim_match_id = repo.create_match(title, SIMULATION_DESCRIPTION, tournament_id)
+        tally = Tally()
+        ranking, log_text = simulate_tournament(repo, tournament_id, simulation_id=sim_match_id,
+                                                on_log=on_log, metrics=metrics, tally=tally,
+                                                tournament_format=tournament_format, rounds=rounds)
+        if ranking is None:
+            repo.delete_match(sim_match_id)
+            raise ValueError(log_text)
+    except Exception:
+        # Nada foi somado ao leaderboard: o torneio pode ser simulado de novo
+        repo.set_tournament_simulated(tournament_id, False)
+        raise
+
+    ranking_lines = [f"{pos}: {team}" for pos, team in ranking]
+    with phase(metrics, "simulation.finish"):
+        repo.save_placements(sim_match_id, [team for _, team in ranking])
+        repo.finish_match(sim_match_id, ranking_lines[:MATCH_RANKING_TOP])
+    # Counters não são idempotentes: só o cliente que marcou a flag chega aqui
+    with phase(metrics, "simulation.leaderboard"):
+        repo.update_leaderboard(tally.increments())
+    return ranking_lines, log_text
+
+
+def release_simulation(repo, tournament_id):
+    """
+    Recuperação manual de uma simulação interrompida (processo encerrado com a flag
+    simulated marcada): remove as partidas de simulação não terminadas do torneio e
+    volta a flag para false. Recusa se o torneio já tem uma simulação terminada.
+    A flag não registra quem a marcou: só use quando nenhuma simulação do torneio
+    estiver em andamento. Retorna quantas partidas removeu.
+    """
+    tournament = repo.get_tournament(tournament_id)
+    if tournament is None:
+        raise ValueError("Torneio não encontrado.")
+    if not tournament.simulated:
+        raise ValueError("Este torneio não está marcado como simulado.")
+    unfinished = []
+    for match_id, _ in repo.list_tournament_matches(tournament_id):
+        match = repo.get_match(match_id)
+        if match is None or match.description != SIMULATION_DESCRIPTION:
+            continue
+        if match.status == FINISHED:
+            raise ValueError("Este torneio já tem uma simulação terminada.")
+        unfinished.append(match_id)
+    # Os jogos já gravados continuam em matches_by_tournament: a exclusão do torneio os remove
+    for match_id in unfinished:
+        repo.delete_match(match_id)
+    repo.set_tournament_simulated(tournament_id, False)
+    return len(unfinished)
@@ -0,0 +1,269 @@
+"""
+Registro de prepared statements do Game Manager.
+
+Cada consulta CQL usada pelo aplicativo é declarada uma única vez em QUERIES
+e preparada sob demanda na primeira execução. As execuções seguintes reutilizam
+o statement preparado, evitando que o servidor analise a consulta a cada chamada
+e permitindo roteamento token-aware pelo driver.
+
+Com um metrics.Metrics, cada execução por nome é medida ("cql.<nome>"), e uma
+fração sorteada delas roda com tracing do Cassandra.
+
+Com `execution_profiles=True` (Cluster criado com os perfis de config.py),
+cada consulta roda no perfil da sua categoria: listagens no perfil
+"listing", gravações no perfil "write" e o restante no perfil padrão.
+"""
+import threading
+import time
+import weakref
+
+from cassandra import OperationTimedOut, Timeout
+from cassandra.cluster import EXEC_PROFILE_DEFAULT, Session
+from cassandra.policies import HostStateListener
+from cassandra.query import BatchStatement, BatchType
+
+# Exceções do driver contadas como timeout pelas métricas
+TIMEOUT_ERRORS = (OperationTimedOut, Timeout)
+
+QUERIES = {
+    # Torneios
+    "insert_tournament": "INSERT INTO tournaments (id, name, simulated) VALUES (?, ?, ?)",
+    "select_tournaments": "SELECT id, name FROM tournaments",
+    "select_tournament": "SELECT id, name, simulated FROM tournaments WHERE id = ?",
+    "update_tournament_simulated": "UPDATE tournaments SET simulated = ? WHERE id = ?",
+    "claim_tournament_simulation": "UPDATE tournaments SET simulated = true WHERE id = ? IF simulated = false",
+    "delete_tournament": "DELETE FROM tournaments WHERE id = ?",
+    "scan_tournaments": "SELECT id, name, simulated FROM tournaments",
+    # Torneios por nome (busca pelo nome sem varrer tournaments)
+    "insert_tournament_by_name": "INSERT INTO tournaments_by_name (name, id) VALUES (?, ?)",
+    "select_tournament_ids_by_name": "SELECT id FROM tournaments_by_name WHERE name = ?",
+    "delete_tournament_by_name": "DELETE FROM tournaments_by_name WHERE name = ? AND id = ?",
+    "delete_tournaments_by_name": "DELETE FROM tournaments_by_name WHERE name = ?",
+    # Times
+    "insert_team": "INSERT INTO teams (id, name, in_match, tournament_id) VALUES (?, ?, ?, ?)",
+    "insert_team_by_tournament": "INSERT INTO teams_by_tournament (tournament_id, team_id, name) VALUES (?, ?, ?)",
+    "select_teams": "SELECT id, name FROM teams",
+    "select_teams_with_tournament": "SELECT id, name, tournament_id FROM teams",
+    "select_team": "SELECT name, in_match FROM teams WHERE id = ?",
+    "select_teams_by_tournament": "SELECT team_id, name FROM teams_by_tournament WHERE tournament_id = ?",
+    "claim_team": "UPDATE teams SET in_match = true WHERE id = ? IF in_match = false",
+    "release_team": "UPDATE teams SET in_match = false WHERE id = ? IF in_match = true",
+    "delete_team": "DELETE FROM teams WHERE id = ?",
+    "delete_teams_by_tournament": "DELETE FROM teams_by_tournament WHERE tournament_id = ?",
+    # Ratings (uma partição por torneio)
+    "select_ratings_by_tournament": "SELECT team_id, rating FROM team_ratings WHERE tournament_id = ?",
+    "upsert_rating": "INSERT INTO team_ratings (tournament_id, team_id, rating) VALUES (?, ?, ?)",
+    "delete_ratings_by_tournament": "DELETE FROM team_ratings WHERE tournament_id = ?",
+    # Partidas
+    "insert_match": "INSERT INTO game_matches (id, title, description, status, teams) VALUES (?, ?, ?, ?, ?)",
+    "select_matches": "SELECT id, title, description, status, teams FROM game_matches",
+    "select_match_statuses": "SELECT id, status FROM game_matches",
+    "select_match": "SELECT title, description, status, teams FROM game_matches WHERE id = ?",
+    "append_match_team_if_waiting": "UPDATE game_matches SET teams = teams + ? WHERE id = ? IF status = 'Aguardando'",
+    "update_match_result": "UPDATE game_matches SET status = ?, teams = ? WHERE id = ?",
+    "delete_match": "DELETE FROM game_matches WHERE id = ?",
+    # Partidas por status, em STATUS_BUCKETS partições por status (schema.status_bucket)
+    "insert_match_by_status": "INSERT INTO matches_by_status (status, bucket, match_id) VALUES (?, ?, ?)",
+    "select_match_ids_by_status": "SELECT match_id FROM matches_by_status WHERE status = ? AND bucket = ?",
+    "delete_match_by_status": "DELETE FROM matches_by_status WHERE status = ? AND bucket = ? AND match_id = ?",
+    "delete_matches_by_status": "DELETE FROM matches_by_status WHERE status = ? AND bucket = ?",
+    # Partidas de cada torneio (permite a exclusão em cascata sem varrer game_matches)
+    "insert_match_by_tournament": "INSERT INTO matches_by_tournament (tournament_id, match_id, rounds) VALUES (?, ?, ?)",
+    "select_matches_by_tournament": "SELECT match_id, rounds FROM matches_by_tournament WHERE tournament_id = ?",
+    "delete_matches_by_tournament": "DELETE FROM matches_by_tournament WHERE tournament_id = ?",
+    # Jogos de cada simulação (uma partição por rodada)
+    "insert_match_game": "INSERT INTO match_games (simulation_id, round, game, team1, team2, winner) VALUES (?, ?, ?, ?, ?, ?)",
+    "select_match_games": "SELECT game, team1, team2, winner FROM match_games WHERE simulation_id = ? AND round = ?",
+    "delete_match_games_round": "DELETE FROM match_games WHERE simulation_id = ? AND round = ?",
+    # Ranking completo de cada simulação (uma partição por simulação, ordenada pela colocação)
+    "insert_match_placement": "INSERT INTO match_placements (simulation_id, place, team) VALUES (?, ?, ?)",
+    "select_match_placements": "SELECT place, team FROM match_placements WHERE simulation_id = ?",
+    "delete_match_placements": "DELETE FROM match_placements WHERE simulation_id = ?",
+    # Leaderboard: counters por time e ranking compactado (uma partição por board)
+    "update_leaderboard_stats": "UPDATE leaderboard_stats SET tournaments = tournaments + 1, titles = titles + ?, "
+                                "games = games + ?, wins = wins + ?, placements = placements + ? WHERE team = ?",
+    "scan_leaderboard_stats": "SELECT team, tournaments, titles, games, wins, placements FROM leaderboard_stats",
+    "upsert_leaderboard_compacted_at": "INSERT INTO leaderboard_ranking (board, compacted_at) VALUES (?, ?)",
+    "upsert_leaderboard_position": "INSERT INTO leaderboard_ranking "
+                                   "(board, position, team, tournaments, titles, games, wins, placements) "
+                                   "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+    "delete_leaderboard_positions_after": "DELETE FROM leaderboard_ranking WHERE board = ? AND position > ?",
+    "select_leaderboard_ranking": "SELECT position, team, tournaments, titles, games, wins, placements, compacted_at "
+                                  "FROM leaderboard_ranking WHERE board = ? LIMIT ?",
+    "delete_leaderboard_ranking": "DELETE FROM leaderboard_ranking WHERE board = ?",
+    # Counters não podem ser reutilizados com segurança após um DELETE: zerar usa TRUNCATE
+    "truncate_leaderboard_stats": "TRUNCATE leaderboard_stats",
+    # Varreduras de chaves de partição (cascade.clear_all)
+    "sweep_match_games": "SELECT DISTINCT simulation_id, round FROM match_games",
+    "sweep_match_placements": "SELECT DISTINCT simulation_id FROM match_placements",
+    "sweep_game_matches": "SELECT id FROM game_matches",
+    "sweep_teams": "SELECT id FROM teams",
+    "sweep_team_ratings": "SELECT DISTINCT tournament_id FROM team_ratings",
+    "sweep_teams_by_tournament": "SELECT DISTINCT tournament_id FROM teams_by_tournament",
+    "sweep_matches_by_tournament": "SELECT DISTINCT tournament_id FROM matches_by_tournament",
+    "sweep_tournaments": "SELECT id FROM tournaments",
+    "sweep_tournaments_by_name": "SELECT DISTINCT name FROM tournaments_by_name",
+    "sweep_leaderboard_ranking": "SELECT DISTINCT board FROM leaderboard_ranking",
+    "sweep_matches_by_status": "SELECT DISTINCT status, bucket FROM matches_by_status",
+}
+
+
+LISTING = "listing"
+WRITE = "write"
+
+# Listagens e varreduras: aceitam consistência baixa (a interface recarrega quando preciso)
+LISTING_QUERIES = {
+    "select_tournaments", "select_teams", "select_matches", "select_match_ids_by_status", "select_match_games",
+    "select_match_placements", "sweep_match_games", "sweep_match_placements", "sweep_game_matches", "sweep_teams",
+    "sweep_team_ratings", "sweep_teams_by_tournament", "sweep_matches_by_tournament", "sweep_tournaments",
+    "sweep_tournaments_by_name", "sweep_leaderboard_ranking", "sweep_matches_by_status", "scan_leaderboard_stats",
+    "select_leaderboard_ranking", "scan_tournaments", "select_teams_with_tournament",
+}
+WRITE_PREFIXES = ("insert_", "upsert_", "update_", "delete_", "claim_", "release_", "append_", "truncate_")
+
+
+def profile_for(name):
+    """Perfil de execução da consulta `name` (listing, write ou o padrão)."""
+    if name in LISTING_QUERIES:
+        return LISTING
+    if name.startswith(WRITE_PREFIXES):
+        return WRITE
+    return EXEC_PROFILE_DEFAULT
+
+
+class _ReprepareListener(HostStateListener):
+    """Invalida o cache dos registros de um cluster quando um nó volta ou entra nele."""
+
+    def __init__(self):
+        self.registries = weakref.WeakSet()
+
+    def _invalidate_all(self):
+        for registry in list(self.registries):
+            registry.invalidate()
+
+    def on_up(self, host):
+        self._invalidate_all()
+
+    def on_add(self, host):
+        self._invalidate_all()
+
+    def on_down(self, host):
+        pass
+
+    def on_remove(self, host):
+        pass
+
+
+# Um listener por Cluster: o driver não tem como removê-lo, então cada registro novo (um por
+# reconexão ou migração de dados) só entra no conjunto fraco do listener já registrado
+_LISTENERS = weakref.WeakKeyDictionary()
+_LISTENERS_LOCK = threading.Lock()
+
+
+def _listen(cluster, registry):
+    """Inscreve o registro no listener do cluster, registrado no driver só na primeira vez."""
+    with _LISTENERS_LOCK:
+        listener = _LISTENERS.get(cluster)
+        if listener is None:
+            listener = _LISTENERS[cluster] = _ReprepareListener()
+            cluster.register_listener(listener)
+        listener.registries.add(registry)
+
+
+class StatementRegistry:
+    """
+    Prepara cada consulta uma vez por sessão e reutiliza o resultado.
+
+    O cache é descartado automaticamente quando um nó reconecta (ou entra no
+    cluster) e pode ser descartado manualmente com invalidate() após mudanças
+    de schema; a próxima execução prepara a consulta novamente.
+
+    Se `metrics` for informado, execute, execute_page, execute_batch e
+    execute_async registram latência, linhas retornadas e erros de cada consulta.
+    """
+
+    def __init__(self, session: Session, queries=None, metrics=None, execution_profiles=False):
+        self.session = session
+        self.queries = dict(QUERIES if queries is None else queries)
+        self.metrics = metrics
+        self.execution_profiles = execution_profiles
+        self._prepared = {}
+        self._lock = threading.Lock()
+        _listen(session.cluster, self)
+
+    def invalidate(self):
+        """Descarta todos os statements preparados (ex.: após DDL)."""
+        with self._lock:
+            self._prepared.clear()
+
+    def get(self, name):
+        """Retorna o statement preparado para `name`, preparando-o se preciso."""
+        prepared = self._prepared.get(name)
+        if prepared is None:
+            with self._lock:
+                prepared = self._prepared.get(name)
+                if prepared is None:
+                    prepared = self.session.prepare(self.queries[name])
+                    self._prepared[name] = prepared
+        return prepared
+
+    def profile(self, name):
+        """Perfil usado para `name` (sempre o padrão se o Cluster não tem perfis)."""
+        return profile_for(name) if self.execution_profiles else EXEC_PROFILE_DEFAULT
+
+    def bind(self, name, params=()):
+        return self.get(name).bind(params)
+
+    def execute(self, name, params=(), **kwargs):
+        kwargs.setdefault("execution_profile", self.profile(name))
+        return self._execute(f"cql.{name}", self.get(name), params, **kwargs)
+
+    def execute_page(self, name, params=(), paging_state=None, page_size=None):
+        """Executa `name` buscando só uma página de `page_size` linhas a partir de `paging_state`."""
+        statement = self.bind(name, params)
+        statement.fetch_size = page_size
+        return self._execute(f"cql.{name}", statement, None, paging_state=paging_state,
+                             execution_profile=self.profile(name))
+
+    def execute_batch(self, entries, batch_type=BatchType.LOGGED):
+        """Monta e executa um batch (veja batch()) no perfil de escrita; medido como "batch.<nomes>"."""
+        label = "batch." + "+".join(dict.fromkeys(name for name, _ in entries))
+        profile = WRITE if self.execution_profiles else EXEC_PROFILE_DEFAULT
+        return self._execute(label, self.batch(entries, batch_type), None, execution_profile=profile)
+
+    def execute_async(self, name, params=(), **kwargs):
+        kwargs.setdefault("execution_profile", self.profile(name))
+        if self.metrics is None:
+            return self.session.execute_async(self.get(name), params, **kwargs)
+        label = f"cql.{name}"
+        metrics = self.metrics
+        start = time.perf_counter()
+        future = self.session.execute_async(self.get(name), params, **kwargs)
+        # Os callbacks rodam nas threads de I/O do driver: só registram a medição
+        future.add_callbacks(
+            lambda rows: metrics.record(label, time.perf_counter() - start, rows=len(rows or ())),
+            lambda exc: metrics.record(label, time.perf_counter() - start, error=exc),
+        )
+        return future
+
+    def _execute(self, label, statement, params, **kwargs):
+        if self.metrics is None:
+            return self.session.execute(statement, params, **kwargs)
+        trace = self.metrics.should_trace()
+        start = time.perf_counter()
+        try:
+            result = self.session.execute(statement, params, trace=trace, **kwargs)
+        except Exception as exc:
+            self.metrics.record(label, time.perf_counter() - start, error=exc)
+            raise
+        self.metrics.record(label, time.perf_counter() - start, rows=len(result.current_rows))
+        if trace:
+            self.metrics.add_trace(label, result.response_future.get_query_trace_ids())
+        return result
+
+    def batch(self, entries, batch_type=BatchType.LOGGED):
+        """Monta um BatchStatement a partir de pares (nome, parâmetros)."""
+        batch = BatchStatement(batch_type=batch_type)
+        for name, params in entries:
+            batch.add(self.get(name), params)
+        return batch
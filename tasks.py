@@ -0,0 +1,98 @@
+"""
+Execução de tarefas em segundo plano para a interface tkinter.
+
+O tkinter não é thread-safe: as tarefas (consultas ao Cassandra, simulações)
+rodam em um pool de threads e os resultados voltam para o loop principal por
+uma fila consumida periodicamente com root.after. Assim a janela continua
+respondendo mesmo quando o banco está lento.
+"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox
+
+DEFAULT_WORKERS = 4
+POLL_INTERVAL_MS = 50
+
+
+class TaskRunner:
+    """
+    Executa funções em threads de trabalho e entrega os resultados no thread do Tk.
+
+    Cada tarefa tem uma chave; enquanto uma tarefa com a mesma chave estiver em
+    andamento, novas submissões são ignoradas (evita cliques duplicados).
+    """
+
+    def __init__(self, root, status_var=None, max_workers=DEFAULT_WORKERS):
+        self.root = root
+        self.status_var = status_var
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="game-manager")
+        self._callbacks = queue.Queue()
+        self._running = {}
+        self.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def is_running(self, key):
+        return key in self._running
+
+    def submit(self, key, fn, *args, on_success=None, on_error=None, busy_text=None):
+        """
+        Agenda `fn(*args)` em segundo plano.
+
+        `on_success(resultado)` e `on_error(exceção)` são chamados no thread do Tk.
+        Retorna False se já houver uma tarefa com a mesma chave em andamento.
+        """
+        if key in self._running:
+            self._set_status(f"Aguarde: {self._running[key]}")
+            return False
+        self._running[key] = busy_text or "Processando..."
+        self._refresh_busy()
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(
+            lambda f: self._callbacks.put((self._finish, (key, f, on_success, on_error)))
+        )
+        return True
+
+    def post(self, callback, *args):
+        """Agenda `callback(*args)` no thread do Tk (seguro para chamar de qualquer thread)."""
+        self._callbacks.put((callback, args))
+
+    def progress(self, text):
+        """Atualiza a barra de status a partir de uma thread de trabalho."""
+        self.post(self._set_status, text)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, key, future, on_success, on_error):
+        self._running.pop(key, None)
+        self._refresh_busy()
+        error = future.exception()
+        if error is not None:
+            if on_error:
+                on_error(error)
+            else:
+                messagebox.showerror("Erro", str(error))
+        elif on_success:
+            on_success(future.result())
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    callback, args = self._callbacks.get_nowait()
+                except queue.Empty:
+                    break
+                callback(*args)
+        finally:
+            self.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _refresh_busy(self):
+        if self._running:
+            self.root.config(cursor="watch")
+            self._set_status(" | ".join(self._running.values()))
+        else:
+            self.root.config(cursor="")
+            self._set_status("Pronto")
+
+    def _set_status(self, text):
+        if self.status_var is not None:
+            self.status_var.set(text)
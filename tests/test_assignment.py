@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+import pytest
+
+import assignment
+
+
+class FakeStatements:
+    """Registro falso: times livres em `free`, partida aceitando times se `waiting`."""
+
+    def __init__(self, free, waiting=True, fail_append=False):
+        self.free = set(free)
+        self.waiting = waiting
+        self.fail_append = fail_append
+        self.match = []
+
+    def get(self, name):
+        return name
+
+    def profile(self, name):
+        return None
+
+    def execute(self, name, params=()):
+        if name == "select_team":
+            return SimpleNamespace(one=lambda: SimpleNamespace(name=f"Time {params[0]}"))
+        if name == "claim_team":
+            applied = params[0] in self.free
+            self.free.discard(params[0])
+        elif name == "release_team":
+            applied = params[0] not in self.free
+            self.free.add(params[0])
+        elif name == "append_match_team_if_waiting":
+            if self.fail_append:
+                raise TimeoutError("timeout")
+            applied = self.waiting
+            if applied:
+                self.match += params[0]
+        return SimpleNamespace(was_applied=applied)
+
+
+@pytest.fixture(autouse=True)
+def sequential_execution(monkeypatch):
+    def execute_concurrent(session, statements_and_params, **kwargs):
+        return [(True, session.execute(name, params)) for name, params in statements_and_params]
+
+    monkeypatch.setattr(assignment, "execute_concurrent", execute_concurrent)
+
+
+def test_assign_team_claims_then_joins():
+    statements = FakeStatements({1})
+    assert assignment.assign_team(statements, "m", 1)
+    assert statements.match == ["Time 1"] and statements.free == set()
+    assert not assignment.assign_team(statements, "m", 1, "Time 1")
+
+
+def test_assign_team_releases_when_match_is_closed():
+    statements = FakeStatements({1}, waiting=False)
+    assert not assignment.assign_team(statements, "m", 1, "Time 1")
+    assert statements.free == {1}
+
+
+def test_assign_team_releases_when_join_fails():
+    statements = FakeStatements({1}, fail_append=True)
+    with pytest.raises(TimeoutError):
+        assignment.assign_team(statements, "m", 1, "Time 1")
+    assert statements.free == {1}
+
+
+def test_assign_teams_joins_only_claimed_teams():
+    statements = FakeStatements({1, 3})
+    teams = [(1, "A"), (2, "B"), (3, "C")]
+    assert assignment.assign_teams(statements, statements, "m", teams) == [1, 3]
+    assert statements.match == ["A", "C"]
+
+
+@pytest.mark.parametrize("waiting, fail_append", [(False, False), (True, True)])
+def test_assign_teams_releases_claimed_teams(waiting, fail_append):
+    statements = FakeStatements({1, 2}, waiting=waiting, fail_append=fail_append)
+    teams = [(1, "A"), (2, "B")]
+    if fail_append:
+        with pytest.raises(TimeoutError):
+            assignment.assign_teams(statements, statements, "m", teams)
+    else:
+        assert assignment.assign_teams(statements, statements, "m", teams) == []
+    assert statements.free == {1, 2}
@@ -0,0 +1,54 @@
+import math
+import random
+
+import pytest
+
+import bracket
+from bracket import draw_order, format_log, simulate_knockout
+
+
+@pytest.mark.parametrize("n", [2, 3, 7, 8, 33])
+def test_ranking_is_a_permutation_and_champion_is_never_eliminated(n):
+    result = simulate_knockout(range(n), seed=1)
+    assert sorted(result.ranking) == list(range(n))
+    assert result.num_rounds == math.ceil(math.log2(n))
+    assert all(result.champion not in losers for losers in result.eliminated)
+    assert sum(len(losers) for losers in result.eliminated) == n - 1
+
+
+def test_ranking_groups_teams_by_elimination_round():
+    result = simulate_knockout(range(20), seed=3)
+    rounds = [result.elimination_round[p] for p in result.ranking]
+    assert rounds == sorted(rounds, reverse=True)
+
+
+def test_same_seed_gives_same_result():
+    first = simulate_knockout(range(50), seed=7)
+    second = simulate_knockout(range(50), seed=7)
+    assert list(first.ranking) == list(second.ranking)
+
+
+def test_needs_two_teams():
+    with pytest.raises(ValueError):
+        simulate_knockout(range(1))
+
+
+def test_format_log_requires_recorded_rounds():
+    result = simulate_knockout(range(4), seed=1)
+    with pytest.raises(ValueError):
+        list(format_log(result, "abcd"))
+    lines = list(format_log(simulate_knockout(range(4), seed=1, record_rounds=True), "abcd"))
+    assert lines[0].startswith("Rodada 1:")
+    assert lines[-5] == "Ranking Final:"
+    assert [line.split(":")[0] for line in lines[-4:]] == ["1º Lugar", "2º Lugar", "3º Lugar", "4º Lugar"]
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_draw_order_is_a_reproducible_permutation(monkeypatch, numpy_available):
+    if not numpy_available:
+        monkeypatch.setattr(bracket, "np", None)
+    elif bracket.np is None:
+        pytest.skip("NumPy não instalado")
+    order = draw_order(100, random.Random(5))
+    assert sorted(order) == list(range(100))
+    assert order == draw_order(100, random.Random(5))
@@ -0,0 +1,56 @@
+from catalog import TournamentCatalog
+
+
+class Loader:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return list(self.rows)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_loads_once_until_ttl_expires():
+    loader, clock = Loader([("1", "Copa"), ("2", "Liga")]), Clock()
+    catalog = TournamentCatalog(loader, ttl=60, clock=clock)
+    assert catalog.names() == ["Copa", "Liga"]
+    assert catalog.id_for("Liga") == "2"
+    assert loader.calls == 1
+    clock.now = 60
+    catalog.names()
+    assert loader.calls == 2
+
+
+def test_id_for_reloads_once_on_miss():
+    loader = Loader([("1", "Copa")])
+    catalog = TournamentCatalog(loader, ttl=None)
+    catalog.refresh()
+    loader.rows.append(("2", "Liga"))
+    assert catalog.id_for("Liga") == "2"
+    assert catalog.id_for("Taça") is None
+    assert loader.calls == 3
+
+
+def test_local_changes_update_without_reload():
+    loader = Loader([("1", "Copa")])
+    catalog = TournamentCatalog(loader, ttl=None)
+    catalog.refresh()
+    catalog.add("2", "Copa")
+    catalog.add("3", "Liga")
+    assert catalog.id_for("Copa") == "1"
+    catalog.remove("1")
+    # Outro torneio com o mesmo nome passa a responder por ele
+    assert catalog.id_for("Copa") == "2"
+    assert catalog.items() == [("2", "Copa"), ("3", "Liga")]
+    catalog.clear()
+    assert catalog.names() == []
+    assert loader.calls == 1
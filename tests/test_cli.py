@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+import pytest
+from cassandra import InvalidRequest, OperationTimedOut
+from cassandra.cluster import NoHostAvailable
+
+from cli import build_parser, cmd_import, database_error_message, main, resolve_tournament
+from migrations import MigrationError
+from repository import InMemoryRepository
+
+
+@pytest.mark.parametrize("exc, prefix", [
+    (NoHostAvailable("Unable to connect to any servers", {"127.0.0.1:9042": OSError("recusada")}),
+     "Erro de conexão: Unable to connect to any servers"),
+    (OperationTimedOut("sem resposta"), "Erro: tempo esgotado"),
+    (InvalidRequest("consulta inválida\nsegunda linha"), "Erro do Cassandra: consulta inválida"),
+    (MigrationError("lock ocupado"), "Erro na migração: lock ocupado"),
+])
+def test_database_errors_become_one_line(exc, prefix):
+    message = database_error_message(exc)
+    assert message.startswith(prefix)
+    assert "\n" not in message
+
+
+def test_other_errors_are_not_handled():
+    assert database_error_message(KeyError("x")) is None
+
+
+def test_invalid_config_returns_2(tmp_path, capsys):
+    path = tmp_path / "cluster.ini"
+    path.write_text("[cassandra]\ncompression = zstd\n", encoding="utf-8")
+    assert main(["--config", str(path), "tournaments"]) == 2
+    assert "compression" in capsys.readouterr().err
+
+
+class FailingRepository(InMemoryRepository):
+    """O driver falha na segunda gravação de times."""
+
+    calls = 0
+
+    def create_teams(self, names, tournament_id):
+        self.calls += 1
+        if self.calls == 2:
+            raise InvalidRequest("falhou")
+        return super().create_teams(names, tournament_id)
+
+
+def test_import_driver_error_keeps_the_resume_hint(tmp_path, capsys):
+    path = tmp_path / "times.csv"
+    path.write_text("tournament,team\nCopa,A\nCopa,B\nCopa,C\n", encoding="utf-8")
+    args = build_parser().parse_args(["import", str(path), "--chunk-size", "2", "--quiet"])
+    assert cmd_import(SimpleNamespace(repo=FailingRepository(), metrics=None), args) == 3
+    assert "repita o comando para retomar do registro 3" in capsys.readouterr().err
+
+
+def test_resolve_tournament_by_id_or_name():
+    repo = InMemoryRepository()
+    t_id = repo.create_tournament("Copa")
+    assert resolve_tournament(repo, t_id) == resolve_tournament(repo, "Copa") == (t_id, "Copa")
+    repo.create_tournament("Copa")
+    with pytest.raises(ValueError, match="informe o id"):
+        resolve_tournament(repo, "Copa")
+    with pytest.raises(ValueError, match="não encontrado"):
+        resolve_tournament(repo, "Liga")
@@ -0,0 +1,51 @@
+import pytest
+from cassandra.cluster import EXEC_PROFILE_DEFAULT
+
+from config import load_config
+
+
+@pytest.fixture(autouse=True)
+def no_default_file(tmp_path, monkeypatch):
+    # Sem ./game_manager.ini: só os padrões, o arquivo do teste e o ambiente
+    monkeypatch.chdir(tmp_path)
+
+
+def test_defaults():
+    config = load_config(environ={})
+    assert config.contact_points == ["127.0.0.1"]
+    assert config.port == 9042
+    assert config.local_dc is None
+    assert config.protocol_version is None
+    assert config.profiles["listing"]["consistency"] == "LOCAL_ONE"
+
+
+def test_precedence_file_then_environment_then_overrides(tmp_path):
+    path = tmp_path / "cluster.ini"
+    path.write_text("[cassandra]\ncontact_points = 10.0.0.1, 10.0.0.2\nlocal_dc = dc1\nconcurrency = 8\n"
+                    "[profile.write]\ntimeout = 60\n", encoding="utf-8")
+    environ = {"GAME_MANAGER_LOCAL_DC": "dc2", "GAME_MANAGER_PROFILE_WRITE_CONSISTENCY": "QUORUM"}
+    config = load_config(str(path), environ=environ, keyspace="teste", contact_points=None)
+    assert config.contact_points == ["10.0.0.1", "10.0.0.2"]
+    assert config.local_dc == "dc2"
+    assert config.concurrency == 8
+    assert config.keyspace == "teste"
+    assert config.profiles["write"] == {"consistency": "QUORUM", "serial_consistency": "LOCAL_SERIAL",
+                                        "timeout": "60"}
+
+
+def test_config_file_from_environment(tmp_path):
+    path = tmp_path / "outro.ini"
+    path.write_text("[cassandra]\nport = 9142\n", encoding="utf-8")
+    assert load_config(environ={"GAME_MANAGER_CONFIG": str(path)}).port == 9142
+
+
+def test_invalid_compression():
+    with pytest.raises(ValueError):
+        load_config(environ={"GAME_MANAGER_COMPRESSION": "zstd"})
+
+
+def test_cluster_options():
+    options = load_config(environ={"GAME_MANAGER_PROTOCOL_VERSION": "4"}).cluster_options()
+    assert options["protocol_version"] == 4
+    assert options["compression"] is True
+    assert set(options["execution_profiles"]) == {EXEC_PROFILE_DEFAULT, "listing", "write"}
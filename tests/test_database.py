@@ -0,0 +1,34 @@
+import cassandra.cluster
+import pytest
+from cassandra.cluster import NoHostAvailable
+
+from config import load_config
+from database import Database
+
+
+class FakeCluster:
+    """Cluster cuja conexão falha; registra o shutdown."""
+
+    instances = []
+
+    def __init__(self, **options):
+        self.closed = False
+        FakeCluster.instances.append(self)
+
+    def connect(self):
+        raise NoHostAvailable("Unable to connect to any servers", {})
+
+    def shutdown(self):
+        self.closed = True
+
+
+def test_failed_connection_shuts_the_cluster_down(monkeypatch):
+    monkeypatch.setattr(cassandra.cluster, "Cluster", FakeCluster)
+    monkeypatch.setattr(FakeCluster, "instances", [])
+    db = Database(load_config(environ={}))
+    for _ in range(2):
+        with pytest.raises(NoHostAvailable):
+            db.repo
+    assert len(FakeCluster.instances) == 2
+    assert all(cluster.closed for cluster in FakeCluster.instances)
+    assert not db.connected and db.cluster is None
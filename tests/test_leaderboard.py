@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+from bracket import simulate_knockout
+from leaderboard import Tally, compact, is_stale, rank, top_teams
+from repository import InMemoryRepository, Standing
+
+
+def standing(team, titles=0, wins=0, tournaments=1, placements=1):
+    return Standing(team, tournaments, titles, wins, wins, placements)
+
+
+def test_rank_orders_by_titles_wins_placement_and_name():
+    standings = [
+        standing("D", titles=0, wins=9),
+        standing("C", titles=1, wins=1, placements=4),
+        standing("B", titles=1, wins=1, placements=2),
+        standing("A", titles=1, wins=1, placements=2),
+        standing("E", titles=2),
+    ]
+    assert [s.team for s in rank(standings)] == ["E", "A", "B", "C", "D"]
+    assert [s.team for s in rank(iter(standings), limit=2)] == ["E", "A"]
+
+
+def test_tally_counts_games_wins_and_placements():
+    tally = Tally()
+    result = simulate_knockout(range(5), seed=1, on_round=tally.add_round)
+    names = "abcde"
+    tally.finish(result.ranking, names)
+    increments = {team: rest for team, *rest in tally.increments()}
+    assert sum(titles for titles, _, _, _ in increments.values()) == 1
+    # 5 times: 4 jogos no total, cada um com dois times e um vencedor
+    assert sum(games for _, games, _, _ in increments.values()) == 8
+    assert sum(wins for _, _, wins, _ in increments.values()) == 4
+    assert sorted(place for _, _, _, place in increments.values()) == [1, 2, 3, 4, 5]
+    champion = names[result.champion]
+    assert increments[champion][0] == 1 and increments[champion][3] == 1
+
+
+def test_top_teams_reads_the_compacted_ranking_without_compacting():
+    repo = InMemoryRepository()
+    repo.update_leaderboard([("A", 1, 2, 2, 1), ("B", 0, 2, 1, 2)])
+    assert top_teams(repo) == ([], None)
+    now = datetime(2026, 1, 1)
+    assert [s.team for s in compact(repo, now=now)] == ["A", "B"]
+    repo.update_leaderboard([("B", 1, 2, 2, 1), ("B", 1, 2, 2, 1)])
+    # Desatualizado ou não, o ranking gravado é devolvido como está
+    ranking, compacted_at = top_teams(repo, limit=1)
+    assert [s.team for s in ranking] == ["A"] and compacted_at == now
+    assert not is_stale(compacted_at, now=now + timedelta(seconds=10))
+    assert is_stale(compacted_at, now=now + timedelta(hours=1))
+    assert is_stale(None)
+    compact(repo, now=now + timedelta(hours=1))
+    assert [s.team for s in top_teams(repo, limit=1)[0]] == ["B"]
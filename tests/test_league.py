@@ -0,0 +1,73 @@
+from itertools import combinations
+
+import pytest
+
+from league import _pair, _pair_greedy, circle_rounds, simulate_round_robin, simulate_swiss
+
+
+@pytest.mark.parametrize("n", [2, 5, 8, 11])
+def test_circle_rounds_play_every_pair_exactly_once(n):
+    games = []
+    byes = []
+    for bye, left, right in circle_rounds(n):
+        playing = left + right
+        assert len(set(playing)) == len(playing)
+        assert bye not in playing
+        games += [frozenset(game) for game in zip(left, right)]
+        byes.append(bye)
+    assert sorted(games, key=sorted) == sorted(map(frozenset, combinations(range(n), 2)), key=sorted)
+    if n & 1:
+        assert sorted(byes) == list(range(n))
+    else:
+        assert byes == [None] * (n - 1)
+
+
+def test_round_robin_points_add_up():
+    result = simulate_round_robin(range(6), seed=2, legs=2)
+    assert sum(result.points) == 6 * 5
+    assert result.num_rounds == 10
+    assert sorted(result.ranking) == list(range(6))
+
+
+@pytest.mark.parametrize("n, rounds", [(8, 3), (9, 4)])
+def test_swiss_plays_every_team_each_round(n, rounds):
+    byes = []
+
+    def on_round(record):
+        playing = record.left + record.right
+        assert len(set(playing)) == len(playing) == n - (n & 1)
+        byes.append(record.bye)
+
+    result = simulate_swiss(range(n), rounds=rounds, seed=1, on_round=on_round)
+    assert result.num_rounds == rounds
+    assert sum(result.points) == rounds * (n // 2) + (rounds if n & 1 else 0)
+    if n & 1:
+        assert len(set(byes)) == rounds
+    assert sorted(result.ranking) == list(range(n))
+
+
+def test_pair_backtracks_instead_of_rematching():
+    # 0-3 e 2-3 já se enfrentaram: 0-1 deixaria 2-3 como revanche
+    opponents = [{3}, set(), {3}, {0, 2}]
+    assert _pair_greedy([0, 1, 2, 3], opponents) == ([0, 2], [1, 3])
+    left, right = _pair([0, 1, 2, 3], opponents)
+    assert {frozenset(game) for game in zip(left, right)} == {frozenset((0, 2)), frozenset((1, 3))}
+
+
+def test_pair_falls_back_to_rematch():
+    opponents = [{1}, {0}]
+    assert _pair([0, 1], opponents) == ([0], [1])
+
+
+@pytest.mark.parametrize("n, rounds", [(8, 3), (9, 4), (16, 5)])
+def test_swiss_has_no_rematches(n, rounds):
+    for seed in range(200):
+        seen = set()
+
+        def on_round(record):
+            for game in zip(record.left, record.right):
+                game = frozenset(game)
+                assert game not in seen
+                seen.add(game)
+
+        simulate_swiss(range(n), rounds=rounds, seed=seed, on_round=on_round)
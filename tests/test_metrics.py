@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from metrics import BUCKETS, InstrumentedRepository, LatencyHistogram, Metrics, phase
+from repository import InMemoryRepository
+
+
+def test_histogram_counts_and_percentiles():
+    histogram = LatencyHistogram()
+    for seconds in [0.001] * 90 + [0.1] * 9 + [3.0]:
+        histogram.add(seconds)
+    assert histogram.count == 100
+    assert histogram.min == 0.001 and histogram.max == 3.0
+    assert histogram.percentile(0.5) == 0.001
+    assert histogram.percentile(0.95) == 0.1
+    # O último bucket acima do valor é 5 s, mas o percentil nunca passa do máximo
+    assert histogram.percentile(1.0) == 3.0
+    data = histogram.to_dict()
+    assert data["mean"] == pytest.approx((0.09 + 0.9 + 3.0) / 100)
+    assert sum(data["buckets"].values()) == 100
+
+
+def test_histogram_overflow_bucket():
+    histogram = LatencyHistogram()
+    histogram.add(BUCKETS[-1] * 10)
+    assert histogram.counts[-1] == 1
+    assert histogram.percentile(0.99) == BUCKETS[-1] * 10
+    assert LatencyHistogram().percentile(0.5) == 0.0
+
+
+def test_timer_records_errors_and_timeouts():
+    metrics = Metrics(timeout_errors=(TimeoutError,))
+    with phase(metrics, "ok"):
+        pass
+    with pytest.raises(TimeoutError):
+        with metrics.timer("lento"):
+            raise TimeoutError
+    stats = metrics.snapshot()["stats"]
+    assert stats["ok"]["count"] == 1 and stats["ok"]["errors"] == 0
+    assert stats["lento"]["errors"] == 1 and stats["lento"]["timeouts"] == 1
+    with phase(None, "sem métricas"):
+        pass
+
+
+def test_instrumented_repository_counts_calls_and_rows(tmp_path):
+    metrics = Metrics()
+    repo = InstrumentedRepository(InMemoryRepository(), metrics)
+    tournament_id = repo.create_tournament("Copa")
+    repo.create_teams(["A", "B", "C"], tournament_id)
+    assert len(repo.list_teams_by_tournament(tournament_id)) == 3
+    repo.list_matches_page()
+    stats = metrics.snapshot()["stats"]
+    assert stats["repo.create_tournament"]["count"] == 1
+    assert stats["repo.list_teams_by_tournament"]["rows"] == 3
+    assert "repo.list_matches_page" in stats
+
+    path = tmp_path / "metrics.json"
+    metrics.dump(str(path))
+    assert json.loads(path.read_text(encoding="utf-8"))["stats"].keys() == stats.keys()
@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+import pytest
+
+import cassandra_repository
+from migrations import MigrationError, _apply
+from schema import Migration
+
+
+class FakeSession:
+    """Registra as consultas; o lock pode ser tomado por outro cliente após `lock_lost_after` renovações."""
+
+    def __init__(self, lock_lost_after=None):
+        self.executed = []
+        self.lock_lost_after = lock_lost_after
+        self.renewals = 0
+
+    def execute(self, query, params=None):
+        self.executed.append(query.split()[0])
+        applied = True
+        if query.startswith("UPDATE"):
+            self.renewals += 1
+            applied = self.lock_lost_after is None or self.renewals <= self.lock_lost_after
+        return SimpleNamespace(was_applied=applied)
+
+
+def migration(*steps):
+    return Migration(7, "teste", list(steps))
+
+
+def test_lock_is_renewed_before_each_step_and_page():
+    session = FakeSession()
+    calls = []
+
+    def backfill(step_session, renew):
+        calls.append(step_session)
+        for _ in range(2):  # duas páginas
+            renew()
+
+    _apply(session, "ks", migration("CREATE TABLE a", backfill, "CREATE TABLE b"), "dono")
+    assert session.executed == ["UPDATE", "CREATE", "UPDATE", "UPDATE", "UPDATE", "UPDATE", "CREATE", "INSERT"]
+    assert calls == [session]
+
+
+def test_lost_lock_stops_the_migration():
+    session = FakeSession(lock_lost_after=1)
+    with pytest.raises(MigrationError, match="Lock de migração perdido"):
+        _apply(session, "ks", migration("CREATE TABLE a", "CREATE TABLE b"), "dono")
+    assert session.executed == ["UPDATE", "CREATE", "UPDATE"]
+
+
+def test_failed_step_is_reported_with_the_migration():
+    def broken(session, renew):
+        raise RuntimeError("sem espaço")
+
+    with pytest.raises(MigrationError, match="Migração 7 \\(teste\\) falhou: sem espaço"):
+        _apply(FakeSession(), "ks", migration(broken), "dono")
+
+
+class FakePages:
+    """Resultado paginado do driver: uma lista de linhas por página."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.current_rows = self.pages.pop(0)
+
+    @property
+    def has_more_pages(self):
+        return bool(self.pages)
+
+    def fetch_next_page(self):
+        self.current_rows = self.pages.pop(0)
+
+
+def test_backfill_writes_and_renews_page_by_page(monkeypatch):
+    def team(team_id, tournament_id):
+        return SimpleNamespace(id=team_id, name=team_id.upper(), tournament_id=tournament_id)
+
+    pages = [[team("a", "t1"), team("b", None)], [team("c", "t2")]]
+    statements = SimpleNamespace(execute=lambda name: FakePages(pages))
+    written = []
+    monkeypatch.setattr(cassandra_repository, "write_concurrent",
+                        lambda session, statements, name, params, concurrency: written.append(params) or [])
+    renewals = []
+    repo = cassandra_repository.CassandraRepository(None, statements)
+    assert repo.backfill_teams_by_tournament(on_page=lambda: renewals.append(len(written))) == 2
+    assert written == [[("t1", "a", "A")], [("t2", "c", "C")]]
+    assert renewals == [1, 2]
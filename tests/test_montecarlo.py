@@ -0,0 +1,54 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from montecarlo import simulate_knockout_replicates  # noqa: E402
+
+
+@pytest.mark.parametrize("num_teams", [2, 5, 8])
+def test_every_replicate_fills_every_position(num_teams):
+    result = simulate_knockout_replicates(num_teams, 500, seed=1)
+    assert result.position_counts.shape == (num_teams, num_teams)
+    # Cada réplica coloca um time em cada posição e cada time em uma posição
+    assert (result.position_counts.sum(axis=0) == 500).all()
+    assert (result.position_counts.sum(axis=1) == 500).all()
+    assert result.championship_odds.sum() == pytest.approx(1.0)
+
+
+def test_chunks_do_not_change_the_totals():
+    result = simulate_knockout_replicates(6, 1000, seed=2, chunk_elements=60)
+    assert result.position_counts.sum() == 6 * 1000
+
+
+def test_positions_limits_tracked_places():
+    result = simulate_knockout_replicates(16, 300, seed=3, positions=4)
+    assert result.position_counts.shape == (16, 4)
+    assert (result.position_counts.sum(axis=0) == 300).all()
+    assert result.expected_position().shape == (16,)
+
+
+def test_equal_teams_have_equal_odds():
+    odds = simulate_knockout_replicates(4, 20000, seed=4).championship_odds
+    assert odds == pytest.approx([0.25] * 4, abs=0.02)
+
+
+def test_same_seed_gives_same_counts():
+    first = simulate_knockout_replicates(7, 200, seed=5).position_counts
+    assert (first == simulate_knockout_replicates(7, 200, seed=5).position_counts).all()
+
+
+@pytest.mark.parametrize("num_teams, replicates", [(1, 10), (4, 0)])
+def test_rejects_invalid_sizes(num_teams, replicates):
+    with pytest.raises(ValueError):
+        simulate_knockout_replicates(num_teams, replicates)
+
+
+def test_ratings_decide_the_games():
+    odds = simulate_knockout_replicates(4, 20000, seed=6, ratings=[1900, 1500, 1500, 1100]).championship_odds
+    assert odds.argmax() == 0 and odds.argmin() == 3
+    assert odds[1] == pytest.approx(odds[2], abs=0.02)
+
+
+def test_rejects_ratings_of_the_wrong_size():
+    with pytest.raises(ValueError):
+        simulate_knockout_replicates(4, 10, ratings=[1500] * 3)
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from names import NameGenerator
+
+
+def small_generator():
+    # 2 adjetivos x 1 substantivo x 1 padrão, números até 2: 6 nomes
+    return NameGenerator(adjectives=["Neo", "Nova"], nouns=["Knights"], patterns=["{adj} {noun}"], max_number=2)
+
+
+def test_sample_returns_distinct_names_outside_existing():
+    generator = NameGenerator()
+    existing = set(generator.sample(500, rng=random.Random(1)))
+    names = generator.sample(1000, existing, rng=random.Random(2))
+    assert len(names) == len(set(names)) == 1000
+    assert not existing & set(names)
+
+
+def test_sample_can_fill_the_whole_space():
+    generator = small_generator()
+    names = generator.sample(len(generator), rng=random.Random(3))
+    assert sorted(names) == sorted(generator.name_at(i) for i in range(len(generator)))
+
+
+def test_sample_numbers_only_when_needed():
+    names = NameGenerator().sample(100, rng=random.Random(4))
+    assert not any(name[-1].isdigit() for name in names)
+
+
+def test_sample_rejects_more_names_than_available():
+    generator = small_generator()
+    with pytest.raises(ValueError):
+        generator.sample(2, existing={generator.name_at(i) for i in range(5)})
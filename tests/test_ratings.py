@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+import ratings
+from ratings import DEFAULT_RATING, RatingTable, elo_update, simulate_rated_knockout, win_probability
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def vectorized(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(ratings, "np", None)
+    elif ratings.np is None:
+        pytest.skip("NumPy não instalado")
+    return request.param
+
+
+def test_win_probability_and_update_are_symmetric():
+    assert win_probability(1500, 1500) == pytest.approx(0.5)
+    assert win_probability(1900, 1500) == pytest.approx(1 / 1.1)
+    assert win_probability(1700, 1500) + win_probability(1500, 1700) == pytest.approx(1.0)
+    winner, loser = elo_update(1500, 1500)
+    assert winner - 1500 == pytest.approx(16.0) and 1500 - loser == pytest.approx(16.0)
+
+
+def test_win_probabilities_match_the_formula(vectorized):
+    table = RatingTable([1500, 1700, 1300, 1500])
+    probabilities = table.win_probabilities([0, 2], [1, 3])
+    assert list(probabilities) == pytest.approx([win_probability(1500, 1700), win_probability(1300, 1500)])
+
+
+def test_apply_round_matches_elo_update(vectorized):
+    table = RatingTable([1500, 1700, 1300, 1500])
+    changed = table.apply_round([0, 2], [1, 3], bytes([1, 0]))
+    assert sorted(changed) == [0, 1, 2, 3]
+    winner, loser = elo_update(1500, 1700)
+    assert (table[0], table[1]) == pytest.approx((winner, loser))
+    winner, loser = elo_update(1500, 1300)
+    assert (table[3], table[2]) == pytest.approx((winner, loser))
+
+
+def test_decide_follows_the_ratings(vectorized):
+    table = RatingTable([2300, 1500] * 500)
+    left_wins = table.decide(list(range(0, 1000, 2)), list(range(1, 1000, 2)), random.Random(1))
+    assert len(left_wins) == 500 and set(left_wins) <= {0, 1}
+    assert sum(left_wins) > 480
+
+
+def test_rated_knockout_keeps_the_rating_total(vectorized):
+    result, table = simulate_rated_knockout(range(9), [DEFAULT_RATING] * 9, seed=2)
+    assert sorted(result.ranking) == list(range(9))
+    assert sum(table[p] for p in range(9)) == pytest.approx(9 * DEFAULT_RATING)
+    assert table[result.champion] > DEFAULT_RATING
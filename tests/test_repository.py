@@ -0,0 +1,87 @@
+import pytest
+
+import services
+from repository import FINISHED, WAITING, InMemoryRepository, Repository
+
+
+@pytest.fixture
+def repo():
+    return InMemoryRepository()
+
+
+def test_repository_is_abstract():
+    with pytest.raises(TypeError):
+        Repository()
+
+
+def test_match_pages_cover_all_rows(repo):
+    for number in range(7):
+        repo.create_match(f"Partida {number}", "")
+    rows, paging_state = repo.list_matches_page(page_size=3)
+    pages = [rows]
+    while paging_state is not None:
+        rows, paging_state = repo.list_matches_page(paging_state=paging_state, page_size=3)
+        pages.append(rows)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert repo.list_matches_page(FINISHED)[0] == []
+
+
+def test_team_pages_cover_all_rows(repo):
+    tournament_id = repo.create_tournament("Copa")
+    repo.create_teams([f"Time {number}" for number in range(7)], tournament_id)
+    rows, paging_state = repo.list_teams_page(page_size=3)
+    pages = [rows]
+    while paging_state is not None:
+        rows, paging_state = repo.list_teams_page(paging_state, page_size=3)
+        pages.append(rows)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert {row[2] for page in pages for row in page} == {tournament_id}
+
+
+def test_assign_team_only_once_and_only_while_waiting(repo):
+    tournament_id = repo.create_tournament("Copa")
+    (first, _), (second, _) = repo.create_teams(["A", "B"], tournament_id)[0]
+    match_id = repo.create_match("Final", "", tournament_id)
+    assert repo.assign_team(match_id, first)
+    assert not repo.assign_team(match_id, first)
+    repo.finish_match(match_id, ["A"])
+    assert not repo.assign_team(match_id, second)
+    assert repo.get_match(match_id).status == FINISHED
+
+
+def test_assign_teams_skips_teams_already_in_a_match(repo):
+    tournament_id = repo.create_tournament("Copa")
+    teams = repo.create_teams(["A", "B", "C"], tournament_id)[0]
+    busy = repo.create_match("Outra", "", tournament_id)
+    assert repo.assign_team(busy, teams[0][0])
+    match_id = repo.create_match("Final", "", tournament_id)
+    assert repo.assign_teams(match_id, teams) == [team_id for team_id, _ in teams[1:]]
+    assert repo.get_match(match_id).teams == ["B", "C"]
+
+
+def test_claim_tournament_simulation_applies_once(repo):
+    tournament_id = repo.create_tournament("Copa")
+    assert repo.claim_tournament_simulation(tournament_id)
+    assert not repo.claim_tournament_simulation(tournament_id)
+    assert not repo.claim_tournament_simulation("inexistente")
+
+
+def test_delete_tournament_cascades(repo):
+    kept = repo.create_tournament("Liga")
+    repo.create_teams(["Fica"], kept)
+    tournament_id = repo.create_tournament("Copa")
+    repo.create_teams([f"Time {number}" for number in range(5)], tournament_id)
+    services.run_tournament_simulation(repo, tournament_id, "Copa")
+    (match_id, *_), = repo.list_matches()
+    assert repo.list_round_games(match_id, 1)[0]
+    assert repo.list_placements(match_id)[0]
+
+    repo.delete_tournament(tournament_id)
+    assert repo.list_tournaments() == [(kept, "Liga")]
+    assert [name for _, name in repo.list_teams()] == ["Fica"]
+    assert repo.list_teams_by_tournament(tournament_id) == []
+    assert repo.get_ratings(tournament_id) == {}
+    assert repo.get_match(match_id) is None
+    assert repo.list_round_games(match_id, 1)[0] == []
+    assert repo.list_placements(match_id)[0] == []
+    assert repo.list_matches_page(WAITING)[0] == []
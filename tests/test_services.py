@@ -0,0 +1,139 @@
+import random
+
+import pytest
+
+import services
+from names import NameGenerator
+from ratings import DEFAULT_RATING
+from repository import FINISHED, InMemoryRepository
+
+
+def tournament_with_teams(count, name="Copa"):
+    repo = InMemoryRepository()
+    tournament_id = repo.create_tournament(name)
+    repo.create_teams([f"Time {number}" for number in range(count)], tournament_id)
+    return repo, tournament_id
+
+
+@pytest.mark.parametrize("tournament_format", list(services.TOURNAMENT_FORMATS))
+def test_run_tournament_simulation_records_everything(tournament_format):
+    repo, tournament_id = tournament_with_teams(7)
+    ranking_lines, log_text = services.run_tournament_simulation(repo, tournament_id, "Copa",
+                                                                 tournament_format=tournament_format)
+    assert len(ranking_lines) == 7
+    assert ranking_lines[0].startswith("1º Lugar: ")
+    assert "Rodada 1" in log_text
+    assert repo.get_tournament(tournament_id).simulated
+    (match_id, *_), = repo.list_matches()
+    assert repo.get_match(match_id).status == FINISHED
+    ratings = repo.get_ratings(tournament_id)
+    assert len(ratings) == 7 and set(ratings.values()) != {DEFAULT_RATING}
+    standings = repo.scan_leaderboard()
+    assert len(standings) == 7
+    assert sum(standing.titles for standing in standings) == 1
+
+
+def test_match_keeps_only_the_top_of_the_ranking(monkeypatch):
+    monkeypatch.setattr(services, "MATCH_RANKING_TOP", 3)
+    monkeypatch.setattr(services, "LOG_GAMES_PER_ROUND", 2)
+    repo, tournament_id = tournament_with_teams(8)
+    ranking_lines, log_text = services.run_tournament_simulation(repo, tournament_id, "Copa")
+    (match_id, *_), = repo.list_matches()
+    assert repo.get_match(match_id).teams == ranking_lines[:3]
+    placements, paging_state = repo.list_placements(match_id, page_size=5)
+    placements += repo.list_placements(match_id, paging_state, page_size=5)[0]
+    assert [f"{place}º Lugar: {team}" for place, team in placements] == ranking_lines
+    # Só a final (1 jogo) e a semifinal (2 jogos) cabem no limite do log
+    assert log_text.count("Jogo: ") == 3
+
+
+def test_simulation_runs_only_once():
+    repo, tournament_id = tournament_with_teams(4)
+    services.run_tournament_simulation(repo, tournament_id, "Copa")
+    with pytest.raises(ValueError, match="já foi simulado"):
+        services.run_tournament_simulation(repo, tournament_id, "Copa")
+    assert all(standing.tournaments == 1 for standing in repo.scan_leaderboard())
+
+
+def test_failed_simulation_releases_the_flag():
+    repo, tournament_id = tournament_with_teams(1)
+    with pytest.raises(ValueError, match="pelo menos 2 times"):
+        services.run_tournament_simulation(repo, tournament_id, "Copa")
+    assert not repo.get_tournament(tournament_id).simulated
+    assert repo.list_matches() == []
+
+
+def test_release_simulation_recovers_an_interrupted_claim():
+    repo, tournament_id = tournament_with_teams(4)
+    # Processo encerrado no meio: flag marcada e a partida da simulação ainda 'Aguardando'
+    assert repo.claim_tournament_simulation(tournament_id)
+    repo.create_match("Simulação do Torneio Copa", services.SIMULATION_DESCRIPTION, tournament_id)
+    kept = repo.create_match("Amistoso", "", tournament_id)
+    assert services.release_simulation(repo, tournament_id) == 1
+    assert not repo.get_tournament(tournament_id).simulated
+    assert [row[0] for row in repo.list_matches()] == [kept]
+    services.run_tournament_simulation(repo, tournament_id, "Copa")
+    with pytest.raises(ValueError, match="simulação terminada"):
+        services.release_simulation(repo, tournament_id)
+    assert repo.get_tournament(tournament_id).simulated
+
+
+def test_simulation_of_missing_tournament():
+    repo = InMemoryRepository()
+    with pytest.raises(ValueError, match="não encontrado"):
+        services.run_tournament_simulation(repo, "inexistente", "Copa")
+
+
+def test_unknown_format_is_rejected():
+    repo, tournament_id = tournament_with_teams(4)
+    with pytest.raises(ValueError, match="Formato desconhecido"):
+        services.run_tournament_simulation(repo, tournament_id, "Copa", tournament_format="copa-do-mundo")
+    assert not repo.get_tournament(tournament_id).simulated
+
+
+def test_simulate_tournament_streams_log():
+    repo, tournament_id = tournament_with_teams(5)
+    lines = []
+    ranking, log_text = services.simulate_tournament(repo, tournament_id, on_log=lines.extend)
+    assert log_text is None
+    assert [place for place, _ in ranking] == [f"{i}º Lugar" for i in range(1, 6)]
+    assert lines[0].startswith("Rodada 1")
+
+
+def test_record_match_result_updates_both_ratings():
+    repo, tournament_id = tournament_with_teams(2)
+    (winner, _), (loser, _) = repo.list_teams_by_tournament(tournament_id)
+    services.record_match_result(repo, tournament_id, winner, loser)
+    ratings = repo.get_ratings(tournament_id)
+    assert ratings[winner] > DEFAULT_RATING > ratings[loser]
+
+
+def test_generate_random_teams_avoids_existing_names():
+    repo, tournament_id = tournament_with_teams(0)
+    generator = NameGenerator(adjectives=["Neo", "Nova"], nouns=["Knights"], patterns=["{adj} {noun}"], max_number=2)
+    random.seed(1)
+    services.generate_random_teams(repo, generator, 4, tournament_id)
+    services.generate_random_teams(repo, generator, 2, tournament_id)
+    names = [name for _, name in repo.list_teams_by_tournament(tournament_id)]
+    assert len(names) == len(set(names)) == 6
+    with pytest.raises(ValueError):
+        services.generate_random_teams(repo, generator, 1, tournament_id)
+
+
+def test_estimate_tournament_odds_covers_every_team():
+    pytest.importorskip("numpy")
+    repo, tournament_id = tournament_with_teams(6)
+    names, result = services.estimate_tournament_odds(repo, tournament_id, 500, positions=3)
+    assert names == [name for _, name in repo.list_teams_by_tournament(tournament_id)]
+    assert result.position_counts.shape == (6, 3)
+    assert result.championship_odds.sum() == pytest.approx(1.0)
+
+
+def test_estimate_tournament_odds_follows_ratings():
+    pytest.importorskip("numpy")
+    repo, tournament_id = tournament_with_teams(4)
+    favorite = repo.list_teams_by_tournament(tournament_id)[0][0]
+    repo.save_ratings(tournament_id, [(favorite, DEFAULT_RATING + 600)])
+    names, result = services.estimate_tournament_odds(repo, tournament_id, 2000, positions=4)
+    assert result.championship_odds.argmax() == 0
+    assert result.championship_odds[0] > 0.8
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+from cassandra.cluster import EXEC_PROFILE_DEFAULT
+
+from statements import LISTING, LISTING_QUERIES, QUERIES, WRITE, WRITE_PREFIXES, StatementRegistry, profile_for
+
+
+def test_profile_for():
+    assert profile_for("select_tournaments") == LISTING
+    assert profile_for("insert_team") == WRITE
+    assert profile_for("claim_team") == WRITE
+    assert profile_for("select_team") == EXEC_PROFILE_DEFAULT
+
+
+def test_every_query_gets_a_consistent_profile():
+    assert LISTING_QUERIES <= QUERIES.keys()
+    for name, cql in QUERIES.items():
+        profile = profile_for(name)
+        if name.startswith(WRITE_PREFIXES):
+            assert profile == WRITE and not cql.startswith("SELECT"), name
+        elif profile == LISTING:
+            assert cql.startswith("SELECT"), name
+
+
+class FakeCluster:
+    def __init__(self):
+        self.listeners = []
+
+    def register_listener(self, listener):
+        self.listeners.append(listener)
+
+
+def test_one_reprepare_listener_per_cluster():
+    cluster = FakeCluster()
+    registries = [StatementRegistry(SimpleNamespace(cluster=cluster)) for _ in range(3)]
+    listener, = cluster.listeners
+    for registry in registries:
+        registry._prepared["select_team"] = object()
+    listener.on_up(None)
+    assert all(not registry._prepared for registry in registries)
@@ -0,0 +1,81 @@
+import io
+import json
+
+import pytest
+
+from repository import InMemoryRepository
+from transfer import TransferError, export_table, import_file, import_records, load_checkpoint
+
+
+class FlakyRepository(InMemoryRepository):
+    """Falha na `fail_at`-ésima chamada de create_teams, depois de gravar os times."""
+
+    def __init__(self, fail_at):
+        super().__init__()
+        self.fail_at = fail_at
+        self.calls = 0
+
+    def create_teams(self, names, tournament_id):
+        result = super().create_teams(names, tournament_id)
+        self.calls += 1
+        if self.calls == self.fail_at:
+            raise OSError("conexão perdida")
+        return result
+
+
+def records():
+    for number in range(10):
+        yield {"tournament": "Copa" if number % 2 else "Liga", "team": f"Time {number}"}
+
+
+def team_names(repo):
+    return sorted(name for _, name in repo.list_teams())
+
+
+def test_import_creates_tournaments_and_teams():
+    repo = InMemoryRepository()
+    result = import_records(repo, records(), chunk_size=4)
+    assert result == (10, 2, 10)
+    assert sorted(name for _, name in repo.list_tournaments()) == ["Copa", "Liga"]
+    assert team_names(repo) == sorted(f"Time {number}" for number in range(10))
+
+
+def test_import_resumes_from_checkpoint_without_duplicates(tmp_path):
+    checkpoint = str(tmp_path / "import.checkpoint")
+    # 3ª chamada = primeiro torneio do 2º bloco (o 1º bloco fez duas): o bloco fica pela metade
+    repo = FlakyRepository(fail_at=3)
+    with pytest.raises(OSError):
+        import_records(repo, records(), checkpoint_path=checkpoint, chunk_size=4)
+    assert load_checkpoint(checkpoint)["offset"] == 4
+
+    result = import_records(repo, records(), checkpoint_path=checkpoint, chunk_size=4)
+    assert result.records == 10
+    assert result.tournaments == 0
+    assert team_names(repo) == sorted(f"Time {number}" for number in range(10))
+
+
+def test_import_rejects_record_without_tournament():
+    with pytest.raises(TransferError) as error:
+        import_records(InMemoryRepository(), iter([{"team": "Sem torneio"}]))
+    assert error.value.offset == 0
+
+
+def test_import_file_removes_checkpoint(tmp_path):
+    path = tmp_path / "times.csv"
+    path.write_text("tournament,team\nCopa,Leões\nCopa,Tigres\nLiga,\n", encoding="utf-8")
+    repo = InMemoryRepository()
+    assert import_file(repo, str(path), chunk_size=2) == (3, 2, 2)
+    assert not (tmp_path / "times.csv.checkpoint").exists()
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_export_table_writes_every_page(fmt):
+    repo = InMemoryRepository()
+    import_records(repo, records())
+    out = io.StringIO()
+    assert export_table(repo, "teams", out, fmt, page_size=3) == 10
+    lines = out.getvalue().splitlines()
+    if fmt == "csv":
+        assert lines[0] == "id,name,tournament_id" and len(lines) == 11
+    else:
+        assert {json.loads(line)["name"] for line in lines} == {f"Time {number}" for number in range(10)}
@@ -0,0 +1,207 @@
+"""
+Importação e exportação em fluxo (CSV ou JSONL) sobre um Repository.
+
+Importação: cada registro tem "tournament" (nome do torneio, criado se ainda
+não existir) e, opcionalmente, "team" (nome de um time desse torneio):
+
+    tournament,team                  {"tournament": "Copa", "team": "Leões"}
+    Copa,Leões                       {"tournament": "Copa"}
+
+O arquivo é lido em blocos de `chunk_size` registros; os times de cada bloco
+são gravados por Repository.create_teams (concorrência limitada pelo
+repositório). Os torneios de cada bloco são procurados pelo nome
+(Repository.find_tournaments), sem listar todos os torneios. Depois de cada
+bloco, um checkpoint JSON guarda quantos registros já foram gravados;
+repetir a importação com o mesmo checkpoint retoma do bloco interrompido,
+pulando os times desse bloco que já tinham sido gravados (os torneios
+criados antes da falha são encontrados pelo nome). Ao terminar, o
+checkpoint é apagado.
+
+Exportação: tournaments, teams ou game_matches é lida página a página
+(paging_state do driver, `page_size` linhas por requisição) e cada linha é
+escrita assim que chega. Importação e exportação usam memória constante,
+qualquer que seja o tamanho do arquivo ou da tabela.
+"""
+import csv
+import json
+import os
+from collections import namedtuple
+from itertools import islice
+
+from metrics import phase
+
+FORMATS = ("csv", "jsonl")
+CHUNK_SIZE = 1000
+EXPORT_PAGE_SIZE = 1000
+
+# Tabela exportável -> (colunas, método paginado do Repository)
+TABLES = {
+    "tournaments": (("id", "name", "simulated"), "list_tournaments_page"),
+    "teams": (("id", "name", "tournament_id"), "list_teams_page"),
+    "matches": (("id", "title", "description", "status", "teams"), "list_matches_page"),
+}
+
+ImportResult = namedtuple("ImportResult", "records tournaments teams")
+
+
+class TransferError(Exception):
+    """A importação parou; `offset` é o registro a partir do qual ela será retomada."""
+
+    def __init__(self, message, offset):
+        super().__init__(message)
+        self.offset = offset
+
+
+def detect_format(path, fmt=None):
+    """Formato informado ou deduzido da extensão (.csv ou .jsonl/.ndjson)."""
+    if fmt:
+        return fmt
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Formato não reconhecido para {path}: informe {' ou '.join(FORMATS)}")
+
+
+def read_records(f, fmt):
+    """Itera os registros (dicionários) de um arquivo aberto em modo texto, sem carregá-lo inteiro."""
+    if fmt == "csv":
+        yield from csv.DictReader(f)
+        return
+    for number, line in enumerate(f, start=1):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                raise ValueError(f"Linha {number} não é JSON válido: {exc}") from exc
+
+
+def _chunks(records, size):
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def load_checkpoint(path):
+    """Estado salvo por save_checkpoint, ou None se não houver checkpoint."""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, state):
+    """Grava o estado via arquivo temporário (um checkpoint nunca fica pela metade)."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def import_records(repo, records, checkpoint_path=None, chunk_size=CHUNK_SIZE, on_progress=None, metrics=None,
+                   source=None):
+    """
+    Grava os registros (veja o topo do módulo) a partir do checkpoint, se houver.
+    `on_progress(registros)` é chamado após cada bloco; com `metrics`, cada bloco é
+    medido como "import.chunk". Retorna ImportResult: registros gravados no total (inclusive
+    por execuções anteriores) e torneios e times criados nesta execução.
+    """
+    state = load_checkpoint(checkpoint_path) or {"source": source, "offset": 0}
+    if source and state.get("source") not in (None, source):
+        raise ValueError(f"O checkpoint {checkpoint_path} é de outro arquivo: {state['source']}")
+    offset = state["offset"]
+    resumed = offset > 0
+    created_tournaments = created_teams = 0
+
+    for chunk in _chunks(islice(records, offset, None), chunk_size):
+        with phase(metrics, "import.chunk"):
+            by_tournament = {}
+            for number, record in enumerate(chunk, start=offset + 1):
+                name = (record.get("tournament") or "").strip()
+                if not name:
+                    raise TransferError(f"Registro {number} sem 'tournament'", offset)
+                teams = by_tournament.setdefault(name, [])
+                team = (record.get("team") or "").strip()
+                if team:
+                    teams.append(team)
+
+            # Só os torneios deste bloco: a memória não cresce com o arquivo nem com o banco
+            for name, teams in by_tournament.items():
+                found = repo.find_tournaments(name)
+                if found:
+                    t_id = found[0]
+                else:
+                    t_id = repo.create_tournament(name)
+                    created_tournaments += 1
+                if resumed:
+                    # Bloco interrompido: parte dos times pode já ter sido gravada
+                    existing = {team for _, team in repo.list_teams_by_tournament(t_id)}
+                    teams = [team for team in teams if team not in existing]
+                if teams:
+                    created, failures = repo.create_teams(teams, t_id)
+                    created_teams += len(created)
+                    if failures:
+                        raise TransferError(f"{len(failures)} times de '{name}' falharam "
+                                            f"(ex.: {failures[0][1]})", offset)
+
+        offset += len(chunk)
+        resumed = False
+        state["offset"] = offset
+        if checkpoint_path:
+            save_checkpoint(checkpoint_path, state)
+        if on_progress is not None:
+            on_progress(offset)
+    return ImportResult(offset, created_tournaments, created_teams)
+
+
+def import_file(repo, path, fmt=None, checkpoint_path=None, chunk_size=CHUNK_SIZE, on_progress=None, metrics=None):
+    """
+    Importa o arquivo `path`, com checkpoint em `checkpoint_path` (padrão: <path>.checkpoint).
+    Em caso de falha, chamar de novo com os mesmos argumentos retoma a importação.
+    """
+    fmt = detect_format(path, fmt)
+    checkpoint_path = checkpoint_path or f"{path}.checkpoint"
+    with open(path, newline="", encoding="utf-8") as f:
+        result = import_records(repo, read_records(f, fmt), checkpoint_path, chunk_size, on_progress, metrics,
+                                source=os.path.abspath(path))
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return result
+
+
+def iter_table(repo, table, page_size=EXPORT_PAGE_SIZE):
+    """Itera as linhas de `table` (veja TABLES), buscando uma página por vez."""
+    fetch_page = getattr(repo, TABLES[table][1])
+    paging_state = None
+    while True:
+        rows, paging_state = fetch_page(paging_state=paging_state, page_size=page_size)
+        yield from rows
+        if paging_state is None:
+            return
+
+
+def export_table(repo, table, out, fmt, page_size=EXPORT_PAGE_SIZE, on_progress=None):
+    """
+    Escreve as linhas de `table` em `out` (arquivo texto) em CSV (com cabeçalho) ou JSONL.
+    Listas (times das partidas) vão como JSON dentro da célula CSV. Retorna quantas linhas escreveu.
+    """
+    columns = TABLES[table][0]
+    writer = csv.writer(out) if fmt == "csv" else None
+    if writer:
+        writer.writerow(columns)
+    count = 0
+    for count, row in enumerate(iter_table(repo, table, page_size), start=1):
+        if writer:
+            writer.writerow([json.dumps(value, ensure_ascii=False) if isinstance(value, list) else value
+                             for value in row])
+        else:
+            out.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n")
+        if count % page_size == 0:
+            out.flush()
+            if on_progress is not None:
+                on_progress(count)
+    return count